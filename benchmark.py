@@ -0,0 +1,947 @@
+"""
+Module untuk Benchmark Performa
+Berisi fungsi-fungsi untuk mengukur kecepatan operasi pengolahan citra
+"""
+
+import os
+import sys
+import time
+import subprocess
+import resource
+import tempfile
+import multiprocessing
+import numpy as np
+
+from statistik_citra import hitung_statistik_satu_lintasan
+from operasi_pengurangan import pengurangan_dengan_konstanta
+
+def ukur_waktu(fungsi, ulangan=5):
+    """
+    Mengukur waktu eksekusi terbaik dari beberapa ulangan
+
+    Args:
+        fungsi: Callable tanpa argumen yang akan diukur
+        ulangan: Jumlah ulangan (default: 5)
+
+    Returns:
+        float: Waktu terbaik dalam milidetik
+    """
+    terbaik = float('inf')
+    for _ in range(ulangan):
+        mulai = time.perf_counter()
+        fungsi()
+        terbaik = min(terbaik, time.perf_counter() - mulai)
+    return terbaik * 1000
+
+def buat_gambar_acak(tinggi, lebar, seed=0):
+    """
+    Membuat gambar grayscale acak untuk benchmark
+
+    Returns:
+        np.ndarray: Gambar uint8 acak
+    """
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, size=(tinggi, lebar), dtype=np.uint8)
+
+def benchmark_statistik(tinggi=4000, lebar=6000, ulangan=5):
+    """
+    Membandingkan reduksi NumPy terpisah dengan mesin statistik satu lintasan
+
+    Args:
+        tinggi, lebar: Ukuran gambar uji (default: 24 MP)
+        ulangan: Jumlah ulangan per metode
+
+    Returns:
+        dict: Waktu (ms) masing-masing metode dan speedup
+    """
+    print(f"⏱️ Benchmark statistik {lebar}x{tinggi}...")
+    image = buat_gambar_acak(tinggi, lebar)
+
+    def statistik_numpy():
+        return {
+            'Mean': float(np.mean(image)),
+            'Std Dev': float(np.std(image)),
+            'Max': int(np.max(image)),
+            'Min': int(np.min(image)),
+            'Pixels >0': int(np.count_nonzero(image)),
+            'Histogram': np.bincount(image.ravel(), minlength=256)
+        }
+
+    def statistik_satu_lintasan():
+        return hitung_statistik_satu_lintasan(image)
+
+    waktu_numpy = ukur_waktu(statistik_numpy, ulangan)
+    waktu_cepat = ukur_waktu(statistik_satu_lintasan, ulangan)
+
+    hasil = {
+        'NumPy (ms)': waktu_numpy,
+        'Satu Lintasan (ms)': waktu_cepat,
+        'Speedup': waktu_numpy / waktu_cepat
+    }
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.2f}")
+    return hasil
+
+def cek_motion_bertingkat(tinggi=480, lebar=640, ukuran=((150, 200), (12, 9), (3, 3))):
+    """
+    Regresi: coarse-to-fine harus identik dengan cleanup resolusi penuh
+
+    Objek kecil dan sedang digeser 3-6 pixel pada posisi yang tidak sejajar
+    dengan grid sel; setiap mask DetektorMotionBertingkat (4x dan 8x) harus
+    sama persis dengan deteksi_motion_dengan_cleanup.
+
+    Args:
+        tinggi, lebar: Ukuran frame
+        ukuran: Daftar (tinggi, lebar) objek yang diuji
+
+    Returns:
+        int: Jumlah kasus yang diperiksa
+    """
+    from motion_detection import deteksi_motion_dengan_cleanup, DetektorMotionBertingkat
+
+    print(f"🔍 Cek motion coarse-to-fine vs resolusi penuh {lebar}x{tinggi}...")
+    detektor = {skala: DetektorMotionBertingkat(skala=skala) for skala in (4, 8)}
+    jumlah = 0
+    for tinggi_objek, lebar_objek in ukuran:
+        for geser in range(3, 7):
+            for offset in range(0, 8, 3):
+                frame1 = np.full((tinggi, lebar), 60, dtype=np.uint8)
+                frame2 = frame1.copy()
+                x, y = 101 + offset, 83 + offset
+                frame1[y:y + tinggi_objek, x:x + lebar_objek] = 200
+                frame2[y + geser // 2:y + geser // 2 + tinggi_objek,
+                       x + geser:x + geser + lebar_objek] = 200
+                referensi, _ = deteksi_motion_dengan_cleanup(frame1, frame2)
+                for skala, d in detektor.items():
+                    mask, _ = d.deteksi(frame1, frame2)
+                    assert np.array_equal(mask, referensi), \
+                        f"{skala}x beda: objek {lebar_objek}x{tinggi_objek}, geser {geser}, offset {offset}"
+                    jumlah += 1
+    print(f"  ✅ {jumlah} kasus identik")
+    return jumlah
+
+def _rss_puncak_mb():
+    """Peak RSS proses saat ini dalam MB (VmHWM, fallback ru_maxrss)"""
+    try:
+        with open("/proc/self/status") as f:
+            for baris in f:
+                if baris.startswith("VmHWM:"):
+                    return int(baris.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def _reset_rss_puncak():
+    """Reset peak RSS ke RSS saat ini (Linux), diabaikan jika tidak didukung"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+def _ukur_rss_pengurangan(tinggi, lebar, mode, pakai_buffer):
+    """
+    Dijalankan di proses baru: mengukur kenaikan peak RSS satu panggilan
+    pengurangan_dengan_konstanta setelah input dan buffer disiapkan
+    """
+    img1 = buat_gambar_acak(tinggi, lebar, seed=1)
+    img2 = buat_gambar_acak(tinggi, lebar, seed=2)
+    out = np.empty_like(img1) if pakai_buffer else None
+    kerja = np.empty_like(img1) if pakai_buffer else None
+
+    # Panggilan pemanasan menyentuh semua halaman buffer dan memuat kernel OpenCV
+    pengurangan_dengan_konstanta(img1, img2, 100, out=out, mode=mode,
+                                 buffer_kerja=kerja)
+
+    _reset_rss_puncak()
+    sebelum = _rss_puncak_mb()
+    pengurangan_dengan_konstanta(img1, img2, 100, out=out, mode=mode,
+                                 buffer_kerja=kerja)
+    return _rss_puncak_mb() - sebelum
+
+def profil_memori_pengurangan(tinggi=4000, lebar=6000, batas_mb=None):
+    """
+    Mengukur peak RSS per panggilan (A - B) + K untuk setiap mode
+
+    Setiap konfigurasi dijalankan di proses terpisah agar peak RSS
+    tidak terbawa dari pengukuran sebelumnya.
+
+    Args:
+        tinggi, lebar: Ukuran gambar uji (default: 24 MP)
+        batas_mb: Batas kenaikan RSS untuk mode saturasi + buffer (opsional);
+            jika diberikan, AssertionError saat batas terlampaui
+
+    Returns:
+        dict: Kenaikan peak RSS (MB) per konfigurasi
+    """
+    print(f"🧠 Profil memori (A - B) + K {lebar}x{tinggi}...")
+    konfigurasi = [
+        ('int16', False),
+        ('int16', True),
+        ('saturasi', False),
+        ('saturasi', True)
+    ]
+
+    ctx = multiprocessing.get_context("spawn")
+    hasil = {}
+    with ctx.Pool(1, maxtasksperchild=1) as pool:
+        for mode, pakai_buffer in konfigurasi:
+            nama = f"{mode} ({'out=' if pakai_buffer else 'alokasi'})"
+            hasil[nama] = pool.apply(_ukur_rss_pengurangan,
+                                     (tinggi, lebar, mode, pakai_buffer))
+            print(f"  {nama}: +{hasil[nama]:.1f} MB")
+
+    if batas_mb is not None:
+        tanpa_alokasi = hasil['saturasi (out=)']
+        status = '✅' if tanpa_alokasi <= batas_mb else '❌'
+        print(f"  {status} Saturasi + out=: {tanpa_alokasi:.1f} MB (batas {batas_mb} MB)")
+        assert tanpa_alokasi <= batas_mb, \
+            f"Saturasi + out= menaikkan RSS {tanpa_alokasi:.1f} MB (batas {batas_mb} MB)"
+    return hasil
+
+def benchmark_renderer(ulangan=5):
+    """
+    Membandingkan renderer lembar perbandingan matplotlib dan OpenCV
+
+    Args:
+        ulangan: Jumlah ulangan per renderer
+
+    Returns:
+        dict: Waktu (ms) per lembar masing-masing renderer dan speedup
+    """
+    from input_output import simpan_perbandingan_dengan_stats
+
+    print("⏱️ Benchmark renderer lembar perbandingan...")
+    img1 = buat_gambar_acak(300, 300, seed=1)
+    img2 = buat_gambar_acak(300, 300, seed=2)
+    stats_asli = {'Mean': 127.5, 'Std Dev': 73.9, 'Max': 255, 'Min': 0, 'Alpha (α)': '0.5'}
+    stats_hasil = {'Pixel Putih': 45000, 'Persentase Putih': 50.0, 'Logika': 'Irisan (∩)'}
+
+    hasil = {}
+    with tempfile.TemporaryDirectory() as folder:
+        for renderer in ("matplotlib", "opencv"):
+            hasil[f'{renderer} (ms)'] = ukur_waktu(
+                lambda: simpan_perbandingan_dengan_stats(
+                    img1, img2, f"bench_{renderer}", "Gambar A", "Hasil",
+                    stats_asli, stats_hasil, folder, renderer=renderer),
+                ulangan)
+            assert os.path.exists(os.path.join(folder, f"bench_{renderer}_comparison.jpg"))
+
+    hasil['Speedup'] = hasil['matplotlib (ms)'] / hasil['opencv (ms)']
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.2f}")
+    return hasil
+
+def benchmark_mask_bit(tinggi=4000, lebar=6000, ulangan=5):
+    """
+    Membandingkan operasi boolean pada mask uint8 0/255 dan MaskBit
+
+    Setiap metode menghitung AND, OR, XOR, NOT beserta jumlah pixel putih.
+
+    Args:
+        tinggi, lebar: Ukuran gambar uji (default: 24 MP)
+        ulangan: Jumlah ulangan per metode
+
+    Returns:
+        dict: Waktu (ms), ukuran mask (MB) dan speedup
+    """
+    import cv2
+    from operasi_boolean import binarisasi_gambar, MaskBit
+
+    print(f"⏱️ Benchmark mask bit {lebar}x{tinggi}...")
+    biner1, _ = binarisasi_gambar(buat_gambar_acak(tinggi, lebar, seed=1))
+    biner2, _ = binarisasi_gambar(buat_gambar_acak(tinggi, lebar, seed=2))
+    mask1, mask2 = MaskBit.dari_biner(biner1), MaskBit.dari_biner(biner2)
+
+    def boolean_uint8():
+        return [cv2.countNonZero(m) for m in (
+            cv2.bitwise_and(biner1, biner2), cv2.bitwise_or(biner1, biner2),
+            cv2.bitwise_xor(biner1, biner2), cv2.bitwise_not(biner1))]
+
+    def boolean_bit():
+        return [m.jumlah_putih() for m in (mask1 & mask2, mask1 | mask2, mask1 ^ mask2, ~mask1)]
+
+    assert boolean_uint8() == boolean_bit()
+
+    hasil = {
+        'uint8 (ms)': ukur_waktu(boolean_uint8, ulangan),
+        'MaskBit (ms)': ukur_waktu(boolean_bit, ulangan),
+        'uint8 (MB)': biner1.nbytes / 2**20,
+        'MaskBit (MB)': mask1.nbytes / 2**20
+    }
+    hasil['Speedup'] = hasil['uint8 (ms)'] / hasil['MaskBit (ms)']
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.2f}")
+    return hasil
+
+def benchmark_boolean_gabungan(tinggi=4000, lebar=6000, ulangan=5):
+    """
+    Membandingkan empat operasi boolean terpisah dengan satu lintasan berblok
+    
+    Args:
+        tinggi, lebar: Ukuran gambar uji (default: 24 MP)
+        ulangan: Jumlah ulangan per metode
+    
+    Returns:
+        dict: Waktu (ms) masing-masing metode dan speedup
+    """
+    from operasi_boolean import (operasi_and, operasi_or, operasi_xor, operasi_not,
+                                 operasi_boolean_lengkap)
+    
+    print(f"⏱️ Benchmark boolean satu lintasan {lebar}x{tinggi}...")
+    img1 = buat_gambar_acak(tinggi, lebar, seed=1)
+    img2 = buat_gambar_acak(tinggi, lebar, seed=2)
+    
+    def boolean_terpisah():
+        # Tanpa cache: setiap operasi membinarisasi inputnya sendiri
+        return [operasi_and(img1, img2)[1], operasi_or(img1, img2)[1],
+                operasi_xor(img1, img2)[1], operasi_not(img1)[1]]
+    
+    def boolean_gabungan():
+        return [stats for _, stats in operasi_boolean_lengkap(img1, img2).values()]
+    
+    assert boolean_terpisah() == boolean_gabungan()
+    
+    hasil = {
+        'Terpisah (ms)': ukur_waktu(boolean_terpisah, ulangan),
+        'Satu Lintasan (ms)': ukur_waktu(boolean_gabungan, ulangan)
+    }
+    hasil['Speedup'] = hasil['Terpisah (ms)'] / hasil['Satu Lintasan (ms)']
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.2f}")
+    return hasil
+
+def benchmark_sweep_threshold(tinggi=2160, lebar=3840, ulangan=3):
+    """
+    Membandingkan kalibrasi threshold motion 0-255 per panggilan dengan sweep histogram
+    
+    Args:
+        tinggi, lebar: Ukuran frame uji (default: 4K)
+        ulangan: Jumlah ulangan per metode
+    
+    Returns:
+        dict: Waktu (ms) masing-masing metode dan speedup
+    """
+    from motion_detection import deteksi_motion_sederhana, sweep_threshold_motion
+    
+    print(f"⏱️ Benchmark sweep threshold motion {lebar}x{tinggi}...")
+    frame1 = buat_gambar_acak(tinggi, lebar, seed=1)
+    frame2 = buat_gambar_acak(tinggi, lebar, seed=2)
+    
+    def per_threshold():
+        return {t: deteksi_motion_sederhana(frame1, frame2, t)[1] for t in range(256)}
+    
+    def sweep():
+        return sweep_threshold_motion(frame1, frame2)[1]
+    
+    assert per_threshold() == sweep()
+    
+    hasil = {
+        'Per Threshold (ms)': ukur_waktu(per_threshold, ulangan),
+        'Sweep (ms)': ukur_waktu(sweep, ulangan)
+    }
+    hasil['Speedup'] = hasil['Per Threshold (ms)'] / hasil['Sweep (ms)']
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.2f}")
+    return hasil
+
+def benchmark_binarisasi_adaptif(tinggi=4000, lebar=6000, ukuran_blok=(11, 51, 201), ulangan=3):
+    """
+    Mengukur binarisasi adaptif integral image untuk beberapa ukuran jendela
+    
+    Args:
+        tinggi, lebar: Ukuran gambar uji (default: 24 MP)
+        ukuran_blok: Ukuran jendela yang diuji
+        ulangan: Jumlah ulangan per ukuran
+    
+    Returns:
+        dict: Waktu (ms) per ukuran jendela
+    """
+    import cv2
+    from operasi_boolean import binarisasi_adaptif
+    
+    print(f"⏱️ Benchmark binarisasi adaptif {lebar}x{tinggi}...")
+    image = buat_gambar_acak(tinggi, lebar)
+    
+    hasil = {}
+    for k in ukuran_blok:
+        binary, _ = binarisasi_adaptif(image, k)
+        referensi = cv2.adaptiveThreshold(image, 255, cv2.ADAPTIVE_THRESH_MEAN_C,
+                                          cv2.THRESH_BINARY, k, 5)
+        assert np.array_equal(binary, referensi)
+        hasil[f'{k}x{k} (ms)'] = ukur_waktu(lambda: binarisasi_adaptif(image, k), ulangan)
+    
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.2f}")
+    return hasil
+
+def _tulis_video_sintetis(path, tinggi, lebar, jumlah_frame, fps=60):
+    """Menulis video MJPG dengan lingkaran bergerak di atas latar noise"""
+    import cv2
+    latar = buat_gambar_acak(tinggi, lebar, seed=3)
+    latar = cv2.GaussianBlur(latar, (0, 0), 3)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), fps, (lebar, tinggi))
+    for i in range(jumlah_frame):
+        frame = latar.copy()
+        cv2.circle(frame, (100 + 10 * i, tinggi // 2), tinggi // 10, 255, -1)
+        writer.write(cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR))
+    writer.release()
+
+def benchmark_stream_motion(tinggi=1080, lebar=1920, jumlah_frame=120, target_fps=60):
+    """
+    Mengukur throughput stream_motion pada video sintetis dengan OpenCV satu thread
+    
+    Args:
+        tinggi, lebar: Ukuran frame (default: 1080p)
+        jumlah_frame: Jumlah frame video uji
+        target_fps: Target frame per detik
+    
+    Returns:
+        dict: FPS end-to-end (decode + motion) dan FPS komputasi motion saja
+    """
+    import cv2
+    from motion_detection import stream_motion, _baca_sumber
+    
+    print(f"⏱️ Benchmark stream motion {lebar}x{tinggi}, {jumlah_frame} frame...")
+    jumlah_thread = cv2.getNumThreads()
+    cv2.setNumThreads(1)
+    try:
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "stream.avi")
+            _tulis_video_sintetis(path, tinggi, lebar, jumlah_frame)
+            
+            # Decode saja (batas bawah waktu end-to-end)
+            mulai = time.perf_counter()
+            for _ in _baca_sumber(path):
+                pass
+            waktu_dekode = time.perf_counter() - mulai
+            
+            mulai = time.perf_counter()
+            jumlah = sum(1 for _ in stream_motion(path))
+            waktu_stream = time.perf_counter() - mulai
+        
+        # Komputasi motion saja pada frame di memori
+        frames = [buat_gambar_acak(tinggi, lebar, seed=i) for i in range(2)]
+        kernel = np.ones((3,3), np.uint8)
+        diff, closed, cleaned = (np.empty_like(frames[0]) for _ in range(3))
+        def motion_satu_frame():
+            cv2.absdiff(frames[0], frames[1], dst=diff)
+            cv2.threshold(diff, 30, 255, cv2.THRESH_BINARY, dst=diff)
+            cv2.morphologyEx(diff, cv2.MORPH_CLOSE, kernel, dst=closed)
+            cv2.morphologyEx(closed, cv2.MORPH_OPEN, kernel, dst=cleaned)
+            cv2.countNonZero(cleaned)
+        waktu_motion = ukur_waktu(motion_satu_frame, 10)
+    finally:
+        cv2.setNumThreads(jumlah_thread)
+    
+    hasil = {
+        'Decode FPS': jumlah_frame / waktu_dekode,
+        'Stream FPS': jumlah / waktu_stream,
+        'Motion FPS': 1000 / waktu_motion
+    }
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.1f}")
+    status = '✅' if hasil['Motion FPS'] >= target_fps else '❌'
+    print(f"  {status} Komputasi motion {hasil['Motion FPS']:.1f} FPS (target {target_fps})")
+    return hasil
+
+def _urutan_motion_sintetis(tinggi, lebar, jumlah_frame, std_noise=10, seed=0):
+    """
+    Urutan frame dengan latar statis + noise per frame dan satu objek yang
+    masuk pada frame 10 lalu bergerak lambat (1 pixel/frame), beserta mask
+    ground truth objek
+    """
+    import cv2
+    rng = np.random.default_rng(seed)
+    latar = cv2.GaussianBlur(buat_gambar_acak(tinggi, lebar, seed), (0, 0), 5).astype(np.float32)
+    ukuran = tinggi // 4
+    frames, kebenaran = [], []
+    for i in range(jumlah_frame):
+        frame = latar + rng.normal(0, std_noise, latar.shape).astype(np.float32)
+        gt = np.zeros((tinggi, lebar), dtype=bool)
+        if i >= 10:
+            x = lebar // 8 + i
+            gt[tinggi // 2 - ukuran // 2:tinggi // 2 + ukuran // 2, x:x + ukuran] = True
+        frame[gt] += 80
+        frames.append(np.clip(frame, 0, 255).astype(np.uint8))
+        kebenaran.append(gt)
+    return frames, kebenaran
+
+def benchmark_model_latar(tinggi=480, lebar=640, jumlah_frame=120, pemanasan=30):
+    """
+    Membandingkan frame differencing dengan model latar belakang
+    (running average dan Gaussian) dari sisi throughput dan akurasi
+    
+    Args:
+        tinggi, lebar: Ukuran frame uji
+        jumlah_frame: Jumlah frame urutan sintetis
+        pemanasan: Frame awal yang tidak dihitung pada metrik akurasi
+    
+    Returns:
+        dict: Per metode: FPS, false positive rate (%) dan recall (%)
+    """
+    from motion_detection import (deteksi_motion_sederhana, deteksi_motion_dengan_cleanup,
+                                  ModelLatarBelakang)
+    
+    print(f"⏱️ Benchmark model latar belakang {lebar}x{tinggi}, {jumlah_frame} frame...")
+    frames, kebenaran = _urutan_motion_sintetis(tinggi, lebar, jumlah_frame)
+    
+    def pasangan(fungsi):
+        sebelumnya = [None]
+        def proses(frame):
+            if sebelumnya[0] is None:
+                sebelumnya[0] = frame
+                return np.zeros_like(frame)
+            mask, _ = fungsi(sebelumnya[0], frame)
+            sebelumnya[0] = frame
+            return mask
+        return proses
+    
+    metode = {
+        'Differencing': lambda: pasangan(deteksi_motion_sederhana),
+        'Differencing + Cleanup': lambda: pasangan(deteksi_motion_dengan_cleanup),
+        'Running Average': lambda: (lambda m: lambda f: m.perbarui(f)[0])(
+            ModelLatarBelakang('rata_rata')),
+        'Gaussian': lambda: (lambda m: lambda f: m.perbarui(f)[0])(
+            ModelLatarBelakang('gaussian'))
+    }
+    
+    hasil = {}
+    for nama, buat in metode.items():
+        proses = buat()
+        fp = tp = negatif = positif = 0
+        for i, frame in enumerate(frames):
+            mask = proses(frame)
+            if i >= pemanasan:
+                terdeteksi = mask > 0
+                gt = kebenaran[i]
+                fp += int(np.count_nonzero(terdeteksi & ~gt))
+                tp += int(np.count_nonzero(terdeteksi & gt))
+                negatif += int(gt.size - np.count_nonzero(gt))
+                positif += int(np.count_nonzero(gt))
+        
+        # Waktu throughput murni (tanpa metrik) diukur ulang
+        proses = buat()
+        mulai = time.perf_counter()
+        for frame in frames:
+            proses(frame)
+        fps = len(frames) / (time.perf_counter() - mulai)
+        
+        hasil[nama] = {
+            'FPS': fps,
+            'False Positive %': fp / negatif * 100,
+            'Recall %': tp / positif * 100
+        }
+        print(f"  {nama}: {fps:.0f} FPS, FP {hasil[nama]['False Positive %']:.3f}%, "
+              f"recall {hasil[nama]['Recall %']:.1f}%")
+    return hasil
+
+def benchmark_region_motion(tinggi=1080, lebar=1920, kepadatan=0.03, ulangan=5):
+    """
+    Membandingkan analisis area findContours + contourArea dengan connected components
+    
+    Args:
+        tinggi, lebar: Ukuran mask uji (default: 1080p)
+        kepadatan: Peluang pixel menjadi pusat blob (adegan padat)
+        ulangan: Jumlah ulangan per mode
+    
+    Returns:
+        dict: Waktu (ms) per mode, jumlah region dan speedup
+    """
+    import cv2
+    from motion_detection import analisis_motion_area
+    
+    print(f"⏱️ Benchmark analisis region motion {lebar}x{tinggi}...")
+    rng = np.random.default_rng(0)
+    mask = ((rng.random((tinggi, lebar)) < kepadatan) * 255).astype(np.uint8)
+    mask = cv2.dilate(mask, np.ones((3, 3), np.uint8))
+    
+    hasil = {
+        'Kontur (ms)': ukur_waktu(lambda: analisis_motion_area(mask, mode='kontur'), ulangan),
+        'Komponen (ms)': ukur_waktu(lambda: analisis_motion_area(mask), ulangan),
+        'Region': analisis_motion_area(mask)['Motion Areas']
+    }
+    hasil['Speedup'] = hasil['Kontur (ms)'] / hasil['Komponen (ms)']
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.2f}")
+    return hasil
+
+def benchmark_motion_bertingkat(tinggi=1080, lebar=1920, jumlah_objek=4, ulangan=20):
+    """
+    Membandingkan motion cleanup resolusi penuh dengan coarse-to-fine 4x/8x
+    
+    Adegan statis bertekstur dengan noise sensor dan beberapa objek kecil
+    yang bergerak (feed pengawasan tipikal), plus timestamp yang diabaikan.
+    
+    Args:
+        tinggi, lebar: Ukuran frame (default: 1080p)
+        jumlah_objek: Jumlah objek bergerak
+        ulangan: Jumlah ulangan per mode
+    
+    Returns:
+        dict: Waktu (ms) per mode, speedup dan pixel yang berbeda
+    """
+    import cv2
+    from motion_detection import (deteksi_motion_dengan_cleanup, DetektorMotionBertingkat,
+                                  buat_mask_abaikan)
+    
+    print(f"⏱️ Benchmark motion coarse-to-fine {lebar}x{tinggi}...")
+    rng = np.random.default_rng(0)
+    latar = cv2.GaussianBlur(rng.integers(0, 256, (tinggi, lebar), dtype=np.uint8), (0, 0), 3)
+    latar = cv2.normalize(latar, None, 0, 255, cv2.NORM_MINMAX)
+    frame1 = cv2.add(latar, rng.integers(0, 6, latar.shape, dtype=np.uint8))
+    frame2 = cv2.add(latar, rng.integers(0, 6, latar.shape, dtype=np.uint8))
+    for x, y in rng.integers(0, [lebar - 60, tinggi - 60], (jumlah_objek, 2)):
+        cv2.rectangle(frame1, (x, y), (x + 30, y + 30), 250, -1)
+        cv2.rectangle(frame2, (x + 6, y + 4), (x + 36, y + 34), 250, -1)
+    cv2.putText(frame2, '12:00:01', (lebar - 300, 50), cv2.FONT_HERSHEY_SIMPLEX, 1.2, 255, 2)
+    abaikan = buat_mask_abaikan(latar.shape, [(lebar - 320, 10, 310, 60)])
+    
+    referensi, _ = deteksi_motion_dengan_cleanup(frame1, frame2, abaikan=abaikan)
+    hasil = {'Penuh (ms)': ukur_waktu(lambda: deteksi_motion_dengan_cleanup(frame1, frame2),
+                                      ulangan)}
+    for skala in (4, 8):
+        detektor = DetektorMotionBertingkat(skala=skala, abaikan=abaikan)
+        mask, stats = detektor.deteksi(frame1, frame2)
+        hasil[f'{skala}x (ms)'] = ukur_waktu(lambda: detektor.deteksi(frame1, frame2), ulangan)
+        hasil[f'{skala}x Speedup'] = hasil['Penuh (ms)'] / hasil[f'{skala}x (ms)']
+        hasil[f'{skala}x Processed %'] = stats['Processed %']
+        hasil[f'{skala}x Pixel Beda'] = int(np.count_nonzero(mask != referensi))
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.2f}")
+    return hasil
+
+def benchmark_backend_blending(tinggi=2160, lebar=3840, alpha=0.3, ulangan=5):
+    """
+    Membandingkan backend blending_citra: float64, fixed-point dan cv2.addWeighted
+    
+    Args:
+        tinggi, lebar: Ukuran citra (default: 4K)
+        alpha: Faktor blending
+        ulangan: Jumlah ulangan per backend
+    
+    Returns:
+        dict: Waktu (ms), speedup terhadap float64 dan Mean Error per backend
+    """
+    from operasi_blending import OperasiBlending, BACKEND_BLENDING
+    
+    print(f"⏱️ Benchmark backend blending {lebar}x{tinggi} (α={alpha})...")
+    rng = np.random.default_rng(0)
+    img1 = rng.integers(0, 256, (tinggi, lebar), dtype=np.uint8)
+    img2 = rng.integers(0, 256, (tinggi, lebar), dtype=np.uint8)
+    blending = OperasiBlending()
+    
+    hasil = {}
+    for backend in BACKEND_BLENDING:
+        hasil[f'{backend} (ms)'] = ukur_waktu(
+            lambda: blending.blending_citra(img1, img2, alpha, backend), ulangan)
+        result = blending.blending_citra(img1, img2, alpha, backend)
+        _, stats = blending.hitung_statistik_blending(img1, img2, result, alpha, backend)
+        hasil[f'{backend} Mean Error'] = float(stats['Mean Error'])
+    for backend in BACKEND_BLENDING[1:]:
+        hasil[f'{backend} Speedup'] = hasil['float64 (ms)'] / hasil[f'{backend} (ms)']
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.4f}" if 'Error' in key else f"  {key}: {value:.2f}")
+    return hasil
+
+def benchmark_komposit_layer(jumlah_layer=20, tinggi=2160, lebar=3840, ulangan=3):
+    """
+    Mengukur komposit N layer (mode dan mask alpha campuran) ke kanvas 4K
+    
+    Args:
+        jumlah_layer: Jumlah layer (default: 20)
+        tinggi, lebar: Ukuran kanvas
+        ulangan: Jumlah ulangan
+    
+    Returns:
+        dict: Waktu (ms) 1 thread dan multi-thread, throughput dan memori kerja per pita
+    """
+    from operasi_blending import (OperasiBlending, buat_layer, MODE_BLENDING,
+                                  PIXEL_PER_TILE_BLENDING)
+    
+    print(f"⏱️ Benchmark komposit {jumlah_layer} layer {lebar}x{tinggi}...")
+    rng = np.random.default_rng(0)
+    kanvas = rng.integers(0, 256, (tinggi, lebar), dtype=np.uint8)
+    layers = []
+    for i in range(jumlah_layer):
+        h, w = tinggi // 2, lebar // 2
+        image = rng.integers(0, 256, (h, w), dtype=np.uint8)
+        alpha = rng.integers(0, 256, (h, w), dtype=np.uint8) if i % 2 else None
+        posisi = rng.integers(-w // 2, lebar - w // 2), rng.integers(-h // 2, tinggi - h // 2)
+        layers.append(buat_layer(image, alpha, MODE_BLENDING[i % len(MODE_BLENDING)],
+                                 posisi, opacity=0.8))
+    
+    blending = OperasiBlending()
+    out = np.empty_like(kanvas)
+    hasil = {
+        '1 Thread (ms)': ukur_waktu(lambda: blending.komposit_layer(kanvas, layers, workers=1,
+                                                                    out=out), ulangan),
+        'Multi-thread (ms)': ukur_waktu(lambda: blending.komposit_layer(kanvas, layers, out=out),
+                                        ulangan),
+    }
+    piksel_layer = sum(layer['image'].size for layer in layers)
+    hasil['Layer Mpx/s'] = piksel_layer / 1e6 / (min(hasil.values()) / 1000)
+    hasil['Akumulator per Pita (KB)'] = PIXEL_PER_TILE_BLENDING * 4 / 1024
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.2f}")
+    return hasil
+
+def benchmark_blending_piramida(tinggi=2160, lebar=3840, level=5, ulangan=3):
+    """
+    Mengukur blending piramida Laplacian (cache dingin/hangat) terhadap blending biasa
+    
+    Args:
+        tinggi, lebar: Ukuran citra (default: 4K)
+        level: Jumlah tingkat piramida
+        ulangan: Jumlah ulangan
+    
+    Returns:
+        dict: Waktu (ms) per skenario dan rasio terhadap blending_citra float64
+    """
+    from operasi_blending import OperasiBlending, bersihkan_cache_piramida
+    
+    print(f"⏱️ Benchmark blending piramida {lebar}x{tinggi} ({level} level)...")
+    rng = np.random.default_rng(0)
+    img1 = rng.integers(0, 256, (tinggi, lebar), dtype=np.uint8)
+    img2 = rng.integers(0, 256, (tinggi, lebar), dtype=np.uint8)
+    # Mask sambungan panorama: A di kiri, B di kanan
+    masks = [np.zeros((tinggi, lebar), dtype=np.uint8) for _ in range(ulangan + 1)]
+    for i, mask in enumerate(masks):
+        mask[:, :lebar // 2 + i] = 255
+    
+    blending = OperasiBlending()
+    
+    def dingin():
+        bersihkan_cache_piramida()
+        blending.blending_piramida(img1, img2, masks[0], level=level)
+    
+    mask_baru = iter(masks[1:])
+    hasil = {
+        'Plain float64 (ms)': ukur_waktu(lambda: blending.blending_citra(img1, img2, 0.5), ulangan),
+        'Cache Dingin (ms)': ukur_waktu(dingin, ulangan),
+        'Mask Baru (ms)': ukur_waktu(lambda: blending.blending_piramida(
+            img1, img2, next(mask_baru), level=level), ulangan),
+        'Cache Hangat (ms)': ukur_waktu(lambda: blending.blending_piramida(
+            img1, img2, masks[0], level=level), ulangan),
+        'Alpha Skalar (ms)': ukur_waktu(lambda: blending.blending_piramida(
+            img1, img2, alpha=0.3, level=level), ulangan),
+    }
+    hasil['Rasio Hangat/Plain'] = hasil['Cache Hangat (ms)'] / hasil['Plain float64 (ms)']
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.2f}")
+    return hasil
+
+def benchmark_cross_fade(tinggi=1080, lebar=1920, jumlah_frame=120):
+    """
+    Membandingkan cross-fade dengan blending_citra per frame dan sweep_blending
+    
+    Args:
+        tinggi, lebar: Ukuran citra (default: 1080p)
+        jumlah_frame: Jumlah frame cross-fade
+    
+    Returns:
+        dict: Waktu per frame (ms), speedup dan selisih maksimum per presisi
+    """
+    from operasi_blending import OperasiBlending
+    
+    print(f"⏱️ Benchmark cross-fade {jumlah_frame} frame {lebar}x{tinggi}...")
+    rng = np.random.default_rng(0)
+    img1 = rng.integers(0, 256, (tinggi, lebar), dtype=np.uint8)
+    img2 = rng.integers(0, 256, (tinggi, lebar), dtype=np.uint8)
+    blending = OperasiBlending()
+    alphas = np.linspace(1.0, 0.0, jumlah_frame).tolist()
+    
+    referensi = {}
+    awal = time.perf_counter()
+    for i, alpha in enumerate(alphas):
+        frame = blending.blending_citra(img1, img2, alpha)
+        if i % 10 == 0:
+            referensi[i] = frame
+    hasil = {'float64 (ms/frame)': (time.perf_counter() - awal) * 1000 / jumlah_frame}
+    
+    for presisi in ('float32', 'fixed'):
+        selisih = 0
+        awal = time.perf_counter()
+        for i, (_, frame) in enumerate(blending.cross_fade(img1, img2, jumlah_frame, presisi)):
+            if i in referensi:
+                # Verifikasi tidak ikut diukur
+                jeda = time.perf_counter()
+                selisih = max(selisih, int(np.abs(frame.astype(np.int16) - referensi[i]).max()))
+                awal += time.perf_counter() - jeda
+        waktu = (time.perf_counter() - awal) * 1000 / jumlah_frame
+        hasil[f'{presisi} (ms/frame)'] = waktu
+        hasil[f'{presisi} Speedup'] = hasil['float64 (ms/frame)'] / waktu
+        hasil[f'{presisi} Selisih Maks'] = selisih
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.2f}")
+    return hasil
+
+def benchmark_cache_resize(tinggi=1080, lebar=1920, ulangan=20):
+    """
+    Mengukur blending ke overlay tetap dan motion ke frame referensi beda ukuran
+    
+    Referensi berukuran 4K sedangkan frame 1080p, sehingga setiap panggilan
+    membutuhkan resize. Dibandingkan cache dingin (dibersihkan tiap
+    panggilan, setara resize per panggilan) dengan cache hangat.
+    
+    Args:
+        tinggi, lebar: Ukuran frame
+        ulangan: Jumlah ulangan
+    
+    Returns:
+        dict: Waktu (ms) per operasi dan speedup cache
+    """
+    from normalisasi_ukuran import bersihkan_cache_resize
+    from operasi_blending import OperasiBlending
+    from motion_detection import deteksi_motion_sederhana
+    
+    print(f"⏱️ Benchmark cache resize (referensi 4K -> {lebar}x{tinggi})...")
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (tinggi, lebar), dtype=np.uint8)
+    referensi = rng.integers(0, 256, (tinggi * 2, lebar * 2), dtype=np.uint8)
+    blending = OperasiBlending(backend='opencv', cache_resize=True)
+    
+    operasi = {
+        'Blending': lambda: blending.blending_citra(frame, referensi, 0.5),
+        'Motion': lambda: deteksi_motion_sederhana(frame, referensi, cache_resize=True)
+    }
+    hasil = {}
+    for nama, fungsi in operasi.items():
+        def dingin():
+            bersihkan_cache_resize()
+            fungsi()
+        hasil[f'{nama} Tanpa Cache (ms)'] = ukur_waktu(dingin, ulangan)
+        hasil[f'{nama} Cache (ms)'] = ukur_waktu(fungsi, ulangan)
+        hasil[f'{nama} Speedup'] = hasil[f'{nama} Tanpa Cache (ms)'] / hasil[f'{nama} Cache (ms)']
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.2f}")
+    return hasil
+
+def benchmark_pelacakan(jumlah_objek=500, jumlah_frame=200, lebar=1920, tinggi=1080,
+                        metrik='centroid'):
+    """
+    Mengukur latensi per frame PelacakMotion dan jumlah pertukaran ID
+    
+    Objek sintetis bergerak dengan kecepatan konstan + noise dan memantul
+    di tepi frame. ID swap dihitung sebagai region yang ID track-nya
+    berubah dibanding frame sebelumnya.
+    
+    Args:
+        jumlah_objek: Jumlah objek per frame (default: 500)
+        jumlah_frame: Jumlah frame
+        lebar, tinggi: Ukuran area gerak
+        metrik: 'centroid' atau 'iou'
+    
+    Returns:
+        dict: Median/p95 latensi (ms), ID swap dan total track
+    """
+    from pelacakan_motion import PelacakMotion
+    
+    print(f"⏱️ Benchmark pelacakan {jumlah_objek} objek x {jumlah_frame} frame ({metrik})...")
+    rng = np.random.default_rng(0)
+    batas = np.array([lebar, tinggi], dtype=np.float64)
+    posisi = rng.random((jumlah_objek, 2)) * batas
+    kecepatan = rng.normal(0, 3, (jumlah_objek, 2))
+    ukuran = rng.integers(8, 24, (jumlah_objek, 2))
+    
+    pelacak = PelacakMotion(metrik=metrik, jarak_maks=20)
+    waktu = []
+    id_sebelumnya = None
+    swap = 0
+    for _ in range(jumlah_frame):
+        posisi += kecepatan + rng.normal(0, 0.5, posisi.shape)
+        keluar = (posisi < 0) | (posisi > batas)
+        kecepatan[keluar] *= -1
+        posisi = np.clip(posisi, 0, batas)
+        
+        kiri_atas = np.rint(posisi - ukuran / 2).astype(np.int32)
+        regions = {'centroid': posisi.copy(),
+                   'bbox': np.hstack([kiri_atas, ukuran.astype(np.int32)])}
+        
+        awal = time.perf_counter()
+        tracks, _ = pelacak.perbarui(regions)
+        waktu.append((time.perf_counter() - awal) * 1000)
+        
+        if id_sebelumnya is not None:
+            swap += int(np.count_nonzero(tracks['id'] != id_sebelumnya))
+        id_sebelumnya = tracks['id']
+    
+    waktu = np.array(waktu[5:])
+    hasil = {
+        'Median (ms)': float(np.median(waktu)),
+        'P95 (ms)': float(np.percentile(waktu, 95)),
+        'ID Swap': swap,
+        'Total Track': pelacak.id_berikutnya - 1
+    }
+    for key, value in hasil.items():
+        print(f"  {key}: {value:.2f}" if isinstance(value, float) else f"  {key}: {value}")
+    return hasil
+
+MODUL_BERAT = ('tkinter', 'matplotlib.pyplot', 'skimage.data')
+
+def cek_waktu_import(modul="main_program", budget_ms=500, ulangan=3):
+    """
+    Regresi waktu startup berbasis `python -X importtime`
+
+    Modul diimpor di proses baru dalam mode headless. Waktu kumulatif
+    import modul harus di bawah budget dan modul berat (MODUL_BERAT)
+    tidak boleh ikut terimpor; jika tidak, AssertionError.
+
+    Args:
+        modul: Nama modul yang diimpor (default: main_program)
+        budget_ms: Batas waktu import kumulatif dalam ms (default: 500)
+        ulangan: Jumlah pengukuran, diambil yang tercepat
+
+    Returns:
+        dict: Waktu import (ms), modul berat yang terimpor, status lulus
+    """
+    print(f"⏱️ Cek waktu import '{modul}' (budget {budget_ms} ms)...")
+    folder = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PCD_HEADLESS="1")
+    kode = (f"import sys, {modul}; "
+            f"print(','.join(m for m in {MODUL_BERAT!r} if m in sys.modules))")
+
+    waktu_terbaik = float('inf')
+    terimpor = []
+    for _ in range(ulangan):
+        proses = subprocess.run([sys.executable, "-X", "importtime", "-c", kode],
+                                cwd=folder, env=env, capture_output=True, text=True,
+                                check=True)
+        terimpor = [m for m in proses.stdout.strip().split(',') if m]
+
+        # Baris: "import time: self [us] | cumulative | nama_modul"
+        for baris in proses.stderr.splitlines():
+            kolom = baris.split('|')
+            if len(kolom) == 3 and kolom[2].strip() == modul:
+                waktu_terbaik = min(waktu_terbaik, int(kolom[1]) / 1000)
+
+    lulus = waktu_terbaik <= budget_ms and not terimpor
+    status = '✅' if lulus else '❌'
+    print(f"  {status} Import: {waktu_terbaik:.1f} ms, modul berat: {terimpor or '-'}")
+    assert lulus, (f"Import '{modul}' {waktu_terbaik:.1f} ms (budget {budget_ms} ms), "
+                   f"modul berat: {terimpor or '-'}")
+    return {'Import (ms)': waktu_terbaik, 'Modul Berat': terimpor, 'Lulus': lulus}
+
+if __name__ == "__main__":
+    print("🧪 Menjalankan benchmark...")
+    benchmark_statistik()
+    profil_memori_pengurangan(batas_mb=1)
+    benchmark_renderer()
+    benchmark_mask_bit()
+    benchmark_boolean_gabungan()
+    benchmark_sweep_threshold()
+    benchmark_binarisasi_adaptif()
+    benchmark_stream_motion()
+    benchmark_model_latar()
+    benchmark_region_motion()
+    cek_motion_bertingkat()
+    benchmark_motion_bertingkat()
+    benchmark_backend_blending()
+    benchmark_blending_piramida()
+    benchmark_cross_fade()
+    benchmark_komposit_layer()
+    benchmark_cache_resize()
+    benchmark_pelacakan()
+    benchmark_pelacakan(metrik='iou')
+    cek_waktu_import()
+    print("✅ Benchmark selesai!")
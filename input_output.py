@@ -5,11 +5,27 @@ Berisi fungsi-fungsi untuk memuat gambar dan menyimpan hasil
 
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-from skimage import data
 import os
-from tkinter import filedialog, messagebox
-import tkinter as tk
+import queue
+import threading
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+# Import berat (matplotlib, skimage.data, tkinter) ditunda sampai jalur kode
+# yang membutuhkannya dipanggil, agar startup worker/CLI tetap cepat.
+
+# Mode headless: tidak pernah membuka jendela (pyplot) atau dialog (tkinter)
+MODE_HEADLESS = os.environ.get("PCD_HEADLESS", "") not in ("", "0")
+
+def atur_mode_headless(aktif=True):
+    """
+    Mengaktifkan/menonaktifkan mode headless
+    
+    Args:
+        aktif: True untuk mode headless (default: True)
+    """
+    global MODE_HEADLESS
+    MODE_HEADLESS = bool(aktif)
 
 def buat_folder_hasil(nama_folder="hasil_pengolahan"):
     """
@@ -22,9 +38,9 @@ def buat_folder_hasil(nama_folder="hasil_pengolahan"):
         str: Path folder yang dibuat
     """
     try:
-        # Buat folder utama
+        # Buat folder utama (exist_ok: aman dipanggil dari banyak writer)
         if not os.path.exists(nama_folder):
-            os.makedirs(nama_folder)
+            os.makedirs(nama_folder, exist_ok=True)
             print(f"📁 Folder '{nama_folder}' telah dibuat")
         
         # Buat subfolder berdasarkan kategori
@@ -38,7 +54,7 @@ def buat_folder_hasil(nama_folder="hasil_pengolahan"):
         for subfolder in subfolders:
             subfolder_path = os.path.join(nama_folder, subfolder)
             if not os.path.exists(subfolder_path):
-                os.makedirs(subfolder_path)
+                os.makedirs(subfolder_path, exist_ok=True)
                 print(f"📂 Subfolder '{subfolder}' telah dibuat")
         
         return nama_folder
@@ -55,6 +71,8 @@ def muat_gambar_sample():
     """
     try:
         print("🔄 Memuat gambar sample...")
+        from skimage import data
+        
         img1 = data.camera()  # Gambar kamera
         img2 = data.coins()   # Gambar koin
         
@@ -77,6 +95,13 @@ def input_gambar_dari_file():
         tuple: (img1, img2) atau (None, None) jika gagal
     """
     try:
+        if MODE_HEADLESS:
+            print("❌ Dialog file tidak tersedia dalam mode headless")
+            return None, None
+        
+        import tkinter as tk
+        from tkinter import filedialog
+        
         print("📂 Pilih gambar pertama...")
         root = tk.Tk()
         root.withdraw()
@@ -158,6 +183,11 @@ def tampilkan_gambar_input(img1, img2, title1="Gambar A", title2="Gambar B"):
         title1, title2: Judul untuk masing-masing gambar
     """
     try:
+        if MODE_HEADLESS:
+            return
+        
+        import matplotlib.pyplot as plt
+        
         fig, axes = plt.subplots(1, 2, figsize=(12, 5))
         
         axes[0].imshow(img1, cmap='gray')
@@ -176,7 +206,8 @@ def tampilkan_gambar_input(img1, img2, title1="Gambar A", title2="Gambar B"):
 
 def simpan_perbandingan_dengan_stats(img_asli, img_hasil, filename_base, 
                                    title_asli, title_hasil, stats_asli, stats_hasil,
-                                   folder_output="hasil_pengolahan", kategori=""):
+                                   folder_output="hasil_pengolahan", kategori="",
+                                   renderer="matplotlib"):
     """
     Menyimpan perbandingan gambar dengan statistik dalam layout balanced
     
@@ -187,8 +218,12 @@ def simpan_perbandingan_dengan_stats(img_asli, img_hasil, filename_base,
         stats_asli, stats_hasil: Dictionary statistik
         folder_output: Folder untuk menyimpan hasil
         kategori: Kategori operasi (pengurangan/boolean/motion)
+        renderer: "matplotlib" (default) atau "opencv" (komposisi NumPy, jauh lebih cepat)
     """
     try:
+        if renderer not in ("matplotlib", "opencv"):
+            raise ValueError(f"Renderer tidak dikenal: {renderer}")
+        
         # Pastikan folder output ada
         buat_folder_hasil(folder_output)
         
@@ -197,50 +232,21 @@ def simpan_perbandingan_dengan_stats(img_asli, img_hasil, filename_base,
             output_path = os.path.join(folder_output, kategori)
             # Pastikan folder kategori ada
             if not os.path.exists(output_path):
-                os.makedirs(output_path)
+                os.makedirs(output_path, exist_ok=True)
                 print(f"📂 Subfolder '{kategori}' telah dibuat")
         else:
             output_path = folder_output
         
-        # Buat figure dengan layout balanced 2x2
-        fig = plt.figure(figsize=(14, 10))
-        gs = fig.add_gridspec(2, 2, height_ratios=[3, 2], hspace=0.3, wspace=0.2)
-        
-        # Gambar asli (atas kiri)
-        ax1 = fig.add_subplot(gs[0, 0])
-        ax1.imshow(img_asli, cmap='gray')
-        ax1.set_title(title_asli, fontsize=14, fontweight='bold', color='blue', pad=15)
-        ax1.axis('off')
-        
-        # Gambar hasil (atas kanan)
-        ax2 = fig.add_subplot(gs[0, 1])
-        ax2.imshow(img_hasil, cmap='gray')
-        ax2.set_title(title_hasil, fontsize=14, fontweight='bold', color='red', pad=15)
-        ax2.axis('off')
-        
-        # Statistik asli (bawah kiri)
-        ax3 = fig.add_subplot(gs[1, 0])
-        ax3.axis('off')
-        stats_text_asli = format_stats_text("STATISTIK ASLI", stats_asli)
-        ax3.text(0.5, 0.95, stats_text_asli, fontsize=11,
-                transform=ax3.transAxes, va='top', ha='center', family='monospace',
-                bbox=dict(boxstyle="round,pad=0.5", facecolor="lightblue", alpha=0.8))
-        
-        # Statistik hasil (bawah kanan)
-        ax4 = fig.add_subplot(gs[1, 1])
-        ax4.axis('off')
-        stats_text_hasil = format_stats_text("STATISTIK HASIL", stats_hasil)
-        ax4.text(0.5, 0.95, stats_text_hasil, fontsize=11,
-                transform=ax4.transAxes, va='top', ha='center', family='monospace',
-                bbox=dict(boxstyle="round,pad=0.5", facecolor="lightcoral", alpha=0.8))
-        
-        # Simpan file
-        plt.subplots_adjust(left=0.05, right=0.95, top=0.92, bottom=0.08, hspace=0.3, wspace=0.2)
-        plt.savefig(f"{output_path}/{filename_base}_comparison.jpg",
-                   dpi=150, bbox_inches='tight', pad_inches=0.2)
-        plt.close()
-        
-        # Simpan gambar individual
+        if renderer == "opencv":
+            canvas = render_perbandingan_opencv(img_asli, img_hasil, title_asli, title_hasil,
+                                                stats_asli, stats_hasil)
+        else:
+            # Figure matplotlib dipakai ulang (satu templat per thread)
+            canvas = dapatkan_templat_perbandingan().render(
+                img_asli, img_hasil, title_asli, title_hasil, stats_asli, stats_hasil)
+        
+        # Simpan file perbandingan dan gambar individual
+        cv2.imwrite(f"{output_path}/{filename_base}_comparison.jpg", canvas)
         cv2.imwrite(f"{output_path}/{filename_base}_original.jpg", img_asli)
         cv2.imwrite(f"{output_path}/{filename_base}_result.jpg", img_hasil)
         
@@ -249,6 +255,293 @@ def simpan_perbandingan_dengan_stats(img_asli, img_hasil, filename_base,
     except Exception as e:
         print(f"❌ Error menyimpan perbandingan: {e}")
 
+class TemplatPerbandingan:
+    """
+    Figure matplotlib 2x2 yang dibangun sekali lalu dipakai ulang
+    
+    Setiap lembar baru hanya memperbarui artist yang ada (AxesImage.set_data,
+    Text.set_text) lalu menggambar ulang kanvas Agg, tanpa membuat figure,
+    gridspec, axes dan teks dari awal. Area crop 'tight' (+0.2 inci) dihitung
+    sekali per bentuk layout dan di-cache, sehingga tidak dihitung ulang
+    selama ukuran judul, jumlah baris/lebar teks dan aspek gambar tidak berubah.
+    
+    Tidak thread-safe; gunakan dapatkan_templat_perbandingan() untuk
+    mendapatkan satu templat per thread.
+    """
+    
+    DPI = 150
+    PAD_INCHES = 0.2
+    
+    def __init__(self):
+        """Membangun figure, axes dan artist sekali"""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        self.fig = Figure(figsize=(14, 10), dpi=self.DPI)
+        self.canvas = FigureCanvasAgg(self.fig)
+        gs = self.fig.add_gridspec(2, 2, height_ratios=[3, 2], hspace=0.3, wspace=0.2)
+        
+        self.axes_gambar = []
+        self.gambar = []
+        self.judul = []
+        for kolom, warna in enumerate(('blue', 'red')):
+            ax = self.fig.add_subplot(gs[0, kolom])
+            self.gambar.append(ax.imshow(np.zeros((2, 2), dtype=np.uint8), cmap='gray'))
+            self.judul.append(ax.set_title("", fontsize=14, fontweight='bold', color=warna, pad=15))
+            ax.axis('off')
+            self.axes_gambar.append(ax)
+        
+        self.teks_stats = []
+        for kolom, warna in enumerate(('lightblue', 'lightcoral')):
+            ax = self.fig.add_subplot(gs[1, kolom])
+            ax.axis('off')
+            self.teks_stats.append(ax.text(
+                0.5, 0.95, "", fontsize=11,
+                transform=ax.transAxes, va='top', ha='center', family='monospace',
+                bbox=dict(boxstyle="round,pad=0.5", facecolor=warna, alpha=0.8)))
+        
+        self.fig.subplots_adjust(left=0.05, right=0.95, top=0.92, bottom=0.08, hspace=0.3, wspace=0.2)
+        self._cache_crop = {}
+    
+    def _set_gambar(self, kolom, image):
+        """Memperbarui data gambar, skala warna dan batas axes"""
+        artist = self.gambar[kolom]
+        artist.set_data(image)
+        # Sama seperti imshow: skala abu-abu otomatis ke rentang data
+        artist.set_clim(image.min(), image.max())
+        
+        tinggi, lebar = image.shape[:2]
+        extent = (-0.5, lebar - 0.5, tinggi - 0.5, -0.5)
+        if tuple(artist.get_extent()) != extent:
+            artist.set_extent(extent)
+            self.axes_gambar[kolom].set_xlim(extent[0], extent[1])
+            self.axes_gambar[kolom].set_ylim(extent[2], extent[3])
+    
+    def _kunci_layout(self, images, teks):
+        """Kunci cache crop: aspek gambar, ukuran judul terukur dan ukuran blok teks"""
+        aspek = tuple(round(img.shape[1] / img.shape[0], 3) for img in images)
+        # Judul memakai font proporsional: jumlah karakter tidak menentukan
+        # lebar, jadi ukur extent pixel dari renderer yang sudah digambar
+        renderer = self.canvas.get_renderer()
+        ukuran_judul = tuple((int(round(b.width)), int(round(b.height)))
+                             for b in (j.get_window_extent(renderer) for j in self.judul))
+        # Teks statistik monospace: ukuran cukup dari jumlah baris dan karakter
+        ukuran_teks = tuple((t.count("\n"), max(len(b) for b in t.split("\n"))) for t in teks)
+        return aspek, ukuran_judul, ukuran_teks
+    
+    def _hitung_crop(self):
+        """Menghitung area crop 'tight' dalam pixel dari renderer yang sudah digambar"""
+        bbox = self.fig.get_tightbbox(self.canvas.get_renderer())
+        tinggi_px = int(self.fig.bbox.height)
+        lebar_px = int(self.fig.bbox.width)
+        x0 = max(0, int((bbox.x0 - self.PAD_INCHES) * self.DPI))
+        x1 = min(lebar_px, int(np.ceil((bbox.x1 + self.PAD_INCHES) * self.DPI)))
+        y0 = max(0, tinggi_px - int(np.ceil((bbox.y1 + self.PAD_INCHES) * self.DPI)))
+        y1 = min(tinggi_px, tinggi_px - int((bbox.y0 - self.PAD_INCHES) * self.DPI))
+        return y0, y1, x0, x1
+    
+    def render(self, img_asli, img_hasil, title_asli, title_hasil, stats_asli, stats_hasil):
+        """
+        Merender lembar perbandingan dengan artist yang sudah ada
+        
+        Returns:
+            np.ndarray: Kanvas BGR uint8 yang sudah di-crop
+        """
+        images = (img_asli, img_hasil)
+        judul = (title_asli, title_hasil)
+        teks = (format_stats_text("STATISTIK ASLI", stats_asli),
+                format_stats_text("STATISTIK HASIL", stats_hasil))
+        
+        for kolom in range(2):
+            self._set_gambar(kolom, images[kolom])
+            self.judul[kolom].set_text(judul[kolom])
+            self.teks_stats[kolom].set_text(teks[kolom])
+        
+        self.canvas.draw()
+        
+        kunci = self._kunci_layout(images, teks)
+        if kunci not in self._cache_crop:
+            self._cache_crop[kunci] = self._hitung_crop()
+        y0, y1, x0, x1 = self._cache_crop[kunci]
+        
+        rgba = np.asarray(self.canvas.buffer_rgba())
+        return cv2.cvtColor(rgba[y0:y1, x0:x1], cv2.COLOR_RGBA2BGR)
+
+_templat_lokal = threading.local()
+
+def dapatkan_templat_perbandingan():
+    """
+    Mendapatkan TemplatPerbandingan milik thread saat ini (dibuat sekali)
+    
+    Returns:
+        TemplatPerbandingan: Templat untuk thread ini
+    """
+    templat = getattr(_templat_lokal, 'templat', None)
+    if templat is None:
+        templat = TemplatPerbandingan()
+        _templat_lokal.templat = templat
+    return templat
+
+# Layout renderer OpenCV, meniru figure matplotlib 14x10 inci @150 dpi
+UKURAN_KANVAS = (1400, 1960)          # (tinggi, lebar)
+WARNA_JUDUL = ((0, 0, 255), (255, 0, 0))                    # RGB: blue, red
+WARNA_KOTAK = ((173, 216, 230), (240, 128, 128))            # lightblue, lightcoral
+ALPHA_KOTAK = 0.8
+
+@functools.lru_cache(maxsize=None)
+def _muat_font(nama_file, ukuran):
+    """Memuat font TrueType bawaan matplotlib sekali (None jika Pillow tidak ada)"""
+    try:
+        import matplotlib
+        from PIL import ImageFont
+        path = os.path.join(matplotlib.get_data_path(), "fonts", "ttf", nama_file)
+        return ImageFont.truetype(path, ukuran)
+    except Exception:
+        return None
+
+def _tampilan_panel(image, tinggi, lebar):
+    """
+    Menyiapkan gambar untuk panel: autoscale min-max seperti imshow(cmap='gray')
+    lalu resize dengan mempertahankan aspek
+    """
+    if image.ndim == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    minimum, maksimum = float(image.min()), float(image.max())
+    if maksimum > minimum:
+        tampil = cv2.convertScaleAbs(image, alpha=255.0 / (maksimum - minimum),
+                                     beta=-minimum * 255.0 / (maksimum - minimum))
+    else:
+        tampil = np.zeros(image.shape, dtype=np.uint8)
+    
+    skala = min(tinggi / tampil.shape[0], lebar / tampil.shape[1])
+    ukuran = (max(1, int(tampil.shape[1] * skala)), max(1, int(tampil.shape[0] * skala)))
+    interpolasi = cv2.INTER_NEAREST if skala >= 1 else cv2.INTER_AREA
+    return cv2.resize(tampil, ukuran, interpolation=interpolasi)
+
+def _warna_bgr(rgb):
+    """Konversi warna RGB ke BGR untuk kanvas OpenCV"""
+    return tuple(reversed(rgb))
+
+def _ukuran_teks_pil(teks, font, spacing=6):
+    """Ukuran (lebar, tinggi) blok teks multiline dengan Pillow"""
+    from PIL import Image, ImageDraw
+    draw = ImageDraw.Draw(Image.new("L", (1, 1)))
+    kiri, atas, kanan, bawah = draw.multiline_textbbox((0, 0), teks, font=font,
+                                                       align="center", spacing=spacing)
+    return int(np.ceil(kanan - min(kiri, 0))), int(np.ceil(bawah - min(atas, 0)))
+
+@functools.lru_cache(maxsize=512)
+def _bitmap_judul(teks, kolom):
+    """
+    Bitmap BGR judul panel berlatar putih (di-cache, judul sering berulang)
+    """
+    warna = WARNA_JUDUL[kolom]
+    font = _muat_font("DejaVuSans-Bold.ttf", 29)
+    
+    if font is None:
+        teks = teks.encode("ascii", "replace").decode()
+        (w, h), dasar = cv2.getTextSize(teks, cv2.FONT_HERSHEY_SIMPLEX, 1.0, 2)
+        bitmap = np.full((h + dasar + 8, w + 8, 3), 255, dtype=np.uint8)
+        cv2.putText(bitmap, teks, (4, h + 4), cv2.FONT_HERSHEY_SIMPLEX, 1.0,
+                    _warna_bgr(warna), 2, cv2.LINE_AA)
+        return bitmap
+    
+    from PIL import Image, ImageDraw
+    w, h = _ukuran_teks_pil(teks, font)
+    pil = Image.new("RGB", (w + 8, h + 8), (255, 255, 255))
+    ImageDraw.Draw(pil).text((4, 4), teks, font=font, fill=warna)
+    bitmap = cv2.cvtColor(np.asarray(pil), cv2.COLOR_RGB2BGR)
+    bitmap.flags.writeable = False
+    return bitmap
+
+@functools.lru_cache(maxsize=512)
+def _bitmap_kotak_stats(teks, kolom):
+    """
+    Bitmap BGR kotak statistik (kotak berwarna + teks monospace)
+    
+    Di-cache karena statistik gambar asli sama untuk banyak lembar.
+    """
+    warna = tuple(int(ALPHA_KOTAK * c + (1 - ALPHA_KOTAK) * 255) for c in WARNA_KOTAK[kolom])
+    font = _muat_font("DejaVuSansMono.ttf", 23)
+    pad = 14
+    
+    if font is None:
+        baris = teks.encode("ascii", "replace").decode().split("\n")
+        lebar_baris = [cv2.getTextSize(b, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 1)[0][0] for b in baris]
+        w, h = max(lebar_baris), 32 * len(baris)
+        bitmap = np.full((h + 2 * pad, w + 2 * pad, 3), 255, dtype=np.uint8)
+        cv2.rectangle(bitmap, (0, 0), (w + 2 * pad - 1, h + 2 * pad - 1), _warna_bgr(warna), -1)
+        cv2.rectangle(bitmap, (0, 0), (w + 2 * pad - 1, h + 2 * pad - 1), (40, 40, 40), 2)
+        for i, (b, lb) in enumerate(zip(baris, lebar_baris)):
+            cv2.putText(bitmap, b, (pad + (w - lb) // 2, pad + 22 + 32 * i),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 0), 1, cv2.LINE_AA)
+        return bitmap
+    
+    from PIL import Image, ImageDraw
+    w, h = _ukuran_teks_pil(teks, font)
+    pil = Image.new("RGB", (w + 2 * pad, h + 2 * pad), (255, 255, 255))
+    draw = ImageDraw.Draw(pil)
+    draw.rounded_rectangle((0, 0, w + 2 * pad - 1, h + 2 * pad - 1), radius=12,
+                           fill=warna, outline=(40, 40, 40), width=2)
+    draw.multiline_text((pad + w // 2, pad), teks, font=font, fill=(0, 0, 0),
+                        anchor="ma", align="center", spacing=6)
+    bitmap = cv2.cvtColor(np.asarray(pil), cv2.COLOR_RGB2BGR)
+    bitmap.flags.writeable = False
+    return bitmap
+
+def _tempel(kanvas, bitmap, tengah_x, atas):
+    """Menempel bitmap ke kanvas dengan posisi tengah horizontal, dipotong di tepi"""
+    tinggi, lebar = kanvas.shape[:2]
+    x = max(0, tengah_x - bitmap.shape[1] // 2)
+    w = min(bitmap.shape[1], lebar - x)
+    h = min(bitmap.shape[0], tinggi - atas)
+    kanvas[atas:atas + h, x:x + w] = bitmap[:h, :w]
+
+def render_perbandingan_opencv(img_asli, img_hasil, title_asli, title_hasil,
+                               stats_asli, stats_hasil):
+    """
+    Merender lembar perbandingan langsung ke kanvas uint8 tanpa matplotlib
+    
+    Layout sama dengan simpan_perbandingan_dengan_stats: dua gambar di atas
+    (judul biru/merah), dua kotak statistik dari format_stats_text di bawah.
+    Judul dan kotak statistik dirasterisasi sekali menjadi bitmap kecil yang
+    di-cache (font DejaVu bawaan matplotlib via Pillow, mendukung simbol
+    seperti α dan ∩; tanpa Pillow memakai cv2.putText), lalu ditempel ke kanvas.
+    
+    Args:
+        img_asli, img_hasil: Gambar asli dan hasil
+        title_asli, title_hasil: Judul gambar
+        stats_asli, stats_hasil: Dictionary statistik
+        
+    Returns:
+        np.ndarray: Kanvas BGR uint8
+    """
+    tinggi, lebar = UKURAN_KANVAS
+    kanvas = np.full((tinggi, lebar, 3), 255, dtype=np.uint8)
+    
+    lebar_kolom = lebar // 2
+    atas_gambar, tinggi_gambar = 90, 680
+    atas_kotak = 885
+    
+    judul = (title_asli, title_hasil)
+    teks_stats = (format_stats_text("STATISTIK ASLI", stats_asli).rstrip("\n"),
+                  format_stats_text("STATISTIK HASIL", stats_hasil).rstrip("\n"))
+    
+    for kolom, image in enumerate((img_asli, img_hasil)):
+        tengah = kolom * lebar_kolom + lebar_kolom // 2
+        
+        # Panel gambar (atas)
+        panel = _tampilan_panel(image, tinggi_gambar, lebar_kolom - 160)
+        y = atas_gambar + (tinggi_gambar - panel.shape[0]) // 2
+        x = tengah - panel.shape[1] // 2
+        kanvas[y:y + panel.shape[0], x:x + panel.shape[1]] = panel[:, :, None]
+        
+        # Judul dan kotak statistik
+        _tempel(kanvas, _bitmap_judul(str(judul[kolom]), kolom), tengah, 25)
+        _tempel(kanvas, _bitmap_kotak_stats(teks_stats[kolom], kolom), tengah, atas_kotak)
+    
+    return kanvas
+
 def format_stats_text(title, stats_dict):
     """
     Format dictionary statistik menjadi text per baris
@@ -268,6 +561,124 @@ def format_stats_text(title, stats_dict):
             text += f"{key}: {value}\n"
     return text
 
+class PenulisLatarBelakang:
+    """
+    Tahap output latar belakang untuk simpan_perbandingan_dengan_stats
+    
+    Job (gambar, statistik, metadata) dimasukkan ke antrian terbatas dan
+    dirender/disimpan oleh worker thread atau proses, sehingga komputasi
+    dapat berjalan lebih dulu. Jika antrian penuh, kirim() menunggu
+    (back-pressure) agar memori tidak tumbuh tanpa batas.
+    
+    Contoh:
+        with PenulisLatarBelakang(jumlah_worker=2) as penulis:
+            penulis.kirim(img, hasil, "nama", "Asli", "Hasil", st1, st2,
+                          kategori="1_pengurangan_citra")
+    """
+    
+    def __init__(self, jumlah_worker=2, ukuran_antrian=8, mode="thread"):
+        """
+        Parameters:
+        - jumlah_worker: Jumlah thread/proses penulis
+        - ukuran_antrian: Maksimum job yang menunggu sebelum kirim() memblokir
+        - mode: "thread" atau "process"
+        """
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Mode tidak dikenal: {mode}")
+        
+        self.mode = mode
+        self.jumlah_job = 0
+        self._tertutup = False
+        
+        if mode == "thread":
+            self._antrian = queue.Queue(maxsize=ukuran_antrian)
+            self._workers = [
+                threading.Thread(target=self._loop_worker, daemon=True)
+                for _ in range(jumlah_worker)
+            ]
+            for worker in self._workers:
+                worker.start()
+        else:
+            # Semaphore membatasi job yang sedang antri/berjalan di pool
+            self._slot = threading.BoundedSemaphore(ukuran_antrian)
+            self._executor = ProcessPoolExecutor(max_workers=jumlah_worker)
+            self._futures = set()
+            self._lock = threading.Lock()
+    
+    def _loop_worker(self):
+        """Loop worker thread: ambil job sampai menerima sentinel None"""
+        while True:
+            job = self._antrian.get()
+            try:
+                if job is None:
+                    return
+                args, kwargs = job
+                simpan_perbandingan_dengan_stats(*args, **kwargs)
+            finally:
+                self._antrian.task_done()
+    
+    def _job_selesai(self, future):
+        """Callback proses: lepaskan slot antrian"""
+        with self._lock:
+            self._futures.discard(future)
+        self._slot.release()
+    
+    def kirim(self, img_asli, img_hasil, *args, salin_gambar=True, **kwargs):
+        """
+        Menjadwalkan satu perbandingan untuk disimpan di latar belakang
+        
+        Argumen sama dengan simpan_perbandingan_dengan_stats. Gambar disalin
+        secara default agar pemanggil bebas memakai ulang buffer-nya.
+        """
+        if self._tertutup:
+            raise RuntimeError("Penulis sudah ditutup")
+        
+        if salin_gambar:
+            img_asli = np.array(img_asli, copy=True)
+            img_hasil = np.array(img_hasil, copy=True)
+        job_args = (img_asli, img_hasil) + args
+        self.jumlah_job += 1
+        
+        if self.mode == "thread":
+            self._antrian.put((job_args, kwargs))
+        else:
+            self._slot.acquire()
+            future = self._executor.submit(simpan_perbandingan_dengan_stats, *job_args, **kwargs)
+            with self._lock:
+                self._futures.add(future)
+            future.add_done_callback(self._job_selesai)
+    
+    def flush(self):
+        """Menunggu sampai semua job yang sudah dikirim selesai disimpan"""
+        if self.mode == "thread":
+            self._antrian.join()
+        else:
+            with self._lock:
+                menunggu = list(self._futures)
+            for future in menunggu:
+                future.result()
+    
+    def close(self):
+        """Flush lalu hentikan semua worker"""
+        if self._tertutup:
+            return
+        self.flush()
+        self._tertutup = True
+        
+        if self.mode == "thread":
+            for _ in self._workers:
+                self._antrian.put(None)
+            for worker in self._workers:
+                worker.join()
+        else:
+            self._executor.shutdown(wait=True)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 def tampilkan_menu_input():
     """
     Menampilkan menu pilihan input gambar
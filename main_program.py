@@ -32,6 +32,12 @@ STRUKTUR MODULAR:
 └── main_program.py        - Program utama (file ini)
 """
 
+import sys
+import json
+import contextlib
+import time
+import argparse
+
 # Import semua modul yang sudah dipisah
 from operasi_pengurangan import demo_pengurangan_citra, hitung_statistik_dasar
 from operasi_boolean import demo_operasi_boolean, hitung_statistik_biner
@@ -41,7 +47,17 @@ from input_output import (
     pilih_input_gambar, 
     simpan_perbandingan_dengan_stats,
     hitung_total_file_output,
-    muat_gambar_sample
+    muat_gambar_sample,
+    PenulisLatarBelakang,
+    atur_mode_headless
+)
+from pemrosesan_batch import (
+    SEMUA_OPERASI,
+    baca_manifest,
+    muat_pasangan,
+    jalankan_operasi_pasangan,
+    simpan_hasil_pasangan,
+    jalankan_batch
 )
 
 def tampilkan_header():
@@ -208,72 +224,76 @@ def demo_lengkap():
     
     total_files_awal = hitung_total_file_output()
     
-    # 1. Operasi Pengurangan
-    print("\n1️⃣ OPERASI PENGURANGAN CITRA")
-    stats_asli = hitung_statistik_dasar(img1)
-    hasil_pengurangan = demo_pengurangan_citra(img1, img2)
+    # Rendering & penyimpanan berjalan di latar belakang agar komputasi tidak menunggu
+    with PenulisLatarBelakang() as penulis:
+        # 1. Operasi Pengurangan
+        print("\n1️⃣ OPERASI PENGURANGAN CITRA")
+        stats_asli = hitung_statistik_dasar(img1)
+        hasil_pengurangan = demo_pengurangan_citra(img1, img2)
     
-    for nama_operasi, data in hasil_pengurangan.items():
-        simpan_perbandingan_dengan_stats(
-            img1, data['image'],
-            f"demo_{nama_operasi}",
-            "Sample Camera",
-            data['title'],
-            stats_asli,
-            data['stats'],
-            kategori="1_pengurangan_citra"
-        )
+        for nama_operasi, data in hasil_pengurangan.items():
+            penulis.kirim(
+                img1, data['image'],
+                f"demo_{nama_operasi}",
+                "Sample Camera",
+                data['title'],
+                stats_asli,
+                data['stats'],
+                kategori="1_pengurangan_citra"
+            )
     
-    # 2. Operasi Boolean (Semua: AND, OR, XOR, NOT)
-    print("\n2️⃣ OPERASI BOOLEAN (AND, OR, XOR, NOT)")
-    hasil_boolean = demo_operasi_boolean(img1, img2)
+        # 2. Operasi Boolean (Semua: AND, OR, XOR, NOT)
+        print("\n2️⃣ OPERASI BOOLEAN (AND, OR, XOR, NOT)")
+        hasil_boolean = demo_operasi_boolean(img1, img2)
     
-    if 'binary1' in hasil_boolean:
-        stats_binary = hasil_boolean['binary1']['stats']
-        # Semua operasi boolean dalam satu folder
-        operasi_list = ['and', 'or', 'xor', 'not']
-        for nama_operasi in operasi_list:
-            if nama_operasi in hasil_boolean:
-                data = hasil_boolean[nama_operasi]
-                simpan_perbandingan_dengan_stats(
-                    hasil_boolean['binary1']['image'],
-                    data['image'],
-                    f"demo_boolean_{nama_operasi}",
-                    "Binary Camera",
-                    data['title'],
-                    stats_binary,
-                    data['stats'],
-                    "hasil_pengolahan",
-                    "2_operasi_boolean"
-                )
+        if 'binary1' in hasil_boolean:
+            stats_binary = hasil_boolean['binary1']['stats']
+            # Semua operasi boolean dalam satu folder
+            operasi_list = ['and', 'or', 'xor', 'not']
+            for nama_operasi in operasi_list:
+                if nama_operasi in hasil_boolean:
+                    data = hasil_boolean[nama_operasi]
+                    penulis.kirim(
+                        hasil_boolean['binary1']['image'],
+                        data['image'],
+                        f"demo_boolean_{nama_operasi}",
+                        "Binary Camera",
+                        data['title'],
+                        stats_binary,
+                        data['stats'],
+                        "hasil_pengolahan",
+                        "2_operasi_boolean"
+                    )
     
-    # 3. Motion Detection
-    print("\n3️⃣ MOTION DETECTION")
-    hasil_motion = demo_motion_detection()
+        # 3. Motion Detection
+        print("\n3️⃣ MOTION DETECTION")
+        hasil_motion = demo_motion_detection()
     
-    if hasil_motion:
-        motion_list = ['motion_cleaned']  # Ambil satu yang terbaik saja
-        for nama_motion in motion_list:
-            if nama_motion in hasil_motion and 'frame1' in hasil_motion:
-                data_motion = hasil_motion[nama_motion]
-                frame1_data = hasil_motion['frame1']
+        if hasil_motion:
+            motion_list = ['motion_cleaned']  # Ambil satu yang terbaik saja
+            for nama_motion in motion_list:
+                if nama_motion in hasil_motion and 'frame1' in hasil_motion:
+                    data_motion = hasil_motion[nama_motion]
+                    frame1_data = hasil_motion['frame1']
                 
-                simpan_perbandingan_dengan_stats(
-                    frame1_data['image'],
-                    data_motion['image'],
-                    f"demo_{nama_motion}",
-                    "Demo Frame",
-                    data_motion['title'],
-                    frame1_data['stats'],
-                    data_motion['stats'],
-                    "hasil_pengolahan",
-                    "3_motion_detection"
-                )
+                    penulis.kirim(
+                        frame1_data['image'],
+                        data_motion['image'],
+                        f"demo_{nama_motion}",
+                        "Demo Frame",
+                        data_motion['title'],
+                        frame1_data['stats'],
+                        data_motion['stats'],
+                        "hasil_pengolahan",
+                        "3_motion_detection"
+                    )
     
-    # 4. Operasi Blending (Terakhir)
-    print("\n4️⃣ OPERASI BLENDING CITRA")
-    blending = OperasiBlending()
-    blending.demo_blending("4_blending_citra")
+        # 4. Operasi Blending (Terakhir)
+        print("\n4️⃣ OPERASI BLENDING CITRA")
+        blending = OperasiBlending()
+        blending.demo_blending("4_blending_citra", penulis)
+    
+        print("\n💾 Menunggu penyimpanan hasil selesai...")
     
     # Hitung total file
     total_files_akhir = hitung_total_file_output()
@@ -336,5 +356,194 @@ def main():
     except Exception as e:
         print(f"❌ Error tidak terduga: {e}")
 
+# Subcommand CLI -> nama operasi di pemrosesan_batch
+SUBCOMMAND_OPERASI = {
+    'subtract': ('pengurangan',),
+    'boolean': ('boolean',),
+    'motion': ('motion',),
+    'blend': ('blending',),
+    'all': SEMUA_OPERASI
+}
+
+def _nilai_threshold(teks):
+    """Tipe argparse untuk threshold: angka, 'otsu' atau 'adaptif'"""
+    if teks in ('otsu', 'adaptif'):
+        return teks
+    try:
+        return int(teks)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"threshold harus angka, 'otsu' atau 'adaptif': {teks}")
+
+def buat_parser_cli():
+    """
+    Membuat parser argparse untuk mode non-interaktif
+    
+    Returns:
+        argparse.ArgumentParser: Parser dengan subcommand per operasi
+    """
+    parser = argparse.ArgumentParser(
+        prog="main_program.py",
+        description="Pengolahan Citra Digital - mode non-interaktif. "
+                    "Tanpa argumen, program berjalan dengan menu interaktif.")
+    subparsers = parser.add_subparsers(dest="perintah", required=True)
+    
+    for perintah, bantuan in [
+        ('subtract', "Pengurangan |A - B| dan (A - B) + K"),
+        ('boolean', "Operasi boolean AND, OR, XOR, NOT"),
+        ('motion', "Motion detection dengan cleanup"),
+        ('blend', "Blending α×A + (1-α)×B"),
+        ('all', "Semua operasi (seperti Demo Lengkap)")
+    ]:
+        sub = subparsers.add_parser(perintah, help=bantuan)
+        sub.add_argument('input', nargs='*',
+                         help="Dua path gambar (A B), atau satu manifest/direktori pasangan. "
+                              "Kosong = gambar sample built-in")
+        
+        if perintah in ('subtract', 'all'):
+            sub.add_argument('--konstanta', type=int, nargs='+', default=[100, 150],
+                             help="Konstanta untuk (A - B) + K (default: 100 150)")
+        if perintah in ('boolean', 'all'):
+            sub.add_argument('--threshold', type=_nilai_threshold, default=127,
+                             help="Threshold binarisasi: angka, 'otsu' atau 'adaptif' (default: 127)")
+        if perintah in ('motion', 'all'):
+            sub.add_argument('--motion-threshold', type=int, default=30,
+                             help="Threshold motion detection (default: 30)")
+        if perintah in ('blend', 'all'):
+            sub.add_argument('--alpha', type=float, nargs='+', default=[0.3, 0.5, 0.7],
+                             help="Nilai alpha blending (default: 0.3 0.5 0.7)")
+        
+        sub.add_argument('--workers', type=int, default=1,
+                         help="Jumlah proses worker untuk input batch (default: 1)")
+        sub.add_argument('--chunksize', type=int, default=1,
+                         help="Jumlah pasangan per task worker (default: 1)")
+        sub.add_argument('--no-render', action='store_true',
+                         help="Jangan simpan gambar perbandingan (hanya statistik)")
+        sub.add_argument('--renderer', choices=('matplotlib', 'opencv'), default='matplotlib',
+                         help="Renderer lembar perbandingan (default: matplotlib)")
+        sub.add_argument('--output', default="hasil_pengolahan",
+                         help="Folder output (default: hasil_pengolahan)")
+        sub.add_argument('--json-stats', metavar='PATH',
+                         help="Tulis statistik semua hasil sebagai JSON ('-' = stdout)")
+    
+    return parser
+
+def _parameter_cli(args):
+    """Mengambil parameter operasi dari argumen CLI"""
+    parameter = {}
+    if hasattr(args, 'konstanta'):
+        parameter['konstanta'] = tuple(args.konstanta)
+    if hasattr(args, 'threshold'):
+        parameter['threshold'] = args.threshold
+    if hasattr(args, 'motion_threshold'):
+        parameter['threshold_motion'] = args.motion_threshold
+    if hasattr(args, 'alpha'):
+        parameter['alphas'] = tuple(args.alpha)
+    return parameter
+
+def _json_default(obj):
+    """Konversi skalar NumPy dan objek lain agar bisa ditulis ke JSON"""
+    if hasattr(obj, 'item'):
+        return obj.item()
+    return str(obj)
+
+def _proses_cli(args, operasi, parameter, simpan):
+    """
+    Memproses input CLI (batch atau satu pasangan)
+    
+    Returns:
+        tuple: (semua_stats, jumlah_gagal) atau (None, None) jika input tidak valid
+    """
+    semua_stats = {}
+    jumlah_gagal = 0
+    
+    if len(args.input) == 1:
+        # Batch: manifest atau direktori pasangan
+        try:
+            pasangan = baca_manifest(args.input[0])
+        except OSError as e:
+            print(f"❌ Error membaca manifest: {e}")
+            return None, None
+        print(f"🔄 {args.perintah}: {len(pasangan)} pasangan, workers={args.workers}")
+        
+        for hasil in jalankan_batch(pasangan, operasi, workers=args.workers,
+                                    chunksize=args.chunksize, simpan=simpan,
+                                    folder_output=args.output, renderer=args.renderer,
+                                    **parameter):
+            if 'error' in hasil:
+                jumlah_gagal += 1
+                print(f"  ❌ {hasil['nama']}: {hasil['error']}")
+            else:
+                semua_stats[hasil['nama']] = hasil['stats']
+                print(f"  ✅ {hasil['nama']}")
+    
+    elif len(args.input) in (0, 2):
+        # Satu pasangan, diproses langsung di proses ini
+        if args.input:
+            try:
+                img1, img2 = muat_pasangan(args.input[0], args.input[1])
+            except (ValueError, OSError) as e:
+                print(f"❌ Error memuat gambar: {e}")
+                return None, None
+            nama = "cli"
+        else:
+            img1, img2 = muat_gambar_sample()
+            nama = "sample"
+            if img1 is None or img2 is None:
+                print("❌ Gagal memuat gambar sample")
+                return None, None
+        
+        results = jalankan_operasi_pasangan(img1, img2, operasi, **parameter)
+        if simpan:
+            simpan_hasil_pasangan(img1, nama, results, args.output, args.renderer)
+        semua_stats[nama] = {k: v['stats'] for k, v in results.items()}
+        print(f"  ✅ {nama}: {len(results)} hasil")
+    
+    else:
+        print("❌ Input harus kosong, dua gambar (A B), atau satu manifest/direktori")
+        return None, None
+    
+    return semua_stats, jumlah_gagal
+
+def jalankan_cli(argv=None):
+    """
+    Menjalankan operasi tanpa interaksi berdasarkan argumen command line
+    
+    Args:
+        argv: List argumen (default: sys.argv[1:])
+        
+    Returns:
+        int: Exit code (0 jika semua pasangan berhasil)
+    """
+    args = buat_parser_cli().parse_args(argv)
+    atur_mode_headless(True)
+    
+    operasi = SUBCOMMAND_OPERASI[args.perintah]
+    parameter = _parameter_cli(args)
+    simpan = not args.no_render
+    
+    # Semua cetakan progres ke stderr jika JSON ditulis ke stdout
+    log = sys.stderr if args.json_stats == '-' else sys.stdout
+    mulai = time.perf_counter()
+    
+    with contextlib.redirect_stdout(log):
+        semua_stats, jumlah_gagal = _proses_cli(args, operasi, parameter, simpan)
+        if semua_stats is None:
+            return 2
+        
+        durasi = time.perf_counter() - mulai
+        print(f"✅ Selesai: {len(semua_stats)} pasangan dalam {durasi:.2f} detik")
+    
+    if args.json_stats:
+        teks_json = json.dumps(semua_stats, indent=2, ensure_ascii=False, default=_json_default)
+        if args.json_stats == '-':
+            print(teks_json)
+        else:
+            with open(args.json_stats, 'w', encoding='utf-8') as f:
+                f.write(teks_json)
+    
+    return 1 if jumlah_gagal else 0
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(jalankan_cli())
     main()
\ No newline at end of file
@@ -3,24 +3,64 @@ Module untuk Motion Detection
 Berisi fungsi-fungsi untuk deteksi pergerakan antar frame
 """
 
+import os
 import cv2
+import queue
+import threading
 import numpy as np
+from statistik_citra import (hitung_nonzero, hitung_statistik_satu_lintasan,
+                             hitung_histogram, jumlah_di_atas_threshold)
+from normalisasi_ukuran import samakan_ukuran
 
-def deteksi_motion_sederhana(frame1, frame2, threshold=30):
+# Persentase motion minimum agar status 'DETECTED'
+BATAS_STATUS_MOTION = 1.0
+
+def statistik_motion(motion_pixels, total_pixels, threshold, cleanup=False, method=None):
+    """
+    Menyusun statistik motion dari jumlah pixel motion yang sudah dihitung
+    
+    Args:
+        motion_pixels: Jumlah pixel motion
+        total_pixels: Jumlah pixel frame
+        threshold: Threshold yang digunakan (angka atau deskripsi string)
+        cleanup: True untuk statistik mask hasil morphological cleanup
+        method: Nama metode (default: sesuai cleanup)
+        
+    Returns:
+        dict: Dictionary statistik
+    """
+    motion_pixels = int(motion_pixels)
+    motion_percentage = (motion_pixels / total_pixels) * 100
+    
+    stats = {
+        'Motion Pixels': motion_pixels,
+        'Total Pixels': total_pixels,
+        'Motion %': motion_percentage,
+        'Threshold': f'{threshold}/255' if not isinstance(threshold, str) else threshold,
+        'Status': 'DETECTED' if motion_percentage > BATAS_STATUS_MOTION else 'MINIMAL'
+    }
+    if cleanup:
+        stats['Cleaned'] = 'Morphological'
+    stats['Method'] = method or ('With Cleanup' if cleanup else 'Simple Differencing')
+    return stats
+
+def deteksi_motion_sederhana(frame1, frame2, threshold=30, interpolasi=None, cache_resize=False):
     """
     Deteksi motion sederhana menggunakan frame differencing
     
     Args:
         frame1, frame2: Array numpy frame gambar
         threshold: Threshold untuk deteksi motion
+        interpolasi: Flag interpolasi jika ukuran frame2 berbeda
+        cache_resize: True untuk cache resize frame2 (hanya untuk frame
+                      referensi yang tidak diubah in-place, lihat samakan_ukuran)
         
     Returns:
         tuple: (motion_mask, stats_dict)
     """
     try:
         # Pastikan ukuran sama
-        if frame1.shape != frame2.shape:
-            frame2 = cv2.resize(frame2, (frame1.shape[1], frame1.shape[0]))
+        frame2 = samakan_ukuran(frame2, frame1.shape, interpolasi, cache_resize)
         
         # Hitung perbedaan absolut
         diff = cv2.absdiff(frame1, frame2)
@@ -29,18 +69,7 @@ def deteksi_motion_sederhana(frame1, frame2, threshold=30):
         _, motion_mask = cv2.threshold(diff, threshold, 255, cv2.THRESH_BINARY)
         
         # Hitung statistik
-        motion_pixels = np.count_nonzero(motion_mask)
-        total_pixels = motion_mask.size
-        motion_percentage = (motion_pixels / total_pixels) * 100
-        
-        stats = {
-            'Motion Pixels': motion_pixels,
-            'Total Pixels': total_pixels,
-            'Motion %': motion_percentage,
-            'Threshold': f'{threshold}/255',
-            'Status': 'DETECTED' if motion_percentage > 1.0 else 'MINIMAL',
-            'Method': 'Simple Differencing'
-        }
+        stats = statistik_motion(hitung_nonzero(motion_mask), motion_mask.size, threshold)
         
         return motion_mask, stats
         
@@ -48,17 +77,59 @@ def deteksi_motion_sederhana(frame1, frame2, threshold=30):
         print(f"❌ Error deteksi motion sederhana: {e}")
         return None, None
 
-def deteksi_motion_dengan_cleanup(frame1, frame2, threshold=30):
+def sweep_threshold_motion(frame1, frame2, thresholds=range(256), materialisasi=(),
+                           cache_resize=False):
+    """
+    Statistik motion untuk banyak threshold dari satu histogram selisih
+    
+    Selisih absolut dan histogramnya dihitung sekali; statistik setiap
+    threshold (identik dengan deteksi_motion_sederhana) diturunkan dalam
+    O(256). Mask hanya dibuat untuk threshold pada `materialisasi`.
+    
+    Args:
+        frame1, frame2: Array numpy frame gambar
+        thresholds: Threshold yang dievaluasi (default: 0-255)
+        materialisasi: Threshold yang mask motionnya ikut dikembalikan
+        cache_resize: True untuk cache resize frame2 (lihat samakan_ukuran)
+        
+    Returns:
+        tuple: (dict threshold: motion_mask, dict threshold: stats_dict)
+    """
+    try:
+        frame2 = samakan_ukuran(frame2, frame1.shape, cache=cache_resize)
+        
+        diff = cv2.absdiff(frame1, frame2)
+        
+        thresholds = list(thresholds)
+        jumlah = jumlah_di_atas_threshold(hitung_histogram(diff), thresholds)
+        stats = {t: statistik_motion(n, diff.size, t) for t, n in zip(thresholds, jumlah)}
+        
+        masks = {}
+        for t in materialisasi:
+            _, masks[t] = cv2.threshold(diff, t, 255, cv2.THRESH_BINARY)
+        
+        return masks, stats
+        
+    except Exception as e:
+        print(f"❌ Error sweep threshold motion: {e}")
+        return None, None
+
+def deteksi_motion_dengan_cleanup(frame1, frame2, threshold=30, skala=1, abaikan=None):
     """
     Deteksi motion dengan morphological cleanup
     
     Args:
         frame1, frame2: Array numpy frame gambar
         threshold: Threshold untuk deteksi motion
+        skala: Faktor pre-pass coarse-to-fine (4 atau 8); 1 = resolusi penuh
+        abaikan: Mask uint8 ROI statis yang diabaikan (bukan 0 = diabaikan)
         
     Returns:
         tuple: (cleaned_motion_mask, stats_dict)
     """
+    if skala > 1 or abaikan is not None:
+        return deteksi_motion_bertingkat(frame1, frame2, threshold, skala, abaikan)
+    
     try:
         # Deteksi motion sederhana terlebih dahulu
         motion_mask, _ = deteksi_motion_sederhana(frame1, frame2, threshold)
@@ -76,19 +147,7 @@ def deteksi_motion_dengan_cleanup(frame1, frame2, threshold=30):
         cleaned = cv2.morphologyEx(cleaned, cv2.MORPH_OPEN, kernel)
         
         # Hitung statistik setelah cleanup
-        motion_pixels = np.count_nonzero(cleaned)
-        total_pixels = cleaned.size
-        motion_percentage = (motion_pixels / total_pixels) * 100
-        
-        stats = {
-            'Motion Pixels': motion_pixels,
-            'Total Pixels': total_pixels,
-            'Motion %': motion_percentage,
-            'Threshold': f'{threshold}/255',
-            'Status': 'DETECTED' if motion_percentage > 1.0 else 'MINIMAL',
-            'Cleaned': 'Morphological',
-            'Method': 'With Cleanup'
-        }
+        stats = statistik_motion(hitung_nonzero(cleaned), cleaned.size, threshold, cleanup=True)
         
         return cleaned, stats
         
@@ -96,6 +155,456 @@ def deteksi_motion_dengan_cleanup(frame1, frame2, threshold=30):
         print(f"❌ Error deteksi motion dengan cleanup: {e}")
         return None, None
 
+class ModelLatarBelakang:
+    """
+    Model latar belakang inkremental untuk motion detection
+    
+    Mode 'rata_rata': latar = exponential running average, pixel motion jika
+    |frame - latar| > threshold.
+    Mode 'gaussian': mean dan varians per pixel, pixel motion jika
+    |frame - mean| > k_sigma x std.
+    
+    Semua buffer float32 dialokasikan sekali dan diperbarui in-place
+    dengan operasi OpenCV; kerja per pixel per frame O(1). Statistik
+    memakai format yang sama dengan deteksi_motion_sederhana.
+    """
+    
+    def __init__(self, mode='rata_rata', alpha=0.05, threshold=30, k_sigma=2.5,
+                 std_awal=15.0, std_min=4.0, selektif=False):
+        """
+        Args:
+            mode: 'rata_rata' atau 'gaussian'
+            alpha: Laju adaptasi latar (0-1)
+            threshold: Threshold selisih untuk mode 'rata_rata'
+            k_sigma: Kelipatan std untuk mode 'gaussian'
+            std_awal: Std awal setiap pixel (mode 'gaussian')
+            std_min: Batas bawah std agar area statis tidak terlalu sensitif
+            selektif: Hanya perbarui model pada pixel latar (bukan motion) agar
+                      objek lambat tidak cepat terserap ke latar. Perubahan
+                      permanen (objek diparkir, lampu menyala) tidak pernah
+                      terserap dan tetap terdeteksi sebagai motion, jadi
+                      default False (semua pixel diperbarui)
+        """
+        if mode not in ('rata_rata', 'gaussian'):
+            raise ValueError(f"Mode model latar tidak dikenal: {mode}")
+        self.mode = mode
+        self.alpha = alpha
+        self.threshold = threshold
+        self.k_sigma = k_sigma
+        self.std_awal = std_awal
+        self.std_min = std_min
+        self.selektif = selektif
+        self.jumlah_frame = 0
+        self.latar = None
+    
+    def _inisialisasi(self, frame):
+        """Alokasi buffer dan latar awal dari frame pertama"""
+        self.latar = frame.astype(np.float32)
+        self._frame = np.empty_like(self.latar)
+        self._selisih = np.empty_like(self.latar)
+        self._mask = np.zeros(frame.shape, dtype=np.uint8)
+        self._mask_latar = np.empty_like(self._mask)
+        if self.mode == 'gaussian':
+            self.varians = np.full_like(self.latar, self.std_awal ** 2)
+            self._kuadrat = np.empty_like(self.latar)
+            self._batas = np.empty_like(self.latar)
+    
+    def _perbarui_di(self):
+        """Mask pixel yang modelnya diperbarui (None = semua pixel)"""
+        if not self.selektif:
+            return None
+        return cv2.bitwise_not(self._mask, dst=self._mask_latar)
+    
+    def perbarui(self, frame):
+        """
+        Memproses satu frame: deteksi motion terhadap model lalu perbarui model
+        
+        Mask yang dikembalikan dipakai ulang pada panggilan berikutnya.
+        
+        Args:
+            frame: Frame grayscale uint8
+            
+        Returns:
+            tuple: (motion_mask, stats_dict)
+        """
+        try:
+            if self.latar is None:
+                self._inisialisasi(frame)
+            else:
+                if frame.shape != self.latar.shape:
+                    frame = cv2.resize(frame, (self.latar.shape[1], self.latar.shape[0]))
+                np.copyto(self._frame, frame)
+                
+                if self.mode == 'rata_rata':
+                    cv2.absdiff(self._frame, self.latar, dst=self._selisih)
+                    cv2.compare(self._selisih, float(self.threshold), cv2.CMP_GT, dst=self._mask)
+                    cv2.accumulateWeighted(frame, self.latar, self.alpha,
+                                           mask=self._perbarui_di())
+                else:
+                    # d = x - mean, motion jika d² > k²·var
+                    cv2.subtract(self._frame, self.latar, dst=self._selisih)
+                    cv2.multiply(self._selisih, self._selisih, dst=self._kuadrat)
+                    cv2.multiply(self.varians, self.k_sigma ** 2, dst=self._batas)
+                    cv2.compare(self._kuadrat, self._batas, cv2.CMP_GT, dst=self._mask)
+                    
+                    # mean += α·d ; var = (1-α)·var + α·d², dibatasi std_min².
+                    # Mode selektif: d pixel motion dinolkan dan varians hanya
+                    # disalin kembali pada pixel latar
+                    if self.selektif:
+                        cv2.subtract(self._selisih, self._selisih, dst=self._selisih,
+                                     mask=self._mask)
+                    cv2.scaleAdd(self._selisih, self.alpha, self.latar, dst=self.latar)
+                    cv2.addWeighted(self.varians, 1 - self.alpha, self._kuadrat, self.alpha, 0,
+                                    dst=self._batas)
+                    cv2.max(self._batas, self.std_min ** 2, dst=self._batas)
+                    cv2.copyTo(self._batas, self._perbarui_di(), dst=self.varians)
+            
+            self.jumlah_frame += 1
+            if self.mode == 'rata_rata':
+                threshold, method = self.threshold, f'Running Average (α={self.alpha})'
+            else:
+                threshold, method = f'{self.k_sigma}σ', f'Gaussian (α={self.alpha})'
+            stats = statistik_motion(hitung_nonzero(self._mask), self._mask.size, threshold,
+                                     method=method)
+            return self._mask, stats
+            
+        except Exception as e:
+            print(f"❌ Error model latar belakang: {e}")
+            return None, None
+
+# Jangkauan pengaruh cleanup: close + open = 4 operasi 3x3 berturut-turut
+RADIUS_CLEANUP = 4
+
+# Di atas fraksi area ini, frame penuh diproses langsung (lebih murah)
+BATAS_AREA_BERTINGKAT = 0.5
+
+def buat_mask_abaikan(shape, kotak):
+    """
+    Membuat mask ROI statis yang diabaikan motion detection
+    
+    Args:
+        shape: Ukuran frame (tinggi, lebar)
+        kotak: Iterable (x, y, lebar, tinggi), misalnya area timestamp/pohon
+        
+    Returns:
+        np.ndarray: Mask uint8, 255 = diabaikan
+    """
+    mask = np.zeros(shape[:2], dtype=np.uint8)
+    for x, y, lebar, tinggi in kotak:
+        mask[y:y + tinggi, x:x + lebar] = 255
+    return mask
+
+class DetektorMotionBertingkat:
+    """
+    Motion detection dengan cleanup secara coarse-to-fine
+    
+    Pre-pass: selisih resolusi penuh di-threshold dengan threshold_kasar
+    lalu di-max-pool per sel skala x skala, sehingga satu pixel yang berubah
+    sudah menandai selnya (pengecilan dengan interpolasi merata-rata atau
+    hanya mengambil sampel pixel, sehingga motion bisa terlewat). Sel yang
+    berubah di-dilate satu sel, lalu cleanup morfologi resolusi penuh hanya
+    dijalankan di bounding box region tersebut (ditambah RADIUS_CLEANUP pixel
+    agar hasil di dalam box identik dengan deteksi_motion_dengan_cleanup).
+    Pixel di luar box dianggap tanpa motion; karena close + open tidak
+    pernah menyalakan pixel lebih dari 1 pixel dari mask threshold, hasil
+    identik dengan resolusi penuh selama threshold_kasar <= threshold. Jika
+    box menutupi lebih dari BATAS_AREA_BERTINGKAT frame, frame penuh
+    diproses langsung.
+    
+    Mask abaikan (bukan 0 = diabaikan) dinolkan sebelum pooling dan
+    cleanup, sehingga area yang diabaikan tidak memicu pemrosesan. Buffer
+    selisih resolusi penuh dipakai ulang antar frame; satu detektor tidak
+    thread-safe.
+    """
+    
+    def __init__(self, threshold=30, skala=4, abaikan=None, threshold_kasar=None,
+                 cache_resize=False):
+        """
+        Args:
+            threshold: Threshold motion resolusi penuh
+            skala: Faktor pengecilan pre-pass (mis. 4 atau 8)
+            abaikan: Mask uint8 ROI statis yang diabaikan (lihat buat_mask_abaikan)
+            threshold_kasar: Threshold pre-pass (default: threshold; nilai lebih
+                             besar lebih murah tetapi bisa melewatkan motion)
+            cache_resize: True untuk cache resize frame2 (lihat samakan_ukuran)
+        """
+        if skala < 1:
+            raise ValueError("Skala harus >= 1")
+        self.threshold = threshold
+        self.skala = int(skala)
+        self.threshold_kasar = threshold if threshold_kasar is None else threshold_kasar
+        self.kernel = np.ones((3,3), np.uint8)
+        self._kernel_pool = np.ones((self.skala, self.skala), np.uint8)
+        self.cache_resize = cache_resize
+        self._diff = None
+        self._blok = None
+        
+        self.abaikan = abaikan
+        self._izin = None
+        if abaikan is not None:
+            # Pixel diizinkan (255) jika tidak diabaikan; disiapkan sekali
+            self._izin = cv2.compare(abaikan, 0, cv2.CMP_EQ)
+    
+    def _max_pool(self, mask, blok):
+        """Max-pool mask per sel skala x skala (sel tepi yang terpotong ikut dihitung)"""
+        # Dilate dengan anchor (0, 0): pixel (x, y) = maks blok [x, x+skala) x [y, y+skala);
+        # di luar frame diabaikan oleh border default dilate
+        cv2.dilate(mask, self._kernel_pool, dst=blok, anchor=(0, 0))
+        return np.ascontiguousarray(blok[::self.skala, ::self.skala])
+    
+    def _cleanup(self, f1, f2, abaikan, out):
+        """Differencing, threshold, ROI abaikan dan cleanup ke buffer out"""
+        diff = cv2.absdiff(f1, f2)
+        cv2.threshold(diff, self.threshold, 255, cv2.THRESH_BINARY, dst=diff)
+        if abaikan is not None:
+            cv2.bitwise_and(diff, cv2.compare(abaikan, 0, cv2.CMP_EQ), dst=diff)
+        cv2.morphologyEx(diff, cv2.MORPH_CLOSE, self.kernel, dst=diff)
+        cv2.morphologyEx(diff, cv2.MORPH_OPEN, self.kernel, dst=out)
+        return out
+    
+    def kotak_kandidat(self, frame1, frame2):
+        """
+        Pre-pass kasar: bounding box resolusi penuh region yang berubah
+        
+        Returns:
+            np.ndarray: Array (N, 4) x0, y0, x1, y1 (tanpa margin cleanup)
+        """
+        # Buffer resolusi penuh dipakai ulang antar frame
+        if self._diff is None or self._diff.shape != frame1.shape:
+            self._diff = np.empty(frame1.shape, dtype=np.uint8)
+            self._blok = np.empty_like(self._diff)
+        diff = cv2.absdiff(frame1, frame2, dst=self._diff)
+        cv2.threshold(diff, self.threshold_kasar, 255, cv2.THRESH_BINARY, dst=diff)
+        if self._izin is not None:
+            cv2.bitwise_and(diff, self._izin, dst=diff)
+        kasar = cv2.dilate(self._max_pool(diff, self._blok), self.kernel)
+        
+        # Kontur eksternal jauh lebih murah daripada connected components
+        # untuk mask kasar yang hampir kosong
+        contours, _ = cv2.findContours(kasar, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        bbox = np.array([cv2.boundingRect(c) for c in contours], dtype=np.float64).reshape(-1, 4)
+        
+        # Sel kasar j menutupi pixel [j·skala, (j+1)·skala) resolusi penuh
+        tinggi, lebar = frame1.shape[:2]
+        kotak = bbox.astype(np.intp) * self.skala
+        kotak[:, 2:] += kotak[:, :2]
+        np.minimum(kotak[:, 2], lebar, out=kotak[:, 2])
+        np.minimum(kotak[:, 3], tinggi, out=kotak[:, 3])
+        return kotak
+    
+    def deteksi(self, frame1, frame2):
+        """
+        Deteksi motion coarse-to-fine untuk satu pasangan frame
+        
+        Returns:
+            tuple: (cleaned_motion_mask, stats_dict); stats menambahkan
+                   'Regions' (jumlah box) dan 'Processed %' (area resolusi
+                   penuh yang diproses)
+        """
+        try:
+            frame2 = samakan_ukuran(frame2, frame1.shape, cache=self.cache_resize)
+            
+            tinggi, lebar = frame1.shape[:2]
+            kotak = self.kotak_kandidat(frame1, frame2) if self.skala > 1 else None
+            
+            if kotak is not None:
+                # Box luar: box + margin cleanup, dipotong ke batas frame
+                luar = kotak + np.array([-RADIUS_CLEANUP, -RADIUS_CLEANUP,
+                                         RADIUS_CLEANUP, RADIUS_CLEANUP])
+                np.clip(luar[:, 0::2], 0, lebar, out=luar[:, 0::2])
+                np.clip(luar[:, 1::2], 0, tinggi, out=luar[:, 1::2])
+                area = int(((luar[:, 2] - luar[:, 0]) * (luar[:, 3] - luar[:, 1])).sum())
+                if area > BATAS_AREA_BERTINGKAT * frame1.size:
+                    kotak = None
+            
+            if kotak is None:
+                area = frame1.size
+                cleaned = self._cleanup(frame1, frame2, self.abaikan,
+                                        np.empty(frame1.shape, dtype=np.uint8))
+                jumlah_kotak = 1
+            else:
+                cleaned = np.zeros(frame1.shape, dtype=np.uint8)
+                for (x0, y0, x1, y1), (lx0, ly0, lx1, ly1) in zip(kotak.tolist(), luar.tolist()):
+                    ab = self.abaikan[ly0:ly1, lx0:lx1] if self.abaikan is not None else None
+                    hasil = self._cleanup(frame1[ly0:ly1, lx0:lx1], frame2[ly0:ly1, lx0:lx1],
+                                          ab, np.empty((ly1 - ly0, lx1 - lx0), dtype=np.uint8))
+                    # Hanya bagian dalam box yang eksak; salin ke mask penuh
+                    cleaned[y0:y1, x0:x1] = hasil[y0 - ly0:y1 - ly0, x0 - lx0:x1 - lx0]
+                jumlah_kotak = len(kotak)
+            
+            method = f'Coarse-to-Fine {self.skala}x' if self.skala > 1 else None
+            stats = statistik_motion(hitung_nonzero(cleaned), cleaned.size, self.threshold,
+                                     cleanup=True, method=method)
+            stats['Regions'] = jumlah_kotak
+            stats['Processed %'] = area / frame1.size * 100
+            return cleaned, stats
+            
+        except Exception as e:
+            print(f"❌ Error deteksi motion bertingkat: {e}")
+            return None, None
+
+def deteksi_motion_bertingkat(frame1, frame2, threshold=30, skala=4, abaikan=None,
+                              threshold_kasar=None):
+    """
+    Deteksi motion dengan cleanup secara coarse-to-fine (lihat DetektorMotionBertingkat)
+    
+    Untuk urutan frame dengan mask abaikan yang sama, pakai
+    DetektorMotionBertingkat langsung agar mask izin dan buffer selisih
+    hanya disiapkan sekali.
+    
+    Returns:
+        tuple: (cleaned_motion_mask, stats_dict)
+    """
+    try:
+        detektor = DetektorMotionBertingkat(threshold, skala, abaikan, threshold_kasar)
+    except Exception as e:
+        print(f"❌ Error deteksi motion bertingkat: {e}")
+        return None, None
+    return detektor.deteksi(frame1, frame2)
+
+EKSTENSI_FRAME = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif')
+
+def _baca_sumber(sumber):
+    """
+    Generator frame mentah dari file video atau direktori gambar
+    
+    Untuk video, buffer hasil decode dipakai ulang oleh VideoCapture.read
+    sehingga frame yang di-yield hanya valid sampai frame berikutnya.
+    """
+    if os.path.isdir(sumber):
+        for nama_file in sorted(os.listdir(sumber)):
+            if os.path.splitext(nama_file)[1].lower() not in EKSTENSI_FRAME:
+                continue
+            frame = cv2.imread(os.path.join(sumber, nama_file), cv2.IMREAD_GRAYSCALE)
+            if frame is not None:
+                yield frame
+        return
+    
+    cap = cv2.VideoCapture(sumber)
+    if not cap.isOpened():
+        raise ValueError(f"Gagal membuka video: {sumber}")
+    try:
+        frame = None
+        while True:
+            ok, frame = cap.read(frame)
+            if not ok:
+                break
+            yield frame
+    finally:
+        cap.release()
+
+def _taruh_antrian(antrian, item, berhenti):
+    """Put yang tetap responsif terhadap sinyal berhenti; False jika dibatalkan"""
+    while not berhenti.is_set():
+        try:
+            antrian.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _thread_dekode(sumber, antrian, jumlah_buffer, berhenti):
+    """
+    Dijalankan di thread terpisah: decode frame ke pool buffer grayscale
+    yang dipakai bergiliran, lalu kirim (index, buffer) ke antrian
+    """
+    try:
+        pool = None
+        for index, frame in enumerate(_baca_sumber(sumber)):
+            if pool is None:
+                tinggi, lebar = frame.shape[:2]
+                pool = [np.empty((tinggi, lebar), dtype=np.uint8) for _ in range(jumlah_buffer)]
+            buffer = pool[index % jumlah_buffer]
+            
+            if frame.shape[:2] != buffer.shape:
+                if frame.ndim == 3:
+                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                cv2.resize(frame, (buffer.shape[1], buffer.shape[0]), dst=buffer)
+            elif frame.ndim == 3:
+                cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=buffer)
+            else:
+                np.copyto(buffer, frame)
+            
+            if not _taruh_antrian(antrian, (index, buffer), berhenti):
+                return
+        _taruh_antrian(antrian, None, berhenti)
+    except Exception as e:
+        _taruh_antrian(antrian, e, berhenti)
+
+def stream_motion(sumber, threshold=30, ukuran_antrian=4, salin=False, skala=1,
+                  abaikan=None):
+    """
+    Motion detection dengan cleanup untuk video atau direktori frame
+    
+    Decode berjalan di thread terpisah (overlap dengan komputasi) ke pool
+    ukuran_antrian + 3 buffer grayscale; hanya frame sebelumnya yang
+    disimpan. Differencing, threshold dan morphological cleanup menulis ke
+    buffer yang dipakai ulang, dengan hasil identik dengan
+    deteksi_motion_dengan_cleanup pada frame berurutan.
+    
+    Args:
+        sumber: Path file video atau direktori frame (urut nama file)
+        threshold: Threshold untuk deteksi motion
+        ukuran_antrian: Jumlah frame ter-decode yang boleh menunggu
+        salin: True agar mask yang di-yield adalah salinan; jika False,
+               mask hanya valid sampai iterasi berikutnya
+        skala: Faktor pre-pass coarse-to-fine (lihat DetektorMotionBertingkat);
+               mask selalu baru sehingga `salin` tidak berpengaruh
+        abaikan: Mask uint8 ROI statis yang diabaikan (bukan 0 = diabaikan)
+        
+    Yields:
+        tuple: (index_frame, cleaned_motion_mask, stats_dict)
+    """
+    antrian = queue.Queue(maxsize=ukuran_antrian)
+    berhenti = threading.Event()
+    # Buffer hidup: frame sebelumnya, frame saat ini, isi antrian, frame yang sedang di-decode
+    thread = threading.Thread(target=_thread_dekode,
+                              args=(sumber, antrian, ukuran_antrian + 3, berhenti),
+                              daemon=True)
+    thread.start()
+    
+    kernel = np.ones((3,3), np.uint8)
+    sebelumnya = None
+    detektor = None
+    if skala > 1 or abaikan is not None:
+        detektor = DetektorMotionBertingkat(threshold, skala, abaikan)
+    
+    try:
+        while True:
+            item = antrian.get()
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                raise item
+            
+            index, frame = item
+            if sebelumnya is None:
+                diff = np.empty_like(frame)
+                closed = np.empty_like(frame)
+                cleaned = np.empty_like(frame)
+            elif detektor is not None:
+                mask, stats = detektor.deteksi(sebelumnya, frame)
+                if mask is not None:
+                    stats['Frame'] = index
+                    yield index, mask, stats
+            else:
+                cv2.absdiff(sebelumnya, frame, dst=diff)
+                cv2.threshold(diff, threshold, 255, cv2.THRESH_BINARY, dst=diff)
+                cv2.morphologyEx(diff, cv2.MORPH_CLOSE, kernel, dst=closed)
+                cv2.morphologyEx(closed, cv2.MORPH_OPEN, kernel, dst=cleaned)
+                
+                stats = statistik_motion(hitung_nonzero(cleaned), cleaned.size, threshold,
+                                         cleanup=True)
+                stats['Frame'] = index
+                yield index, cleaned.copy() if salin else cleaned, stats
+            sebelumnya = frame
+            
+    except Exception as e:
+        print(f"❌ Error stream motion: {e}")
+    finally:
+        berhenti.set()
+        thread.join(timeout=1.0)
+
 def buat_frame_motion_demo():
     """
     Membuat frame demo untuk motion detection
@@ -122,37 +631,82 @@ def buat_frame_motion_demo():
         print(f"❌ Error membuat frame demo: {e}")
         return None, None
 
-def analisis_motion_area(motion_mask):
+def analisis_region_motion(motion_mask, area_min=0, konektivitas=8):
+    """
+    Analisis region motion dengan connectedComponentsWithStats
+    
+    Semua atribut region dikembalikan sebagai array NumPy (satu elemen per
+    region) dan filter area minimum dilakukan secara vektor, sehingga
+    jumlah region tidak menambah loop Python.
+    
+    Args:
+        motion_mask: Mask hasil deteksi motion (0 / bukan 0)
+        area_min: Area minimum region dalam pixel (default: 0)
+        konektivitas: 4 atau 8 (default: 8)
+        
+    Returns:
+        tuple: (labels, regions) dengan labels peta label int32 dan regions
+               dict berisi 'label' (N,), 'area' (N,), 'bbox' (N, 4) sebagai
+               x, y, lebar, tinggi, dan 'centroid' (N, 2) sebagai x, y
+    """
+    try:
+        _, labels, stats, centroids = cv2.connectedComponentsWithStats(
+            motion_mask, connectivity=konektivitas, ltype=cv2.CV_32S)
+        
+        # Label 0 adalah latar
+        area = stats[1:, cv2.CC_STAT_AREA]
+        pilih = area >= area_min
+        
+        regions = {
+            'label': np.flatnonzero(pilih).astype(np.int32) + 1,
+            'area': area[pilih],
+            'bbox': stats[1:, :cv2.CC_STAT_AREA][pilih],
+            'centroid': centroids[1:][pilih]
+        }
+        return labels, regions
+        
+    except Exception as e:
+        print(f"❌ Error analisis region motion: {e}")
+        return None, None
+
+def analisis_motion_area(motion_mask, area_min=0, mode='komponen'):
     """
     Analisis area yang mengalami motion
     
     Args:
         motion_mask: Mask hasil deteksi motion
+        area_min: Area minimum region dalam pixel (mode 'komponen')
+        mode: 'komponen' (connected components, area pixel) atau
+              'kontur' (findContours + contourArea, area poligon)
         
     Returns:
         dict: Informasi tentang area motion
     """
     try:
-        # Cari contours (area motion)
-        contours, _ = cv2.findContours(motion_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        if mode == 'kontur':
+            # Cari contours (area motion)
+            contours, _ = cv2.findContours(motion_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            areas = np.array([cv2.contourArea(cnt) for cnt in contours])
+        else:
+            _, regions = analisis_region_motion(motion_mask, area_min)
+            if regions is None:
+                return {}
+            areas = regions['area']
         
-        if len(contours) == 0:
+        if len(areas) == 0:
             return {
                 'Motion Areas': 0,
                 'Largest Area': 0,
                 'Total Motion Area': 0
             }
         
-        # Hitung area dari setiap contour
-        areas = [cv2.contourArea(cnt) for cnt in contours]
-        total_motion_area = sum(areas)
-        largest_area = max(areas) if areas else 0
+        total_motion_area = areas.sum()
         
         return {
-            'Motion Areas': len(contours),
-            'Largest Area': int(largest_area),
+            'Motion Areas': len(areas),
+            'Largest Area': int(areas.max()),
             'Total Motion Area': int(total_motion_area),
-            'Avg Area': int(total_motion_area / len(contours)) if contours else 0
+            'Avg Area': int(total_motion_area / len(areas))
         }
         
     except Exception as e:
@@ -177,22 +731,25 @@ def demo_motion_detection():
         print("❌ Gagal membuat frame demo")
         return results
     
-    # Statistik frame asli
+    # Statistik frame asli (satu lintasan per frame)
+    st1 = hitung_statistik_satu_lintasan(frame1)
+    st2 = hitung_statistik_satu_lintasan(frame2)
+    
     stats_frame1 = {
         'Frame': 'Original',
-        'Mean Intensity': float(np.mean(frame1)),
-        'Std Dev': float(np.std(frame1)),
-        'Max': int(np.max(frame1)),
-        'Min': int(np.min(frame1)),
+        'Mean Intensity': st1['mean'],
+        'Std Dev': st1['std'],
+        'Max': st1['max'],
+        'Min': st1['min'],
         'Type': 'Static Scene'
     }
     
     stats_frame2 = {
         'Frame': 'Modified', 
-        'Mean Intensity': float(np.mean(frame2)),
-        'Std Dev': float(np.std(frame2)),
-        'Max': int(np.max(frame2)),
-        'Min': int(np.min(frame2)),
+        'Mean Intensity': st2['mean'],
+        'Std Dev': st2['std'],
+        'Max': st2['max'],
+        'Min': st2['min'],
         'Type': 'With Motion'
     }
     
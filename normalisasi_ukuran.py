@@ -0,0 +1,121 @@
+"""
+Module untuk Normalisasi Ukuran Citra
+Berisi cache hasil resize citra referensi (overlay, frame referensi) yang
+dipakai bersama oleh modul blending dan motion detection
+"""
+
+import cv2
+import weakref
+import threading
+from collections import OrderedDict
+
+# Interpolasi default, sama dengan bawaan cv2.resize
+INTERPOLASI_DEFAULT = cv2.INTER_LINEAR
+
+# Batas cache: jumlah entri dan total byte hasil resize yang disimpan
+UKURAN_CACHE_RESIZE = 16
+BATAS_BYTE_CACHE_RESIZE = 256 * 1024 * 1024
+
+_cache_resize = OrderedDict()
+_kunci_cache_resize = threading.Lock()
+_byte_cache_resize = 0
+_entri_mati_resize = []
+
+def _buang_entri_resize(kunci, ref):
+    """
+    Callback weakref: membuang entri cache milik citra yang sudah mati
+
+    Lock tidak ditunggu (GC bisa memanggil callback saat thread ini memegang
+    lock): entri dicatat lalu dibuang sekarang jika lock bebas, jika tidak
+    pada akses cache berikutnya.
+    """
+    _entri_mati_resize.append((kunci, ref))
+    if _kunci_cache_resize.acquire(blocking=False):
+        try:
+            _buang_entri_mati_resize()
+        finally:
+            _kunci_cache_resize.release()
+
+def _buang_entri_mati_resize():
+    """Membuang entri yang dicatat callback weakref (lock harus dipegang)"""
+    global _byte_cache_resize
+    while _entri_mati_resize:
+        kunci, ref = _entri_mati_resize.pop()
+        entri = _cache_resize.get(kunci)
+        if entri is not None and entri[0] is ref:
+            del _cache_resize[kunci]
+            _byte_cache_resize -= entri[1].nbytes
+
+def samakan_ukuran(image, shape, interpolasi=None, cache=False):
+    """
+    Mengubah ukuran citra ke (tinggi, lebar) shape, opsional dengan cache LRU
+
+    Citra yang ukurannya sudah sama dikembalikan apa adanya. Cache hanya
+    dipakai jika cache=True (opt-in, seperti binarisasi_tercache). Kunci cache
+    adalah identitas objek array (divalidasi dengan weakref, seperti
+    binarisasi_tercache), ukuran target dan interpolasi, sehingga citra
+    referensi yang sama hanya di-resize sekali. Entri dibuang saat citra
+    sumber di-garbage-collect, atau jika jumlah entri melebihi
+    UKURAN_CACHE_RESIZE atau total byte melebihi BATAS_BYTE_CACHE_RESIZE.
+    Citra yang diubah in-place tidak terdeteksi, jadi aktifkan cache hanya
+    untuk referensi yang tidak diubah (overlay tetap, frame referensi).
+    Hasil cache bersifat read-only.
+
+    Args:
+        image: Array numpy citra sumber
+        shape: Shape target; hanya (tinggi, lebar) yang dipakai
+        interpolasi: Flag interpolasi OpenCV (default: INTERPOLASI_DEFAULT)
+        cache: True untuk memakai cache LRU (default: resize setiap panggilan)
+
+    Returns:
+        np.ndarray: Citra dengan tinggi dan lebar sesuai shape
+    """
+    global _byte_cache_resize
+
+    tinggi, lebar = shape[:2]
+    if image.shape[:2] == (tinggi, lebar):
+        return image
+    if interpolasi is None:
+        interpolasi = INTERPOLASI_DEFAULT
+    if not cache:
+        return cv2.resize(image, (lebar, tinggi), interpolation=interpolasi)
+
+    kunci = (id(image), tinggi, lebar, interpolasi)
+    with _kunci_cache_resize:
+        _buang_entri_mati_resize()
+        entri = _cache_resize.get(kunci)
+        if entri is not None and entri[0]() is image:
+            _cache_resize.move_to_end(kunci)
+            return entri[1]
+
+    hasil = cv2.resize(image, (lebar, tinggi), interpolation=interpolasi)
+    if hasil.nbytes > BATAS_BYTE_CACHE_RESIZE:
+        return hasil
+
+    try:
+        ref = weakref.ref(image, lambda r, k=kunci: _buang_entri_resize(k, r))
+    except TypeError:
+        # Objek tanpa dukungan weakref tidak di-cache
+        return hasil
+
+    hasil.flags.writeable = False
+    with _kunci_cache_resize:
+        _buang_entri_mati_resize()
+        lama = _cache_resize.pop(kunci, None)
+        if lama is not None:
+            _byte_cache_resize -= lama[1].nbytes
+        _cache_resize[kunci] = (ref, hasil)
+        _byte_cache_resize += hasil.nbytes
+        while (len(_cache_resize) > UKURAN_CACHE_RESIZE
+               or _byte_cache_resize > BATAS_BYTE_CACHE_RESIZE):
+            _, (_, dibuang) = _cache_resize.popitem(last=False)
+            _byte_cache_resize -= dibuang.nbytes
+    return hasil
+
+def bersihkan_cache_resize():
+    """Mengosongkan cache resize"""
+    global _byte_cache_resize
+    with _kunci_cache_resize:
+        _cache_resize.clear()
+        _entri_mati_resize.clear()
+        _byte_cache_resize = 0
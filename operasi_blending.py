@@ -8,40 +8,282 @@ Modul ini berisi implementasi operasi blending (pencampuran) dua citra
 dengan menggunakan weighted average untuk menghasilkan transisi yang smooth.
 """
 
-import numpy as np
 import cv2
+import weakref
+import threading
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from statistik_citra import hitung_statistik_satu_lintasan
+from normalisasi_ukuran import samakan_ukuran
 from input_output import (
     muat_gambar_sample,
     simpan_perbandingan_dengan_stats
 )
 
+BACKEND_BLENDING = ('float64', 'fixed', 'opencv')
+
+# Jumlah pixel per tile blending fixed-point: dua buffer uint16 kerja
+# (~512 KB) tetap di cache L2 dan dipakai ulang untuk semua tile
+PIXEL_PER_TILE_BLENDING = 1 << 17
+
+MODE_BLENDING = ('normal', 'multiply', 'screen', 'difference')
+
+def buat_layer(image, alpha=None, mode='normal', posisi=(0, 0), opacity=1.0):
+    """
+    Membuat deskripsi layer untuk OperasiBlending.komposit_layer
+    
+    Parameters:
+    - image: Citra layer uint8 (H, W) atau (H, W, C); boleh np.memmap
+    - alpha: Mask alpha per pixel berukuran (H, W): uint8 0-255 atau
+      float32 0.0-1.0 (default: None = alpha penuh)
+    - mode: Salah satu MODE_BLENDING
+    - posisi: Offset (x, y) sudut kiri atas layer di kanvas, boleh negatif
+    - opacity: Pengali alpha global (0.0 - 1.0)
+    
+    Returns:
+    - layer: Dict 'image', 'alpha', 'mode', 'posisi', 'opacity'
+    """
+    if mode not in MODE_BLENDING:
+        raise ValueError(f"Mode blending tidak dikenal: {mode}")
+    if image.dtype != np.uint8:
+        raise ValueError("Citra layer harus uint8")
+    if alpha is not None and alpha.shape[:2] != image.shape[:2]:
+        raise ValueError("Ukuran mask alpha harus sama dengan layer")
+    if alpha is not None and alpha.dtype not in (np.uint8, np.float32):
+        raise ValueError("Mask alpha harus uint8 atau float32")
+    return {'image': image, 'alpha': alpha, 'mode': mode,
+            'posisi': (int(posisi[0]), int(posisi[1])), 'opacity': float(opacity)}
+
+def _komposit_tile(kanvas, layers, awal, akhir, out):
+    """
+    Mengkomposit semua layer untuk pita baris [awal, akhir) kanvas
+    
+    Akumulator float32 hanya seukuran pita; setiap layer hanya dibaca
+    pada irisan ROI-nya dengan pita, jadi memori tidak bergantung pada
+    jumlah atau ukuran layer.
+    """
+    lebar = out.shape[1]
+    if kanvas is None:
+        akum = np.zeros((akhir - awal,) + out.shape[1:], dtype=np.float32)
+    else:
+        akum = kanvas[awal:akhir].astype(np.float32)
+    
+    for layer in layers:
+        image = layer['image']
+        x, y = layer['posisi']
+        
+        # Irisan ROI layer dengan pita (koordinat kanvas)
+        y0, y1 = max(y, awal), min(y + image.shape[0], akhir)
+        x0, x1 = max(x, 0), min(x + image.shape[1], lebar)
+        if y0 >= y1 or x0 >= x1:
+            continue
+        
+        tujuan = akum[y0 - awal:y1 - awal, x0:x1]
+        sumber = np.asarray(image[y0 - y:y1 - y, x0 - x:x1 - x], dtype=np.float32)
+        
+        mode = layer['mode']
+        if mode == 'multiply':
+            campur = tujuan * sumber
+            campur *= 1 / 255
+        elif mode == 'screen':
+            # 255 - (255-D)(255-S)/255 = D + S - D·S/255
+            campur = tujuan * sumber
+            campur *= -1 / 255
+            campur += tujuan
+            campur += sumber
+        elif mode == 'difference':
+            campur = np.abs(tujuan - sumber)
+        else:
+            campur = sumber
+        
+        # D += a·(campur - D)
+        # campur selalu array baru (sumber adalah salinan float32 dari uint8)
+        np.subtract(campur, tujuan, out=campur)
+        if layer['alpha'] is not None:
+            skala = layer['opacity'] / 255 if layer['alpha'].dtype == np.uint8 else layer['opacity']
+            alpha = np.multiply(layer['alpha'][y0 - y:y1 - y, x0 - x:x1 - x], np.float32(skala),
+                                dtype=np.float32)
+            if campur.ndim == 3:
+                alpha = alpha[..., None]
+            campur *= alpha
+        elif layer['opacity'] != 1.0:
+            campur *= layer['opacity']
+        tujuan += campur
+    
+    # Pembulatan ke terdekat dan saturasi ke uint8
+    np.clip(akum, 0, 255, out=akum)
+    np.rint(akum, out=akum)
+    np.copyto(out[awal:akhir], akum, casting='unsafe')
+
+# Cache LRU piramida Laplacian, kunci: (identitas array, level).
+# Piramida float32 4K ~44 MB, jadi jumlah entri dibatasi kecil
+UKURAN_CACHE_PIRAMIDA = 6
+_cache_piramida = OrderedDict()
+_kunci_cache_piramida = threading.Lock()
+_entri_mati_piramida = []
+
+def piramida_gaussian(mask, level, channel=1):
+    """
+    Piramida Gaussian float32 (0-1) dari mask uint8 0-255 atau float32 0-1
+    
+    Tidak di-cache: mask biasanya diubah antar panggilan dan biayanya kecil
+    dibanding dekomposisi citra.
+    """
+    skala = 1 / 255 if mask.dtype == np.uint8 else 1.0
+    gauss = [np.multiply(mask, np.float32(skala), dtype=np.float32)]
+    if channel > 1 and gauss[0].ndim == 2:
+        gauss[0] = cv2.merge([gauss[0]] * channel)
+    for _ in range(level):
+        gauss.append(cv2.pyrDown(gauss[-1]))
+    return tuple(gauss)
+
+def piramida_laplacian(image, level):
+    """Piramida Laplacian float32 level + 1 tingkat; tingkat teratas tetap Gaussian"""
+    gauss = [image.astype(np.float32)]
+    for _ in range(level):
+        gauss.append(cv2.pyrDown(gauss[-1]))
+    
+    # L_i = G_i - pyrUp(G_i+1)
+    laplacian = []
+    for i in range(level):
+        tinggi, lebar = gauss[i].shape[:2]
+        naik = cv2.pyrUp(gauss[i + 1], dstsize=(lebar, tinggi))
+        laplacian.append(cv2.subtract(gauss[i], naik, dst=naik))
+    laplacian.append(gauss[level])
+    return tuple(laplacian)
+
+def _buang_entri_piramida(kunci, ref):
+    """
+    Callback weakref: hapus entri cache setelah citra sumber mati
+    
+    Lock tidak ditunggu (GC bisa memanggil callback saat thread ini memegang
+    lock, lihat _buang_entri_biner): entri dicatat lalu dibuang sekarang
+    jika lock bebas, jika tidak pada akses cache berikutnya.
+    """
+    _entri_mati_piramida.append((kunci, ref))
+    if _kunci_cache_piramida.acquire(blocking=False):
+        try:
+            _buang_entri_mati_piramida()
+        finally:
+            _kunci_cache_piramida.release()
+
+def _buang_entri_mati_piramida():
+    """Membuang entri yang dicatat callback weakref (lock harus dipegang)"""
+    while _entri_mati_piramida:
+        kunci, ref = _entri_mati_piramida.pop()
+        entri = _cache_piramida.get(kunci)
+        if entri is not None and entri[0] is ref:
+            del _cache_piramida[kunci]
+
+def piramida_tercache(image, level=5):
+    """
+    Piramida Laplacian citra dengan cache LRU
+    
+    Kunci cache adalah identitas objek array (divalidasi dengan weakref)
+    dan level, seperti binarisasi_tercache. Entri dihapus begitu citra
+    sumber tidak lagi direferensikan. Citra yang diubah in-place tidak
+    terdeteksi; panggil bersihkan_cache_piramida(). Setiap tingkat
+    bersifat read-only karena dipakai bersama.
+    
+    Args:
+        image: Citra uint8
+        level: Jumlah tingkat pengecilan
+        
+    Returns:
+        tuple: Tingkat piramida float32 dari resolusi penuh ke terkecil
+    """
+    kunci = (id(image), level)
+    with _kunci_cache_piramida:
+        _buang_entri_mati_piramida()
+        entri = _cache_piramida.get(kunci)
+        if entri is not None and entri[0]() is image:
+            _cache_piramida.move_to_end(kunci)
+            return entri[1]
+    
+    piramida = piramida_laplacian(image, level)
+    
+    try:
+        ref = weakref.ref(image, lambda r, k=kunci: _buang_entri_piramida(k, r))
+    except TypeError:
+        return piramida
+    
+    for tingkat in piramida:
+        tingkat.flags.writeable = False
+    with _kunci_cache_piramida:
+        _buang_entri_mati_piramida()
+        _cache_piramida[kunci] = (ref, piramida)
+        _cache_piramida.move_to_end(kunci)
+        while len(_cache_piramida) > UKURAN_CACHE_PIRAMIDA:
+            _cache_piramida.popitem(last=False)
+    return piramida
+
+def bersihkan_cache_piramida():
+    """Mengosongkan cache piramida"""
+    with _kunci_cache_piramida:
+        _cache_piramida.clear()
+        _entri_mati_piramida.clear()
+
 class OperasiBlending:
-    def __init__(self):
-        """Inisialisasi class"""
-        pass
+    def __init__(self, backend='float64', interpolasi=None, cache_resize=False):
+        """
+        Inisialisasi class
+        
+        Parameters:
+        - backend: Backend default blending_citra, salah satu BACKEND_BLENDING
+        - interpolasi: Flag interpolasi OpenCV untuk menyamakan ukuran citra B
+          (default: INTERPOLASI_DEFAULT normalisasi_ukuran)
+        - cache_resize: True untuk cache resize citra B (hanya untuk
+          overlay yang tidak diubah in-place, lihat samakan_ukuran)
+        """
+        if backend not in BACKEND_BLENDING:
+            raise ValueError(f"Backend blending tidak dikenal: {backend}")
+        self.backend = backend
+        self.interpolasi = interpolasi
+        self.cache_resize = cache_resize
     
     def dapatkan_citra_sample(self):
         """Mendapatkan citra sample untuk testing"""
         return muat_gambar_sample()
     
-    def blending_citra(self, img1, img2, alpha=0.5):
+    def blending_citra(self, img1, img2, alpha=0.5, backend=None):
         """
         Melakukan operasi blending pada dua citra
         
         Formula: Hasil = α × A + (1-α) × B
         
+        Backend:
+        - 'float64': referensi float64, hasil dipotong (truncate)
+        - 'fixed': integer uint16 dengan α dikuantisasi ke 1/256 dan
+          pembulatan ke terdekat; tanpa salinan float, diproses per tile
+        - 'opencv': cv2.addWeighted (pembulatan dan saturasi oleh OpenCV)
+        
         Parameters:
         - img1: Citra pertama (A)
         - img2: Citra kedua (B) 
-        - alpha: Faktor blending (0.0 - 1.0)
+        - alpha: Faktor blending (0.0 - 1.0). Di luar rentang, backend
+          'float64' dan 'opencv' mengekstrapolasi lalu membatasi hasil ke
+          0 - 255 (sama dengan sweep_blending presisi 'float32'); backend
+          'fixed' menolaknya dengan ValueError
+        - backend: Salah satu BACKEND_BLENDING (default: self.backend)
         
         Returns:
         - result: Citra hasil blending
         """
         
+        backend = backend or self.backend
+        if backend not in BACKEND_BLENDING:
+            raise ValueError(f"Backend blending tidak dikenal: {backend}")
+        if backend == 'fixed' and not 0 <= alpha <= 1:
+            raise ValueError(f"Alpha fixed-point harus 0.0 - 1.0: {alpha}")
+        
         # Pastikan kedua citra memiliki ukuran yang sama
-        if img1.shape != img2.shape:
-            img2 = cv2.resize(img2, (img1.shape[1], img1.shape[0]))
+        img2 = samakan_ukuran(img2, img1.shape, self.interpolasi, self.cache_resize)
+        
+        if backend == 'fixed':
+            return self._blending_fixed(img1, img2, alpha)
+        if backend == 'opencv':
+            return cv2.addWeighted(img1, alpha, img2, 1 - alpha, 0)
         
         # Konversi ke float untuk mencegah overflow
         img1_float = img1.astype(np.float64)
@@ -55,46 +297,300 @@ class OperasiBlending:
         
         return result
     
-    def hitung_statistik_blending(self, img1, img2, result, alpha):
+    def _blending_fixed(self, img1, img2, alpha):
+        """
+        Blending fixed-point: (A×w + B×(256-w) + 128) >> 8 dengan w = round(α×256)
+        
+        Akumulator uint16 cukup karena nilai maksimum 255×256 + 128 = 65408.
+        Gambar diproses per pita baris dengan dua buffer kerja yang dipakai
+        ulang, sehingga tidak ada array sementara seukuran gambar. Alpha
+        sudah divalidasi oleh blending_citra.
+        """
+        
+        bobot_a = np.uint16(round(alpha * 256))
+        bobot_b = np.uint16(256 - bobot_a)
+        
+        result = np.empty(img1.shape, dtype=np.uint8)
+        piksel_per_baris = max(1, img1[:1].size)
+        tinggi_tile = max(1, PIXEL_PER_TILE_BLENDING // piksel_per_baris)
+        kerja_a = np.empty((tinggi_tile,) + img1.shape[1:], dtype=np.uint16)
+        kerja_b = np.empty_like(kerja_a)
+        
+        for awal in range(0, img1.shape[0], tinggi_tile):
+            akhir = min(awal + tinggi_tile, img1.shape[0])
+            a, b = kerja_a[:akhir - awal], kerja_b[:akhir - awal]
+            np.multiply(img1[awal:akhir], bobot_a, out=a, dtype=np.uint16)
+            np.multiply(img2[awal:akhir], bobot_b, out=b, dtype=np.uint16)
+            np.add(a, b, out=a)
+            np.add(a, np.uint16(128), out=a)
+            np.right_shift(a, 8, out=a)
+            np.copyto(result[awal:akhir], a, casting='unsafe')
+        
+        return result
+    
+    def blending_piramida(self, img1, img2, mask=None, alpha=0.5, level=5):
+        """
+        Blending multi-resolusi (piramida Laplacian) untuk sambungan tanpa seam
+        
+        Piramida Laplacian A dan B serta piramida Gaussian mask dicampur per
+        tingkat: L = L_B + G × (L_A - L_B), lalu di-collapse. Frekuensi rendah
+        dicampur pada area lebar dan detail pada area sempit, sehingga
+        transisi mask tajam (mis. panorama) tidak meninggalkan seam.
+        
+        Piramida Laplacian A dan B diambil dari piramida_tercache, sedangkan
+        piramida mask selalu dibangun ulang (mask boleh diubah in-place):
+        mengganti mask atau alpha untuk pasangan citra yang sama hanya
+        menghitung ulang piramida mask dan pencampuran.
+        
+        Parameters:
+        - img1: Citra pertama (A), uint8
+        - img2: Citra kedua (B), uint8
+        - mask: Bobot A per pixel, uint8 0-255 atau float32 0-1 (default:
+          None = alpha skalar)
+        - alpha: Bobot A jika mask None
+        - level: Jumlah tingkat piramida (dibatasi ukuran citra)
+        
+        Returns:
+        - result: Citra hasil blending uint8
+        """
+        
+        # Dengan cache_resize, hasil resize B tetap identitasnya sehingga piramidanya ikut ter-cache
+        img2 = samakan_ukuran(img2, img1.shape, self.interpolasi, self.cache_resize)
+        if mask is not None and mask.shape[:2] != img1.shape[:2]:
+            raise ValueError("Ukuran mask harus sama dengan citra")
+        
+        level = max(0, min(level, int(np.log2(max(1, min(img1.shape[:2]))))))
+        channel = img1.shape[2] if img1.ndim == 3 else 1
+        pir_a = piramida_tercache(img1, level)
+        pir_b = piramida_tercache(img2, level)
+        pir_mask = None
+        if mask is not None:
+            pir_mask = piramida_gaussian(mask, level, channel)
+        
+        hasil = None
+        for i in range(level, -1, -1):
+            la, lb = pir_a[i], pir_b[i]
+            if pir_mask is None:
+                campur = cv2.addWeighted(la, alpha, lb, 1 - alpha, 0)
+            else:
+                campur = cv2.subtract(la, lb)
+                cv2.multiply(campur, pir_mask[i], dst=campur)
+                cv2.add(campur, lb, dst=campur)
+            
+            if hasil is None:
+                hasil = campur
+            else:
+                tinggi, lebar = la.shape[:2]
+                hasil = cv2.pyrUp(hasil, dstsize=(lebar, tinggi))
+                cv2.add(hasil, campur, dst=hasil)
+        
+        # Pembulatan ke terdekat dan saturasi ke uint8
+        cv2.max(hasil, 0, dst=hasil)
+        return cv2.convertScaleAbs(hasil)
+    
+    def sweep_blending(self, img1, img2, alphas, presisi='float32', salin=False):
+        """
+        Hasil blending untuk banyak alpha sekaligus (generator)
+        
+        Formula ditulis ulang menjadi Hasil = B + α × (A - B); B dan (A - B)
+        dihitung sekali, sehingga setiap frame hanya satu multiply-add ke
+        buffer yang dipakai ulang (ditambah konversi ke uint8).
+        
+        Parameters:
+        - img1: Citra pertama (A)
+        - img2: Citra kedua (B)
+        - alphas: Iterable faktor blending (boleh generator, panjang bebas)
+        - presisi: 'float32' (cv2.scaleAdd, dipotong seperti backend
+          'float64') atau 'fixed' (integer 1/256, identik dengan backend
+          'fixed' blending_citra; alpha harus 0.0 - 1.0)
+        - salin: True agar setiap hasil adalah array baru; jika False, hasil
+          hanya valid sampai iterasi berikutnya
+        
+        Returns:
+        - Generator (alpha, result): Faktor blending dan citra hasil uint8.
+          Presisi divalidasi saat pemanggilan, bukan saat iterasi pertama.
+        """
+        
+        if presisi not in ('float32', 'fixed'):
+            raise ValueError(f"Presisi tidak dikenal: {presisi}")
+        
+        img2 = samakan_ukuran(img2, img1.shape, self.interpolasi, self.cache_resize)
+        return self._sweep_blending(img1, img2, alphas, presisi, salin)
+    
+    def _sweep_blending(self, img1, img2, alphas, presisi, salin):
+        """Generator inti sweep_blending (img2 sudah disamakan ukurannya)"""
+        
+        result = np.empty(img1.shape, dtype=np.uint8)
+        
+        if presisi == 'float32':
+            dasar = img2.astype(np.float32)
+            selisih = cv2.subtract(img1, img2, dtype=cv2.CV_32F)
+            kerja = np.empty_like(dasar)
+            
+            for alpha in alphas:
+                cv2.scaleAdd(selisih, float(alpha), dasar, dst=kerja)
+                if not 0 <= alpha <= 1:
+                    np.clip(kerja, 0, 255, out=kerja)
+                # Konversi memotong (truncate) seperti blending_citra
+                np.copyto(result, kerja, casting='unsafe')
+                yield alpha, result.copy() if salin else result
+        else:
+            # Aritmatika uint16 modulo 2^16: B×256 + 128 + w×(A-B) selalu di
+            # [0, 65408] untuk 0 <= w <= 256, jadi hasil akhir eksak walau
+            # suku tengah negatif (+128 untuk pembulatan ke terdekat)
+            dasar = np.left_shift(img2.astype(np.uint16), 8)
+            dasar += np.uint16(128)
+            selisih = cv2.subtract(img1, img2, dtype=cv2.CV_16S).view(np.uint16)
+            kerja = np.empty_like(dasar)
+            
+            for alpha in alphas:
+                if not 0 <= alpha <= 1:
+                    raise ValueError("Alpha fixed-point harus 0.0 - 1.0")
+                np.multiply(selisih, np.uint16(round(alpha * 256)), out=kerja)
+                np.add(kerja, dasar, out=kerja)
+                # hasil >> 8 (tidak bergantung urutan byte host)
+                np.right_shift(kerja, 8, out=kerja)
+                np.copyto(result, kerja, casting='unsafe')
+                yield alpha, result.copy() if salin else result
+    
+    def cross_fade(self, img1, img2, jumlah_frame=120, presisi='float32', salin=False):
+        """
+        Generator frame cross-fade dari citra A ke citra B
+        
+        Parameters:
+        - img1, img2: Citra awal (A) dan akhir (B)
+        - jumlah_frame: Jumlah frame termasuk frame awal dan akhir
+        - presisi, salin: Lihat sweep_blending
+        
+        Yields:
+        - (alpha, frame): Alpha turun dari 1.0 ke 0.0
+        """
+        
+        return self.sweep_blending(img1, img2, np.linspace(1.0, 0.0, jumlah_frame).tolist(),
+                                   presisi, salin)
+    
+    def komposit_layer(self, kanvas, layers, tinggi_tile=None, workers=None, out=None):
+        """
+        Mengkomposit N layer ke kanvas secara berurutan (layer pertama paling bawah)
+        
+        Setiap layer: Hasil = D + a × (mode(D, S) - D) dengan D kanvas saat
+        ini, S pixel layer dan a = alpha mask × opacity. Mode:
+        - normal: S
+        - multiply: D × S / 255
+        - screen: 255 - (255 - D) × (255 - S) / 255
+        - difference: |D - S|
+        
+        Kanvas diproses per pita baris dengan akumulator float32 yang kecil,
+        paralel antar thread. Memori kerja dibatasi ukuran pita, sehingga
+        tumpukan puluhan layer besar (mis. np.memmap) tetap bisa diproses.
+        
+        Parameters:
+        - kanvas: Citra dasar uint8, atau tuple shape untuk kanvas hitam
+        - layers: List layer dari buat_layer
+        - tinggi_tile: Jumlah baris per pita (default: otomatis)
+        - workers: Jumlah thread (default: bawaan ThreadPoolExecutor, 1 = tanpa thread)
+        - out: Buffer uint8 hasil seukuran kanvas, boleh np.memmap (opsional)
+        
+        Returns:
+        - result: Citra hasil komposit uint8
+        """
+        
+        if isinstance(kanvas, tuple):
+            shape, kanvas = kanvas, None
+        else:
+            shape = kanvas.shape
+        
+        for layer in layers:
+            if layer['image'].ndim != len(shape) or layer['image'].shape[2:] != shape[2:]:
+                raise ValueError("Jumlah channel layer harus sama dengan kanvas")
+        
+        if out is None:
+            out = np.empty(shape, dtype=np.uint8)
+        elif out.shape != shape or out.dtype != np.uint8:
+            raise ValueError("Buffer out harus uint8 dengan ukuran kanvas")
+        
+        if tinggi_tile is None:
+            piksel_per_baris = max(1, int(np.prod(shape[1:])))
+            tinggi_tile = max(1, PIXEL_PER_TILE_BLENDING // piksel_per_baris)
+        
+        batas_tile = [(awal, min(awal + tinggi_tile, shape[0]))
+                      for awal in range(0, shape[0], tinggi_tile)]
+        
+        if len(batas_tile) == 1 or workers == 1:
+            for awal, akhir in batas_tile:
+                _komposit_tile(kanvas, layers, awal, akhir, out)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda b: _komposit_tile(kanvas, layers, b[0], b[1], out),
+                                  batas_tile))
+        
+        return out
+    
+    def hitung_statistik_blending(self, img1, img2, result, alpha, backend=None):
         """
         Menghitung statistik untuk operasi blending
         
+        Jika backend diberikan, 'Mean Error' dan 'Max Error' adalah selisih
+        absolut per pixel terhadap nilai eksak α × A + (1-α) × B yang belum
+        dibulatkan (dibatasi 0 - 255), sehingga pembulatan ke terdekat
+        ('fixed', 'opencv') bernilai ~0.25 dan pemotongan ('float64') ~0.5.
+        Tanpa backend, 'Mean Error' adalah selisih mean hasil terhadap
+        α × mean A + (1-α) × mean B.
+        
         Parameters:
-        - img1, img2: Citra input
+        - img1, img2: Citra input (B disamakan ukurannya seperti blending_citra)
         - result: Citra hasil blending
         - alpha: Faktor blending yang digunakan
+        - backend: Backend yang menghasilkan result (opsional, dicatat di statistik)
         
         Returns:
         - stats_asli: Statistik citra input
         - stats_hasil: Statistik citra hasil
         """
         
+        # Statistik dihitung pada B yang sudah disamakan ukurannya
+        img2 = samakan_ukuran(img2, img1.shape, self.interpolasi, self.cache_resize)
+        
+        # Satu lintasan per citra untuk semua statistik
+        st1 = hitung_statistik_satu_lintasan(img1)
+        st2 = hitung_statistik_satu_lintasan(img2)
+        st_hasil = hitung_statistik_satu_lintasan(result)
+        
         stats_asli = {
-            'Mean A': f"{np.mean(img1):.2f}",
-            'Mean B': f"{np.mean(img2):.2f}",
-            'Std A': f"{np.std(img1):.2f}",
-            'Std B': f"{np.std(img2):.2f}",
+            'Mean A': f"{st1['mean']:.2f}",
+            'Mean B': f"{st2['mean']:.2f}",
+            'Std A': f"{st1['std']:.2f}",
+            'Std B': f"{st2['std']:.2f}",
             'Alpha (α)': f"{alpha:.1f}",
             'Beta (1-α)': f"{1-alpha:.1f}"
         }
         
         # Verifikasi linear combination
-        expected_mean = alpha * np.mean(img1) + (1-alpha) * np.mean(img2)
-        actual_mean = np.mean(result)
+        expected_mean = alpha * st1['mean'] + (1-alpha) * st2['mean']
+        actual_mean = st_hasil['mean']
         
         stats_hasil = {
             'Mean Result': f"{actual_mean:.2f}",
             'Expected Mean': f"{expected_mean:.2f}",
             'Mean Error': f"{abs(actual_mean - expected_mean):.4f}",
-            'Std Dev': f"{np.std(result):.2f}",
-            'Max': f"{np.max(result)}",
-            'Min': f"{np.min(result)}",
+            'Std Dev': f"{st_hasil['std']:.2f}",
+            'Max': f"{st_hasil['max']}",
+            'Min': f"{st_hasil['min']}",
             'Blend Ratio': f"{int(alpha*100)}% A + {int((1-alpha)*100)}% B"
         }
+        if backend is not None:
+            # Akurasi per pixel terhadap nilai eksak yang belum dibulatkan
+            eksak = cv2.addWeighted(img1, alpha, img2, 1 - alpha, 0, dtype=cv2.CV_32F)
+            np.clip(eksak, 0, 255, out=eksak)
+            error = cv2.absdiff(result.astype(np.float32), eksak)
+            stats_hasil['Mean Error'] = f"{float(error.mean()):.4f}"
+            stats_hasil['Max Error'] = f"{float(error.max()):.4f}"
+            stats_hasil['Backend'] = backend
         
         return stats_asli, stats_hasil
     
-    def demo_blending_alpha(self, img1, img2, alpha, nama_operasi, kategori):
+    def demo_blending_alpha(self, img1, img2, alpha, nama_operasi, kategori, penulis=None,
+                            result=None):
         """
         Demo operasi blending dengan alpha tertentu
         
@@ -103,18 +599,22 @@ class OperasiBlending:
         - alpha: Faktor blending
         - nama_operasi: Nama untuk file output
         - kategori: Kategori folder
+        - penulis: PenulisLatarBelakang opsional untuk menyimpan di latar belakang
+        - result: Hasil blending yang sudah dihitung (mis. dari sweep_blending)
         """
         
         print(f"  🎨 Blending dengan α={alpha} ({int(alpha*100)}% A + {int((1-alpha)*100)}% B)")
         
         # Operasi blending
-        result = self.blending_citra(img1, img2, alpha)
+        if result is None:
+            result = self.blending_citra(img1, img2, alpha)
         
         # Hitung statistik
         stats_asli, stats_hasil = self.hitung_statistik_blending(img1, img2, result, alpha)
         
         # Simpan hasil perbandingan
-        simpan_perbandingan_dengan_stats(
+        simpan = penulis.kirim if penulis is not None else simpan_perbandingan_dengan_stats
+        simpan(
             img1, result, 
             nama_operasi,
             f"Citra A (Weight={alpha:.1f})", 
@@ -123,12 +623,13 @@ class OperasiBlending:
             "hasil_pengolahan", kategori
         )
     
-    def demo_blending(self, kategori="4_blending_citra"):
+    def demo_blending(self, kategori="4_blending_citra", penulis=None):
         """
         Demo lengkap operasi blending dengan berbagai nilai alpha
         
         Parameters:
         - kategori: Nama folder untuk menyimpan hasil
+        - penulis: PenulisLatarBelakang opsional untuk menyimpan di latar belakang
         """
         
         print("🔄 Demo Operasi Blending...")
@@ -143,9 +644,11 @@ class OperasiBlending:
             (0.7, "blend_70")
         ]
         
-        # Demo setiap konfigurasi alpha
-        for alpha, nama in alpha_configs:
-            self.demo_blending_alpha(img1, img2, alpha, nama, kategori)
+        # Demo setiap konfigurasi alpha; B dan (A - B) dihitung sekali untuk semua alpha
+        alphas = [alpha for alpha, _ in alpha_configs]
+        hasil_sweep = self.sweep_blending(img1, img2, alphas, salin=True)
+        for (alpha, result), (_, nama) in zip(hasil_sweep, alpha_configs):
+            self.demo_blending_alpha(img1, img2, alpha, nama, kategori, penulis, result)
         
         print("✅ Demo blending selesai!")
         print(f"💾 Disimpan: {kategori}/ (9 file)")
@@ -3,8 +3,20 @@ Module untuk Operasi Boolean
 Berisi semua fungsi terkait operasi boolean pada gambar biner
 """
 
+import ast
 import cv2
 import numpy as np
+import weakref
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from statistik_citra import hitung_nonzero, hitung_histogram, jumlah_di_atas_threshold
+
+# Parameter default mode adaptif
+UKURAN_BLOK_ADAPTIF = 51
+C_ADAPTIF = 5
+UKURAN_TILE_ADAPTIF = 1 << 20
 
 def binarisasi_gambar(image, threshold=127):
     """
@@ -12,33 +24,346 @@ def binarisasi_gambar(image, threshold=127):
     
     Args:
         image: Array numpy gambar grayscale
-        threshold: Nilai threshold (default: 127)
+        threshold: Nilai threshold (default: 127), 'otsu' untuk threshold
+                   global otomatis, atau 'adaptif' untuk threshold lokal
+                   (lihat binarisasi_adaptif)
         
     Returns:
         tuple: (gambar_biner, threshold_used)
     """
     try:
+        if threshold == 'otsu':
+            nilai, binary = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+            return binary, int(nilai)
+        if threshold == 'adaptif':
+            return binarisasi_adaptif(image)
+        
         _, binary = cv2.threshold(image, threshold, 255, cv2.THRESH_BINARY)
         return binary, threshold
     except Exception as e:
         print(f"❌ Error binarisasi: {e}")
         return None, threshold
 
-def operasi_and(img1, img2, threshold=127):
+def _batas_baris_integral(lebar, ukuran_blok):
+    """Tinggi tile maksimum agar integral int32 (termasuk halo) tidak overflow"""
+    if 2 * 256 * ukuran_blok * ukuran_blok >= 2**31:
+        return 0
+    return (2**31 - 1) // (255 * (lebar + ukuran_blok)) - ukuran_blok
+
+def _adaptif_tile(image, awal, akhir, ukuran_blok, lut_kanan, out):
+    """Threshold adaptif untuk baris [awal, akhir) menggunakan integral image"""
+    tinggi = image.shape[0]
+    r = ukuran_blok // 2
+    
+    # Halo r baris di atas/bawah, border replicate hanya di tepi gambar
+    atas, bawah = max(0, awal - r), min(tinggi, akhir + r)
+    diperluas = cv2.copyMakeBorder(np.ascontiguousarray(image[atas:bawah]),
+                                   r - (awal - atas), r - (bawah - akhir), r, r,
+                                   cv2.BORDER_REPLICATE)
+    integral = cv2.integral(diperluas, sdepth=cv2.CV_32S)
+    
+    # Jumlah jendela k x k dari 4 titik integral, biaya tidak bergantung k
+    k = ukuran_blok
+    jumlah = cv2.subtract(integral[k:, k:], integral[:-k, k:])
+    cv2.subtract(jumlah, integral[k:, :-k], dst=jumlah)
+    cv2.add(jumlah, integral[:-k, :-k], dst=jumlah)
+    cv2.add(jumlah, jumlah, dst=jumlah)
+    
+    # Ruas kanan perbandingan hanya bergantung pada nilai pixel (LUT)
+    kanan = cv2.LUT(np.ascontiguousarray(image[awal:akhir]), lut_kanan)
+    cv2.compare(jumlah, kanan, cv2.CMP_LT, dst=out[awal:akhir])
+
+def binarisasi_adaptif(image, ukuran_blok=UKURAN_BLOK_ADAPTIF, c=C_ADAPTIF,
+                       tinggi_tile=None, workers=None):
+    """
+    Threshold lokal: pixel putih jika > mean jendela ukuran_blok x ukuran_blok - C
+    
+    Mean lokal dihitung dari integral image sehingga biayanya tidak
+    bergantung pada ukuran jendela. Gambar dibagi menjadi pita baris
+    (dengan halo) yang diproses paralel oleh thread. Hasil setara dengan
+    cv2.adaptiveThreshold(ADAPTIVE_THRESH_MEAN_C, BORDER_REPLICATE).
+    
+    Args:
+        image: Array numpy gambar grayscale uint8
+        ukuran_blok: Ukuran jendela ganjil (default: 51)
+        c: Konstanta pengurang mean (default: 5)
+        tinggi_tile: Jumlah baris per tile (default: otomatis)
+        workers: Jumlah thread (default: bawaan ThreadPoolExecutor, 1 = tanpa thread)
+        
+    Returns:
+        tuple: (gambar_biner, deskripsi_threshold)
+    """
+    try:
+        if ukuran_blok < 3 or ukuran_blok % 2 == 0:
+            raise ValueError("Ukuran blok harus ganjil dan >= 3")
+        
+        tinggi, lebar = image.shape
+        batas = _batas_baris_integral(lebar, ukuran_blok)
+        if batas < 1:
+            raise ValueError("Gambar terlalu lebar untuk integral int32")
+        if tinggi_tile is None:
+            # Buffer int32 per tile ~1 MB agar tetap di cache, minimal
+            # setinggi jendela agar overhead halo terbatas
+            tinggi_tile = max(ukuran_blok, UKURAN_TILE_ADAPTIF // (4 * lebar))
+        tinggi_tile = max(1, min(tinggi_tile, batas))
+        
+        # cv2.adaptiveThreshold: putih jika src - round(jumlah/luas) > -ceil(C).
+        # Luas ganjil (tidak ada pembulatan .5), sehingga ekuivalen dengan
+        # 2*jumlah < luas*(2*src + 2*ceil(C) - 1) tanpa pembagian
+        luas = ukuran_blok * ukuran_blok
+        lut_kanan = (luas * (2 * np.arange(256, dtype=np.int64) + 2 * int(np.ceil(c)) - 1))
+        lut_kanan = np.clip(lut_kanan, -2**31, 2**31 - 1).astype(np.int32)
+        
+        out = np.empty((tinggi, lebar), dtype=np.uint8)
+        batas_tile = [(awal, min(awal + tinggi_tile, tinggi))
+                      for awal in range(0, tinggi, tinggi_tile)]
+        
+        if len(batas_tile) == 1 or workers == 1:
+            for awal, akhir in batas_tile:
+                _adaptif_tile(image, awal, akhir, ukuran_blok, lut_kanan, out)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda b: _adaptif_tile(image, b[0], b[1], ukuran_blok, lut_kanan, out),
+                                  batas_tile))
+        
+        return out, f'Adaptif {ukuran_blok}x{ukuran_blok}, C={c}'
+        
+    except Exception as e:
+        print(f"❌ Error binarisasi adaptif: {e}")
+        return None, 'adaptif'
+
+def format_threshold(thresholds):
+    """
+    Menggabungkan threshold yang dipakai beberapa input untuk statistik
+    
+    Args:
+        thresholds: Dict {nama_input: threshold_used}
+        
+    Returns:
+        Threshold tunggal jika semua sama, jika tidak string "A=.., B=.."
+    """
+    nilai = list(thresholds.values())
+    if all(t == nilai[0] for t in nilai):
+        return nilai[0]
+    return ', '.join(f'{nama}={t}' for nama, t in thresholds.items())
+
+# Cache LRU hasil binarisasi, kunci: (identitas array, threshold)
+UKURAN_CACHE_BINER = 16
+_cache_biner = OrderedDict()
+_kunci_cache_biner = threading.Lock()
+_entri_mati_biner = []
+
+def _buang_entri_biner(kunci, ref):
+    """
+    Callback weakref: hapus entri cache setelah gambar sumber mati
+    
+    GC bisa memanggil callback kapan saja, termasuk saat thread ini sedang
+    memegang _kunci_cache_biner, jadi lock tidak ditunggu: entri dicatat
+    lalu dibuang sekarang jika lock bebas, jika tidak pada akses cache
+    berikutnya.
+    """
+    _entri_mati_biner.append((kunci, ref))
+    if _kunci_cache_biner.acquire(blocking=False):
+        try:
+            _buang_entri_mati_biner()
+        finally:
+            _kunci_cache_biner.release()
+
+def _buang_entri_mati_biner():
+    """Membuang entri yang dicatat callback weakref (lock harus dipegang)"""
+    while _entri_mati_biner:
+        kunci, ref = _entri_mati_biner.pop()
+        entri = _cache_biner.get(kunci)
+        if entri is not None and entri[0] is ref:
+            del _cache_biner[kunci]
+
+def binarisasi_tercache(image, threshold=127):
+    """
+    Binarisasi dengan cache LRU agar gambar yang sama tidak di-threshold ulang
+    
+    Kunci cache adalah identitas objek array (divalidasi dengan weakref,
+    sehingga id yang dipakai ulang tidak salah cocok) dan threshold.
+    Entri dihapus begitu gambar sumber tidak lagi direferensikan.
+    Gambar yang diubah in-place TIDAK terdeteksi, jadi cache ini hanya
+    untuk gambar yang tidak berubah (opt-in lewat cache=True pada operasi
+    boolean); panggil bersihkan_cache_biner() setelah memodifikasi gambar
+    input. Hasil bersifat read-only karena dipakai bersama.
+    
+    Args:
+        image: Array numpy gambar grayscale
+        threshold: Nilai threshold (default: 127)
+        
+    Returns:
+        tuple: (gambar_biner, threshold_used)
+    """
+    kunci = (id(image), threshold)
+    with _kunci_cache_biner:
+        _buang_entri_mati_biner()
+        entri = _cache_biner.get(kunci)
+        if entri is not None and entri[0]() is image:
+            _cache_biner.move_to_end(kunci)
+            return entri[1], entri[2]
+    
+    binary, threshold_used = binarisasi_gambar(image, threshold)
+    if binary is None:
+        return None, threshold_used
+    
+    try:
+        ref = weakref.ref(image, lambda r, k=kunci: _buang_entri_biner(k, r))
+    except TypeError:
+        # Objek tanpa dukungan weakref tidak di-cache
+        return binary, threshold_used
+    
+    binary.flags.writeable = False
+    with _kunci_cache_biner:
+        _buang_entri_mati_biner()
+        _cache_biner[kunci] = (ref, binary, threshold_used)
+        _cache_biner.move_to_end(kunci)
+        while len(_cache_biner) > UKURAN_CACHE_BINER:
+            _cache_biner.popitem(last=False)
+    return binary, threshold_used
+
+def bersihkan_cache_biner():
+    """Mengosongkan cache binarisasi"""
+    with _kunci_cache_biner:
+        _cache_biner.clear()
+        _entri_mati_biner.clear()
+
+def _siapkan_biner(image, threshold, sudah_biner, cache=False):
+    """
+    Mengembalikan (gambar_biner, threshold_used): apa adanya jika sudah
+    biner, dari cache jika cache=True, jika tidak dibinarisasi ulang
+    """
+    if sudah_biner:
+        return image, threshold
+    if cache:
+        return binarisasi_tercache(image, threshold)
+    return binarisasi_gambar(image, threshold)
+
+# Popcount per byte untuk NumPy lama yang belum punya np.bitwise_count
+_POPCOUNT_BYTE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+class MaskBit:
+    """
+    Gambar biner terkompresi 1 bit per pixel (np.packbits, dibaca sebagai uint64)
+    
+    Operasi &, |, ^, ~ dikerjakan per word 64-bit dan jumlah pixel putih
+    dihitung dengan popcount, sehingga memori dan bandwidth 8x lebih kecil
+    dibanding mask uint8 0/255. Konversi dari/ke format 0/255 lossless.
+    Bit padding di akhir word selalu dijaga bernilai 0.
+    """
+    
+    __slots__ = ('words', 'shape')
+    
+    def __init__(self, words, shape):
+        self.words = words
+        self.shape = tuple(shape)
+    
+    @classmethod
+    def dari_bool(cls, bits):
+        """Membuat MaskBit dari array boolean"""
+        jumlah_bit = bits.size
+        buffer = np.zeros(-(-jumlah_bit // 64) * 8, dtype=np.uint8)
+        packed = np.packbits(bits.ravel())
+        buffer[:packed.size] = packed
+        return cls(buffer.view(np.uint64), bits.shape)
+    
+    @classmethod
+    def dari_biner(cls, binary_image):
+        """Membuat MaskBit dari gambar biner 0/255 (pixel bukan nol = putih)"""
+        return cls.dari_bool(binary_image != 0)
+    
+    @classmethod
+    def dari_gambar(cls, image, threshold=127):
+        """Binarisasi langsung ke MaskBit (pixel > threshold = putih)"""
+        return cls.dari_bool(image > threshold)
+    
+    def ke_biner(self):
+        """Konversi kembali ke gambar biner uint8 0/255"""
+        jumlah_bit = int(np.prod(self.shape))
+        bits = np.unpackbits(self.words.view(np.uint8), count=jumlah_bit)
+        return (bits * np.uint8(255)).reshape(self.shape)
+    
+    def _tutup_padding(self):
+        """Mengosongkan bit padding setelah pixel terakhir"""
+        jumlah_bit = int(np.prod(self.shape))
+        data = self.words.view(np.uint8)
+        byte_penuh, sisa = divmod(jumlah_bit, 8)
+        if sisa:
+            data[byte_penuh] &= (0xFF << (8 - sisa)) & 0xFF
+            byte_penuh += 1
+        data[byte_penuh:] = 0
+        return self
+    
+    def _cek_pasangan(self, other):
+        if not isinstance(other, MaskBit):
+            return NotImplemented
+        if other.shape != self.shape:
+            raise ValueError("Ukuran mask harus sama")
+        return None
+    
+    def __and__(self, other):
+        cek = self._cek_pasangan(other)
+        return cek if cek is not None else MaskBit(self.words & other.words, self.shape)
+    
+    def __or__(self, other):
+        cek = self._cek_pasangan(other)
+        return cek if cek is not None else MaskBit(self.words | other.words, self.shape)
+    
+    def __xor__(self, other):
+        cek = self._cek_pasangan(other)
+        return cek if cek is not None else MaskBit(self.words ^ other.words, self.shape)
+    
+    def __invert__(self):
+        return MaskBit(~self.words, self.shape)._tutup_padding()
+    
+    def jumlah_putih(self):
+        """Jumlah pixel putih dengan popcount per word"""
+        if hasattr(np, 'bitwise_count'):
+            return int(np.bitwise_count(self.words).sum(dtype=np.int64))
+        return int(_POPCOUNT_BYTE[self.words.view(np.uint8)].sum(dtype=np.int64))
+    
+    @property
+    def nbytes(self):
+        """Ukuran data mask dalam byte"""
+        return self.words.nbytes
+
+def binarisasi_gambar_bit(image, threshold=127):
+    """
+    Mengkonversi gambar grayscale menjadi MaskBit (1 bit per pixel)
+    
+    Args:
+        image: Array numpy gambar grayscale
+        threshold: Nilai threshold (default: 127)
+        
+    Returns:
+        tuple: (mask_bit, threshold_used)
+    """
+    try:
+        return MaskBit.dari_gambar(image, threshold), threshold
+    except Exception as e:
+        print(f"❌ Error binarisasi bit: {e}")
+        return None, threshold
+
+def operasi_and(img1, img2, threshold=127, sudah_biner=False, cache=False):
     """
     Operasi boolean AND pada dua gambar
     
     Args:
         img1, img2: Array numpy gambar grayscale
-        threshold: Threshold untuk binarisasi
+        threshold: Threshold untuk binarisasi (angka, 'otsu' atau 'adaptif')
+        sudah_biner: True jika img1/img2 sudah berupa gambar biner 0/255
+        cache: True untuk memakai binarisasi_tercache (hanya untuk input yang
+               tidak diubah in-place)
         
     Returns:
         tuple: (hasil_and, stats_dict)
     """
     try:
-        # Binarisasi gambar
-        binary1, _ = binarisasi_gambar(img1, threshold)
-        binary2, _ = binarisasi_gambar(img2, threshold)
+        # Binarisasi gambar (pakai ulang lewat cache jika diminta)
+        binary1, threshold1 = _siapkan_biner(img1, threshold, sudah_biner, cache)
+        binary2, threshold2 = _siapkan_biner(img2, threshold, sudah_biner, cache)
+        threshold_used = format_threshold({'A': threshold1, 'B': threshold2})
         
         if binary1 is None or binary2 is None:
             return None, None
@@ -47,7 +372,7 @@ def operasi_and(img1, img2, threshold=127):
         hasil = cv2.bitwise_and(binary1, binary2)
         
         # Statistik
-        stats = hitung_statistik_biner(hasil, "A AND B", threshold)
+        stats = hitung_statistik_biner(hasil, "A AND B", threshold_used)
         stats['Logika'] = 'Irisan (∩)'
         
         return hasil, stats
@@ -56,21 +381,25 @@ def operasi_and(img1, img2, threshold=127):
         print(f"❌ Error operasi AND: {e}")
         return None, None
 
-def operasi_or(img1, img2, threshold=127):
+def operasi_or(img1, img2, threshold=127, sudah_biner=False, cache=False):
     """
     Operasi boolean OR pada dua gambar
     
     Args:
         img1, img2: Array numpy gambar grayscale
-        threshold: Threshold untuk binarisasi
+        threshold: Threshold untuk binarisasi (angka, 'otsu' atau 'adaptif')
+        sudah_biner: True jika img1/img2 sudah berupa gambar biner 0/255
+        cache: True untuk memakai binarisasi_tercache (hanya untuk input yang
+               tidak diubah in-place)
         
     Returns:
         tuple: (hasil_or, stats_dict)
     """
     try:
-        # Binarisasi gambar
-        binary1, _ = binarisasi_gambar(img1, threshold)
-        binary2, _ = binarisasi_gambar(img2, threshold)
+        # Binarisasi gambar (pakai ulang lewat cache jika diminta)
+        binary1, threshold1 = _siapkan_biner(img1, threshold, sudah_biner, cache)
+        binary2, threshold2 = _siapkan_biner(img2, threshold, sudah_biner, cache)
+        threshold_used = format_threshold({'A': threshold1, 'B': threshold2})
         
         if binary1 is None or binary2 is None:
             return None, None
@@ -79,7 +408,7 @@ def operasi_or(img1, img2, threshold=127):
         hasil = cv2.bitwise_or(binary1, binary2)
         
         # Statistik
-        stats = hitung_statistik_biner(hasil, "A OR B", threshold)
+        stats = hitung_statistik_biner(hasil, "A OR B", threshold_used)
         stats['Logika'] = 'Gabungan (∪)'
         
         return hasil, stats
@@ -88,21 +417,25 @@ def operasi_or(img1, img2, threshold=127):
         print(f"❌ Error operasi OR: {e}")
         return None, None
 
-def operasi_xor(img1, img2, threshold=127):
+def operasi_xor(img1, img2, threshold=127, sudah_biner=False, cache=False):
     """
     Operasi boolean XOR pada dua gambar
     
     Args:
         img1, img2: Array numpy gambar grayscale
-        threshold: Threshold untuk binarisasi
+        threshold: Threshold untuk binarisasi (angka, 'otsu' atau 'adaptif')
+        sudah_biner: True jika img1/img2 sudah berupa gambar biner 0/255
+        cache: True untuk memakai binarisasi_tercache (hanya untuk input yang
+               tidak diubah in-place)
         
     Returns:
         tuple: (hasil_xor, stats_dict)
     """
     try:
-        # Binarisasi gambar
-        binary1, _ = binarisasi_gambar(img1, threshold)
-        binary2, _ = binarisasi_gambar(img2, threshold)
+        # Binarisasi gambar (pakai ulang lewat cache jika diminta)
+        binary1, threshold1 = _siapkan_biner(img1, threshold, sudah_biner, cache)
+        binary2, threshold2 = _siapkan_biner(img2, threshold, sudah_biner, cache)
+        threshold_used = format_threshold({'A': threshold1, 'B': threshold2})
         
         if binary1 is None or binary2 is None:
             return None, None
@@ -111,7 +444,7 @@ def operasi_xor(img1, img2, threshold=127):
         hasil = cv2.bitwise_xor(binary1, binary2)
         
         # Statistik
-        stats = hitung_statistik_biner(hasil, "A XOR B", threshold)
+        stats = hitung_statistik_biner(hasil, "A XOR B", threshold_used)
         stats['Logika'] = 'Selisih Simetris (⊕)'
         
         return hasil, stats
@@ -120,20 +453,23 @@ def operasi_xor(img1, img2, threshold=127):
         print(f"❌ Error operasi XOR: {e}")
         return None, None
 
-def operasi_not(img1, threshold=127):
+def operasi_not(img1, threshold=127, sudah_biner=False, cache=False):
     """
     Operasi boolean NOT pada gambar
     
     Args:
         img1: Array numpy gambar grayscale
-        threshold: Threshold untuk binarisasi
+        threshold: Threshold untuk binarisasi (angka, 'otsu' atau 'adaptif')
+        sudah_biner: True jika img1 sudah berupa gambar biner 0/255
+        cache: True untuk memakai binarisasi_tercache (hanya untuk input yang
+               tidak diubah in-place)
         
     Returns:
         tuple: (hasil_not, stats_dict)
     """
     try:
-        # Binarisasi gambar
-        binary1, _ = binarisasi_gambar(img1, threshold)
+        # Binarisasi gambar (pakai ulang lewat cache jika diminta)
+        binary1, threshold_used = _siapkan_biner(img1, threshold, sudah_biner, cache)
         
         if binary1 is None:
             return None, None
@@ -142,7 +478,7 @@ def operasi_not(img1, threshold=127):
         hasil = cv2.bitwise_not(binary1)
         
         # Statistik
-        stats = hitung_statistik_biner(hasil, "NOT A", threshold)
+        stats = hitung_statistik_biner(hasil, "NOT A", threshold_used)
         stats['Logika'] = 'Komplemen (¬)'
         
         return hasil, stats
@@ -156,7 +492,7 @@ def hitung_statistik_biner(binary_image, operation_name="", threshold=127):
     Menghitung statistik untuk gambar biner
     
     Args:
-        binary_image: Array numpy gambar biner
+        binary_image: Array numpy gambar biner atau MaskBit
         operation_name: Nama operasi
         threshold: Nilai threshold yang digunakan
         
@@ -164,29 +500,271 @@ def hitung_statistik_biner(binary_image, operation_name="", threshold=127):
         dict: Dictionary statistik
     """
     try:
-        white_pixels = np.count_nonzero(binary_image)
-        total_pixels = binary_image.size
-        black_pixels = total_pixels - white_pixels
-        
-        return {
-            'Pixel Putih': white_pixels,
-            'Pixel Hitam': black_pixels,
-            'Persentase Putih': (white_pixels / total_pixels) * 100,
-            'Threshold': f'{threshold}/255',
-            'Operasi': operation_name,
-            'Ukuran': f'{binary_image.shape[1]}x{binary_image.shape[0]}'
-        }
+        if isinstance(binary_image, MaskBit):
+            white_pixels = binary_image.jumlah_putih()
+        else:
+            white_pixels = hitung_nonzero(binary_image)
+        return statistik_biner_dari_jumlah(white_pixels, binary_image.shape,
+                                           operation_name, threshold)
     except Exception as e:
         print(f"❌ Error menghitung statistik biner: {e}")
         return {}
 
+def statistik_biner_dari_jumlah(white_pixels, shape, operation_name="", threshold=127):
+    """
+    Menyusun statistik gambar biner dari jumlah pixel putih yang sudah dihitung
+    
+    Args:
+        white_pixels: Jumlah pixel putih
+        shape: Ukuran gambar (tinggi, lebar)
+        operation_name: Nama operasi
+        threshold: Nilai threshold yang digunakan
+        
+    Returns:
+        dict: Dictionary statistik
+    """
+    white_pixels = int(white_pixels)
+    total_pixels = int(shape[0]) * int(shape[1])
+    black_pixels = total_pixels - white_pixels
+    
+    return {
+        'Pixel Putih': white_pixels,
+        'Pixel Hitam': black_pixels,
+        'Persentase Putih': (white_pixels / total_pixels) * 100,
+        'Threshold': f'{threshold}/255' if not isinstance(threshold, str) else threshold,
+        'Operasi': operation_name,
+        'Ukuran': f'{shape[1]}x{shape[0]}'
+    }
+
+def sweep_threshold_biner(image, thresholds=range(256), materialisasi=()):
+    """
+    Statistik binarisasi untuk banyak threshold dari satu histogram
+    
+    Histogram dihitung sekali; jumlah pixel putih setiap threshold
+    diturunkan darinya dalam O(256). Mask hanya dibuat untuk threshold
+    pada `materialisasi`.
+    
+    Args:
+        image: Array numpy gambar grayscale uint8
+        thresholds: Threshold yang dievaluasi (default: 0-255)
+        materialisasi: Threshold yang masknya ikut dikembalikan
+        
+    Returns:
+        tuple: (dict threshold: mask, dict threshold: stats_dict)
+    """
+    try:
+        thresholds = list(thresholds)
+        jumlah = jumlah_di_atas_threshold(hitung_histogram(image), thresholds)
+        stats = {
+            t: statistik_biner_dari_jumlah(n, image.shape, f"Binary (T={t})", t)
+            for t, n in zip(thresholds, jumlah)
+        }
+        masks = {t: binarisasi_gambar(image, t)[0] for t in materialisasi}
+        return masks, stats
+        
+    except Exception as e:
+        print(f"❌ Error sweep threshold: {e}")
+        return None, None
+
+# Target ukuran blok per buffer (byte) agar buffer kerja tetap di cache L2
+UKURAN_BLOK_EKSPRESI = 1 << 18
+
+_OPERATOR_EKSPRESI = {ast.BitAnd: 'and', ast.BitOr: 'or', ast.BitXor: 'xor'}
+
+# Ekspresi untuk empat operasi dasar: (ekspresi, nama operasi, logika)
+EKSPRESI_DASAR = {
+    'and': ('A & B', "A AND B", 'Irisan (∩)'),
+    'or': ('A | B', "A OR B", 'Gabungan (∪)'),
+    'xor': ('A ^ B', "A XOR B", 'Selisih Simetris (⊕)'),
+    'not': ('~A', "NOT A", 'Komplemen (¬)')
+}
+
+@lru_cache(maxsize=64)
+def kompilasi_ekspresi(daftar_ekspresi):
+    """
+    Mengkompilasi tuple ekspresi boolean menjadi satu program bersama
+    
+    Ekspresi memakai sintaks Python: &, |, ^, ~ dan tanda kurung, dengan
+    nama variabel sebagai input (misalnya '(A & ~B) | C'). Subekspresi yang
+    sama, termasuk antar ekspresi, hanya dihitung sekali. Hasil di-cache
+    sehingga kompilasi hanya terjadi sekali per kombinasi ekspresi.
+    
+    Args:
+        daftar_ekspresi: Tuple string ekspresi
+        
+    Returns:
+        tuple: (variabel, instruksi, akar) dengan instruksi berupa tuple
+               ('var', nama) / ('not', i) / (op, i, j) yang merujuk index
+               instruksi sebelumnya, dan akar index hasil tiap ekspresi
+    """
+    slot = {}
+    instruksi = []
+    variabel = []
+    
+    def tambah(kunci):
+        if kunci not in slot:
+            slot[kunci] = len(instruksi)
+            instruksi.append(kunci)
+        return slot[kunci]
+    
+    def kunjungi(node):
+        if isinstance(node, ast.Name):
+            if node.id not in variabel:
+                variabel.append(node.id)
+            return tambah(('var', node.id))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Invert):
+            return tambah(('not', kunjungi(node.operand)))
+        if isinstance(node, ast.BinOp) and type(node.op) in _OPERATOR_EKSPRESI:
+            # Semua operator komutatif: urutkan operand agar A & B == B & A
+            kiri, kanan = sorted((kunjungi(node.left), kunjungi(node.right)))
+            return tambah((_OPERATOR_EKSPRESI[type(node.op)], kiri, kanan))
+        raise ValueError(f"Ekspresi tidak didukung: {ast.unparse(node)}")
+    
+    akar = tuple(kunjungi(ast.parse(e, mode='eval').body) for e in daftar_ekspresi)
+    return tuple(variabel), tuple(instruksi), akar
+
+def evaluasi_ekspresi_boolean(ekspresi, gambar, threshold=127, sudah_biner=False,
+                              simpan=None, tinggi_blok=None):
+    """
+    Mengevaluasi beberapa ekspresi boolean sekaligus dalam satu lintasan berblok
+    
+    Gambar diproses per blok baris: binarisasi, semua operasi dan
+    penghitungan pixel putih dikerjakan pada buffer seukuran blok yang
+    dipakai ulang, sehingga hanya mask yang diminta yang dialokasikan
+    seukuran gambar penuh.
+    
+    Args:
+        ekspresi: Dict {nama_hasil: string ekspresi}, misalnya {'x': '(A & ~B) | C'}
+        gambar: Dict {nama_variabel: array gambar grayscale}
+        threshold: Threshold untuk binarisasi (angka, 'otsu' atau 'adaptif')
+        sudah_biner: True jika semua input sudah berupa gambar biner 0/255
+        simpan: Nama hasil yang masknya dikembalikan (default: semua);
+                hasil lain hanya dihitung statistiknya
+        tinggi_blok: Jumlah baris per blok (default: dari UKURAN_BLOK_EKSPRESI)
+        
+    Returns:
+        tuple: (dict nama_hasil: mask, dict nama_hasil: stats_dict)
+    """
+    try:
+        nama_hasil = list(ekspresi)
+        variabel, instruksi, akar = kompilasi_ekspresi(tuple(ekspresi[n] for n in nama_hasil))
+        
+        hilang = [v for v in variabel if v not in gambar]
+        if hilang:
+            raise ValueError(f"Input tidak ditemukan: {hilang}")
+        shape = gambar[variabel[0]].shape
+        if any(gambar[v].shape != shape for v in variabel):
+            raise ValueError("Ukuran gambar harus sama")
+        
+        # Threshold otomatis butuh seluruh gambar, jadi input dibinarisasi
+        # lebih dulu dan dievaluasi sebagai gambar biner
+        threshold_used = {n: threshold for n in nama_hasil}
+        if isinstance(threshold, str) and not sudah_biner:
+            gambar = dict(gambar)
+            dipakai = {}
+            for v in variabel:
+                gambar[v], dipakai[v] = binarisasi_gambar(gambar[v], threshold)
+                if gambar[v] is None:
+                    raise ValueError(f"Binarisasi input {v} gagal")
+            # Statistik tiap ekspresi hanya memuat threshold input yang dipakainya
+            for n in nama_hasil:
+                variabel_ekspresi = kompilasi_ekspresi((ekspresi[n],))[0]
+                threshold_used[n] = format_threshold({v: dipakai[v] for v in variabel_ekspresi})
+            sudah_biner = True
+        
+        simpan = set(nama_hasil if simpan is None else simpan)
+        tinggi, lebar = shape
+        if tinggi_blok is None:
+            tinggi_blok = max(1, UKURAN_BLOK_EKSPRESI // max(1, lebar))
+        
+        # Mask penuh hanya untuk hasil yang diminta; instruksi akar yang
+        # disimpan langsung menulis ke mask tersebut
+        hasil = {n: np.empty(shape, dtype=np.uint8) for n in nama_hasil if n in simpan}
+        tujuan = {}
+        for n, i in zip(nama_hasil, akar):
+            if n in hasil and i not in tujuan and instruksi[i][0] != 'var':
+                tujuan[i] = hasil[n]
+        
+        kerja = np.empty((len(instruksi), tinggi_blok, lebar), dtype=np.uint8)
+        jumlah_putih = dict.fromkeys(akar, 0)
+        
+        for awal in range(0, tinggi, tinggi_blok):
+            akhir = min(awal + tinggi_blok, tinggi)
+            n_baris = akhir - awal
+            
+            blok = []
+            for i, (op, *argumen) in enumerate(instruksi):
+                dst = tujuan[i][awal:akhir] if i in tujuan else kerja[i, :n_baris]
+                if op == 'var':
+                    sumber = np.ascontiguousarray(gambar[argumen[0]][awal:akhir])
+                    if sudah_biner:
+                        dst = sumber
+                    else:
+                        cv2.threshold(sumber, threshold, 255, cv2.THRESH_BINARY, dst=dst)
+                elif op == 'not':
+                    cv2.bitwise_not(blok[argumen[0]], dst=dst)
+                elif op == 'and':
+                    cv2.bitwise_and(blok[argumen[0]], blok[argumen[1]], dst=dst)
+                elif op == 'or':
+                    cv2.bitwise_or(blok[argumen[0]], blok[argumen[1]], dst=dst)
+                else:
+                    cv2.bitwise_xor(blok[argumen[0]], blok[argumen[1]], dst=dst)
+                blok.append(dst)
+            
+            for i in jumlah_putih:
+                jumlah_putih[i] += hitung_nonzero(blok[i])
+            for n, i in zip(nama_hasil, akar):
+                if n in hasil and tujuan.get(i) is not hasil[n]:
+                    hasil[n][awal:akhir] = blok[i]
+        
+        stats = {
+            n: statistik_biner_dari_jumlah(jumlah_putih[i], shape, ekspresi[n], threshold_used[n])
+            for n, i in zip(nama_hasil, akar)
+        }
+        return hasil, stats
+        
+    except Exception as e:
+        print(f"❌ Error evaluasi ekspresi boolean: {e}")
+        return None, None
+
+def operasi_boolean_lengkap(img1, img2, threshold=127, sudah_biner=False, operasi=None):
+    """
+    Menghitung AND, OR, XOR, NOT beserta statistiknya dalam satu lintasan
+    
+    Hasil identik dengan operasi_and/or/xor/not yang dipanggil terpisah.
+    
+    Args:
+        img1, img2: Array numpy gambar grayscale
+        threshold: Threshold untuk binarisasi
+        sudah_biner: True jika img1/img2 sudah berupa gambar biner 0/255
+        operasi: Subset dari EKSPRESI_DASAR (default: semua)
+        
+    Returns:
+        dict: {nama_operasi: (hasil, stats_dict)}
+    """
+    operasi = list(EKSPRESI_DASAR) if operasi is None else list(operasi)
+    hasil, stats = evaluasi_ekspresi_boolean(
+        {nama: EKSPRESI_DASAR[nama][0] for nama in operasi},
+        {'A': img1, 'B': img2}, threshold, sudah_biner
+    )
+    if hasil is None:
+        return {}
+    
+    keluaran = {}
+    for nama in operasi:
+        _, nama_operasi, logika = EKSPRESI_DASAR[nama]
+        stats[nama]['Operasi'] = nama_operasi
+        stats[nama]['Logika'] = logika
+        keluaran[nama] = (hasil[nama], stats[nama])
+    return keluaran
+
 def demo_operasi_boolean(img1, img2, threshold=127):
     """
     Demo lengkap semua operasi boolean
     
     Args:
         img1, img2: Array numpy gambar grayscale
-        threshold: Threshold untuk binarisasi
+        threshold: Threshold untuk binarisasi (angka, 'otsu' atau 'adaptif')
         
     Returns:
         dict: Dictionary berisi semua hasil operasi
@@ -195,69 +773,52 @@ def demo_operasi_boolean(img1, img2, threshold=127):
     
     results = {}
     
-    # Binarisasi gambar asli
-    binary1, _ = binarisasi_gambar(img1, threshold)
-    binary2, _ = binarisasi_gambar(img2, threshold)
+    # Binarisasi gambar asli (sekali, dipakai ulang semua operasi)
+    binary1, threshold1 = binarisasi_gambar(img1, threshold)
+    binary2, threshold2 = binarisasi_gambar(img2, threshold)
     
     if binary1 is None or binary2 is None:
         print("❌ Gagal melakukan binarisasi")
         return results
     
     # Statistik gambar biner asli
-    stats_binary1 = hitung_statistik_biner(binary1, "Binary A", threshold)
-    stats_binary2 = hitung_statistik_biner(binary2, "Binary B", threshold)
+    stats_binary1 = hitung_statistik_biner(binary1, "Binary A", threshold1)
+    stats_binary2 = hitung_statistik_biner(binary2, "Binary B", threshold2)
     
     results['binary1'] = {
         'image': binary1,
         'stats': stats_binary1,
-        'title': 'Binary A (Threshold 127)'
+        'title': f"Binary A (Threshold {format_threshold({'A': threshold1})})"
     }
     
     results['binary2'] = {
         'image': binary2,
         'stats': stats_binary2,
-        'title': 'Binary B (Threshold 127)'
+        'title': f"Binary B (Threshold {format_threshold({'B': threshold2})})"
     }
     
-    # 1. Operasi AND
-    print("  1️⃣ Operasi AND")
-    hasil_and, stats_and = operasi_and(img1, img2, threshold)
-    if hasil_and is not None:
-        results['and'] = {
-            'image': hasil_and,
-            'stats': stats_and,
-            'title': 'A AND B (Irisan)'
-        }
-    
-    # 2. Operasi OR
-    print("  2️⃣ Operasi OR")
-    hasil_or, stats_or = operasi_or(img1, img2, threshold)
-    if hasil_or is not None:
-        results['or'] = {
-            'image': hasil_or,
-            'stats': stats_or,
-            'title': 'A OR B (Gabungan)'
-        }
+    # Keempat operasi dihitung dalam satu lintasan berblok
+    hasil_boolean = operasi_boolean_lengkap(binary1, binary2,
+                                            format_threshold({'A': threshold1, 'B': threshold2}),
+                                            sudah_biner=True)
     
-    # 3. Operasi XOR
-    print("  3️⃣ Operasi XOR")
-    hasil_xor, stats_xor = operasi_xor(img1, img2, threshold)
-    if hasil_xor is not None:
-        results['xor'] = {
-            'image': hasil_xor,
-            'stats': stats_xor,
-            'title': 'A XOR B (Selisih Simetris)'
-        }
-    
-    # 4. Operasi NOT
-    print("  4️⃣ Operasi NOT")
-    hasil_not, stats_not = operasi_not(img1, threshold)
-    if hasil_not is not None:
-        results['not'] = {
-            'image': hasil_not,
-            'stats': stats_not,
-            'title': 'NOT A (Komplemen)'
-        }
+    for nomor, nama, judul in [
+        ("1️⃣", 'and', 'A AND B (Irisan)'),
+        ("2️⃣", 'or', 'A OR B (Gabungan)'),
+        ("3️⃣", 'xor', 'A XOR B (Selisih Simetris)'),
+        ("4️⃣", 'not', 'NOT A (Komplemen)')
+    ]:
+        print(f"  {nomor} Operasi {nama.upper()}")
+        if nama in hasil_boolean:
+            hasil, stats = hasil_boolean[nama]
+            if nama == 'not':
+                # NOT hanya memakai A, jadi hanya threshold A yang relevan
+                stats['Threshold'] = stats_binary1['Threshold']
+            results[nama] = {
+                'image': hasil,
+                'stats': stats,
+                'title': judul
+            }
     
     print("✅ Demo operasi boolean selesai!")
     return results
\ No newline at end of file
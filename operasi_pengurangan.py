@@ -5,6 +5,11 @@ Berisi semua fungsi terkait pengurangan gambar
 
 import cv2
 import numpy as np
+from statistik_citra import (
+    hitung_statistik_satu_lintasan,
+    hitung_histogram_batch,
+    statistik_dari_histogram_batch
+)
 
 def pengurangan_absolut(img1, img2):
     """
@@ -24,15 +29,16 @@ def pengurangan_absolut(img1, img2):
         # Operasi pengurangan absolut
         hasil = cv2.absdiff(img1, img2)
         
-        # Hitung statistik
+        # Hitung statistik (satu lintasan)
+        st = hitung_statistik_satu_lintasan(hasil)
         stats = {
-            'Mean': float(np.mean(hasil)),
-            'Std Dev': float(np.std(hasil)),
-            'Max': int(np.max(hasil)),
-            'Min': int(np.min(hasil)),
-            'Total Pixels': int(hasil.size),
-            'Pixels >0': int(np.count_nonzero(hasil)),
-            'Persen Diff': (np.count_nonzero(hasil) / hasil.size) * 100
+            'Mean': st['mean'],
+            'Std Dev': st['std'],
+            'Max': st['max'],
+            'Min': st['min'],
+            'Total Pixels': st['total'],
+            'Pixels >0': st['nonzero'],
+            'Persen Diff': (st['nonzero'] / st['total']) * 100
         }
         
         return hasil, stats
@@ -41,13 +47,25 @@ def pengurangan_absolut(img1, img2):
         print(f"❌ Error dalam pengurangan absolut: {e}")
         return None, None
 
-def pengurangan_dengan_konstanta(img1, img2, konstanta=100):
+def pengurangan_dengan_konstanta(img1, img2, konstanta=100, out=None,
+                                 mode="int16", buffer_kerja=None):
     """
     Operasi (A - B) + K dengan handling underflow
     
+    Mode "int16" menghitung lewat satu buffer int16 sementara. Mode
+    "saturasi" memakai aritmatika uint8 jenuh (semantik cv2.add/cv2.subtract):
+    
+        hasil = sat((A -sat B) +sat K) -sat (B -sat A)
+    
+    sehingga tidak ada alokasi full-frame jika out dan buffer_kerja
+    disediakan pemanggil. Mode saturasi butuh 0 <= K <= 255.
+    
     Args:
         img1, img2: Array numpy gambar grayscale
         konstanta: Nilai konstanta yang ditambahkan (default: 100)
+        out: Buffer uint8 milik pemanggil untuk hasil (opsional, boleh img1 atau img2)
+        mode: "int16" atau "saturasi" (default: "int16")
+        buffer_kerja: Buffer uint8 sementara untuk mode saturasi (opsional)
         
     Returns:
         tuple: (hasil_gambar, statistik_dict)
@@ -57,21 +75,56 @@ def pengurangan_dengan_konstanta(img1, img2, konstanta=100):
         if img1.shape != img2.shape:
             raise ValueError("Ukuran gambar harus sama")
         
-        # Konversi ke int16 untuk mencegah underflow
-        temp = img1.astype(np.int16) - img2.astype(np.int16) + konstanta
+        if out is None:
+            out = np.empty(img1.shape, dtype=np.uint8)
+        elif out.shape != img1.shape or out.dtype != np.uint8:
+            raise ValueError("Buffer out harus uint8 dengan ukuran yang sama")
+        
+        if mode == "saturasi":
+            if img1.dtype != np.uint8 or img2.dtype != np.uint8:
+                raise ValueError("Mode saturasi butuh gambar uint8")
+            if not 0 <= konstanta <= 255:
+                raise ValueError("Mode saturasi butuh konstanta 0-255")
+            if buffer_kerja is None:
+                buffer_kerja = np.empty(img1.shape, dtype=np.uint8)
+            elif any(np.shares_memory(buffer_kerja, x) for x in (img1, img2, out)):
+                raise ValueError("buffer_kerja tidak boleh berbagi memori dengan input atau out")
+            
+            # max(B - A, 0) dihitung lebih dulu, karena out boleh sama dengan A atau B
+            cv2.subtract(img2, img1, dst=buffer_kerja)
+            
+            # max(A - B, 0) + K, jenuh di 255
+            cv2.subtract(img1, img2, dst=out)
+            cv2.add(out, int(konstanta), dst=out)
+            
+            # Kurangi max(B - A, 0), jenuh di 0
+            cv2.subtract(out, buffer_kerja, dst=out)
         
-        # Clip ke range [0, 255] dan convert ke uint8
-        hasil = np.clip(temp, 0, 255).astype(np.uint8)
+        elif mode == "int16":
+            # Konversi ke int16 untuk mencegah underflow (satu buffer in-place)
+            temp = img1.astype(np.int16)
+            np.subtract(temp, img2, out=temp)
+            temp += konstanta
+            
+            # Clip ke range [0, 255] dan tulis ke buffer uint8
+            np.clip(temp, 0, 255, out=temp)
+            np.copyto(out, temp, casting='unsafe')
         
-        # Hitung statistik
+        else:
+            raise ValueError(f"Mode tidak dikenal: {mode}")
+        
+        hasil = out
+        
+        # Hitung statistik (satu lintasan)
+        st = hitung_statistik_satu_lintasan(hasil)
         stats = {
-            'Mean': float(np.mean(hasil)),
-            'Std Dev': float(np.std(hasil)),
-            'Max': int(np.max(hasil)),
-            'Min': int(np.min(hasil)),
-            'Total Pixels': int(hasil.size),
+            'Mean': st['mean'],
+            'Std Dev': st['std'],
+            'Max': st['max'],
+            'Min': st['min'],
+            'Total Pixels': st['total'],
             'Konstanta': konstanta,
-            'Range': f'[{np.min(hasil)}, {np.max(hasil)}]'
+            'Range': f"[{st['min']}, {st['max']}]"
         }
         
         return hasil, stats
@@ -80,6 +133,83 @@ def pengurangan_dengan_konstanta(img1, img2, konstanta=100):
         print(f"❌ Error dalam pengurangan dengan konstanta: {e}")
         return None, None
 
+def pengurangan_batch(stack1, stack2, konstanta=None):
+    """
+    Operasi pengurangan untuk banyak pasangan gambar sekaligus
+    
+    Tanpa konstanta menghitung |A - B|, dengan konstanta menghitung
+    (A - B) + K. Konstanta di-broadcast terhadap sumbu N seperti aturan
+    NumPy, sehingga satu pasangan (N=1) dengan K konstanta menghasilkan
+    K gambar dari satu kali konversi int16.
+    
+    Args:
+        stack1, stack2: Array numpy uint8 berbentuk (N, H, W)
+        konstanta: None, skalar, atau vektor konstanta (default: None)
+        
+    Returns:
+        tuple: (stack_hasil, list_statistik_dict)
+    """
+    try:
+        stack1 = np.ascontiguousarray(stack1)
+        stack2 = np.ascontiguousarray(stack2)
+        
+        # Pastikan ukuran sama
+        if stack1.shape != stack2.shape:
+            raise ValueError("Ukuran stack gambar harus sama")
+        if stack1.ndim != 3:
+            raise ValueError("Stack gambar harus berbentuk (N, H, W)")
+        if stack1.dtype != np.uint8 or stack2.dtype != np.uint8:
+            raise ValueError("Stack gambar harus bertipe uint8")
+        
+        n, tinggi, lebar = stack1.shape
+        
+        if konstanta is None:
+            # absdiff pada tampilan 2D (N*H, W) dalam satu panggilan
+            hasil = cv2.absdiff(stack1.reshape(n * tinggi, lebar),
+                                stack2.reshape(n * tinggi, lebar))
+            hasil = hasil.reshape(n, tinggi, lebar)
+            daftar_konstanta = None
+        else:
+            daftar_konstanta = np.atleast_1d(np.asarray(konstanta, dtype=np.int16))
+            if daftar_konstanta.ndim != 1:
+                raise ValueError("Konstanta harus skalar atau vektor 1D")
+            
+            # Konversi ke int16 sekali untuk seluruh stack
+            temp = stack1.astype(np.int16)
+            temp -= stack2
+            temp = temp + daftar_konstanta[:, None, None]
+            
+            # Clip ke range [0, 255] dan convert ke uint8
+            np.clip(temp, 0, 255, out=temp)
+            hasil = temp.astype(np.uint8)
+        
+        # Statistik per item dari histogram (N, 256)
+        st = statistik_dari_histogram_batch(hitung_histogram_batch(hasil))
+        
+        daftar_stats = []
+        for i in range(hasil.shape[0]):
+            stats = {
+                'Mean': float(st['mean'][i]),
+                'Std Dev': float(st['std'][i]),
+                'Max': int(st['max'][i]),
+                'Min': int(st['min'][i]),
+                'Total Pixels': int(st['total'][i])
+            }
+            if daftar_konstanta is None:
+                stats['Pixels >0'] = int(st['nonzero'][i])
+                stats['Persen Diff'] = (stats['Pixels >0'] / stats['Total Pixels']) * 100
+            else:
+                k = daftar_konstanta[i if daftar_konstanta.size > 1 else 0]
+                stats['Konstanta'] = int(k)
+                stats['Range'] = f"[{stats['Min']}, {stats['Max']}]"
+            daftar_stats.append(stats)
+        
+        return hasil, daftar_stats
+        
+    except Exception as e:
+        print(f"❌ Error dalam pengurangan batch: {e}")
+        return None, None
+
 def hitung_statistik_dasar(image):
     """
     Menghitung statistik dasar gambar
@@ -91,12 +221,13 @@ def hitung_statistik_dasar(image):
         dict: Dictionary berisi statistik dasar
     """
     try:
+        st = hitung_statistik_satu_lintasan(image)
         return {
-            'Mean': float(np.mean(image)),
-            'Std Dev': float(np.std(image)),
-            'Max': int(np.max(image)),
-            'Min': int(np.min(image)),
-            'Total Pixels': int(image.size)
+            'Mean': st['mean'],
+            'Std Dev': st['std'],
+            'Max': st['max'],
+            'Min': st['min'],
+            'Total Pixels': st['total']
         }
     except Exception as e:
         print(f"❌ Error menghitung statistik: {e}")
@@ -126,25 +257,17 @@ def demo_pengurangan_citra(img1, img2):
             'title': 'Pengurangan Absolut |A - B|'
         }
     
-    # 2. Pengurangan dengan Konstanta
+    # 2 & 3. Pengurangan dengan Konstanta 100 dan 150 dalam satu batch
     print("  2️⃣ Pengurangan dengan Konstanta (A - B) + 100")
-    hasil_const, stats_const = pengurangan_dengan_konstanta(img1, img2, 100)
-    if hasil_const is not None:
-        results['konstanta'] = {
-            'image': hasil_const,
-            'stats': stats_const,
-            'title': 'Pengurangan (A - B) + 100'
-        }
-    
-    # 3. Variasi konstanta lain
     print("  3️⃣ Pengurangan dengan Konstanta (A - B) + 150")
-    hasil_const2, stats_const2 = pengurangan_dengan_konstanta(img1, img2, 150)
-    if hasil_const2 is not None:
-        results['konstanta2'] = {
-            'image': hasil_const2,
-            'stats': stats_const2,
-            'title': 'Pengurangan (A - B) + 150'
-        }
+    hasil_batch, stats_batch = pengurangan_batch(img1[None], img2[None], [100, 150])
+    if hasil_batch is not None:
+        for i, (nama, konstanta) in enumerate([('konstanta', 100), ('konstanta2', 150)]):
+            results[nama] = {
+                'image': hasil_batch[i],
+                'stats': stats_batch[i],
+                'title': f'Pengurangan (A - B) + {konstanta}'
+            }
     
     print("✅ Demo pengurangan citra selesai!")
     return results
\ No newline at end of file
@@ -0,0 +1,339 @@
+"""
+Module untuk Pelacakan Motion (Multi-Object Tracking)
+Berisi pelacak region motion antar frame berbasis asosiasi centroid/IoU
+dengan penyimpanan track struct-of-arrays
+"""
+
+import numpy as np
+from motion_detection import stream_motion, analisis_region_motion
+
+class PenyimpananTrack:
+    """
+    Penyimpanan track struct-of-arrays: satu array NumPy per atribut,
+    baris 0..jumlah-1 adalah track aktif
+
+    Kapasitas tumbuh 2x saat penuh; penghapusan track dilakukan dengan
+    kompaksi vektor sehingga tidak ada objek Python per track.
+    """
+
+    __slots__ = ('jumlah', 'id', 'centroid', 'kecepatan', 'bbox',
+                 'frame_awal', 'frame_terakhir')
+
+    def __init__(self, kapasitas=64):
+        self.jumlah = 0
+        self.id = np.empty(kapasitas, dtype=np.int64)
+        self.centroid = np.empty((kapasitas, 2), dtype=np.float64)
+        self.kecepatan = np.empty((kapasitas, 2), dtype=np.float64)
+        self.bbox = np.empty((kapasitas, 4), dtype=np.int32)
+        self.frame_awal = np.empty(kapasitas, dtype=np.int64)
+        self.frame_terakhir = np.empty(kapasitas, dtype=np.int64)
+
+    def _pastikan_kapasitas(self, dibutuhkan):
+        """Memperbesar semua array jika kapasitas kurang"""
+        kapasitas = len(self.id)
+        if dibutuhkan <= kapasitas:
+            return
+        while kapasitas < dibutuhkan:
+            kapasitas *= 2
+        for nama in PenyimpananTrack.__slots__[1:]:
+            lama = getattr(self, nama)
+            baru = np.empty((kapasitas,) + lama.shape[1:], dtype=lama.dtype)
+            baru[:self.jumlah] = lama[:self.jumlah]
+            setattr(self, nama, baru)
+
+    def tambah(self, ids, centroid, bbox, frame):
+        """Menambah banyak track baru sekaligus"""
+        n = len(ids)
+        self._pastikan_kapasitas(self.jumlah + n)
+        baris = slice(self.jumlah, self.jumlah + n)
+        self.id[baris] = ids
+        self.centroid[baris] = centroid
+        self.kecepatan[baris] = 0
+        self.bbox[baris] = bbox
+        self.frame_awal[baris] = frame
+        self.frame_terakhir[baris] = frame
+        self.jumlah += n
+
+    def simpan_hanya(self, pilih):
+        """Mempertahankan track dengan pilih=True (kompaksi, urutan tetap)"""
+        n = int(np.count_nonzero(pilih))
+        if n == self.jumlah:
+            return
+        for nama in PenyimpananTrack.__slots__[1:]:
+            array = getattr(self, nama)
+            array[:n] = array[:self.jumlah][pilih]
+        self.jumlah = n
+
+    def __len__(self):
+        return self.jumlah
+
+def pasangan_kandidat(titik_a, titik_b, jarak_maks):
+    """
+    Semua pasangan (i, j) dengan jarak titik_a[i]-titik_b[j] < jarak_maks
+    
+    Titik dikelompokkan ke grid padat dengan sel >= 2 x jarak_maks,
+    sehingga lingkaran radius jarak_maks di sekitar titik_b hanya
+    menyentuh blok 2x2 sel (dipilih dari kuadran posisi titik di selnya).
+    Ukuran sel juga dibatasi agar jumlah sel ~O(N + M); biaya mendekati
+    linear terhadap jumlah titik, bukan N x M.
+    
+    Args:
+        titik_a: Array (N, 2)
+        titik_b: Array (M, 2)
+        jarak_maks: Jarak maksimum
+        
+    Returns:
+        tuple: (index_a, index_b, jarak_kuadrat)
+    """
+    # jarak < jarak_maks <= 0 tidak mungkin; sekaligus menjamin ukuran_sel > 0
+    # walau semua titik berimpit
+    if len(titik_a) == 0 or len(titik_b) == 0 or jarak_maks <= 0:
+        kosong = np.empty(0, dtype=np.intp)
+        return kosong, kosong, np.empty(0)
+    
+    # Reduksi per kolom (kontigu) jauh lebih cepat daripada min(axis=0)
+    xa, ya = titik_a[:, 0], titik_a[:, 1]
+    xb, yb = titik_b[:, 0], titik_b[:, 1]
+    min_x, min_y = min(xa.min(), xb.min()), min(ya.min(), yb.min())
+    rentang_x = max(xa.max(), xb.max()) - min_x
+    rentang_y = max(ya.max(), yb.max()) - min_y
+    ukuran_sel = max(2.0 * jarak_maks,
+                     float(np.sqrt(rentang_x * rentang_y / (4 * (len(titik_a) + len(titik_b))))))
+    minimum = np.array([min_x, min_y])
+    
+    # Satu sel border di setiap sisi agar tetangga selalu di dalam grid
+    jumlah_y = int(rentang_y // ukuran_sel) + 3
+    jumlah_sel = (int(rentang_x // ukuran_sel) + 3) * jumlah_y
+    
+    # Posisi relatif >= 0 sehingga astype (truncate) sama dengan floor
+    sel_a = ((titik_a - minimum) / ukuran_sel).astype(np.intp) + 1
+    kunci_a = sel_a[:, 0] * jumlah_y + sel_a[:, 1]
+    urut = np.argsort(kunci_a, kind='stable')
+    isi_sel = np.bincount(kunci_a, minlength=jumlah_sel)
+    awal_sel = np.cumsum(isi_sel) - isi_sel
+    
+    # Blok 2x2: sel sendiri dan tetangga ke arah kuadran titik
+    posisi_sel = (titik_b - minimum) / ukuran_sel
+    sel_b = posisi_sel.astype(np.intp)
+    arah = np.where(posisi_sel - sel_b < 0.5, -1, 1)
+    sel_b += 1
+    kunci_b = sel_b[:, 0] * jumlah_y + sel_b[:, 1]
+    langkah_x, langkah_y = arah[:, 0] * jumlah_y, arah[:, 1]
+    cari = np.stack([kunci_b, kunci_b + langkah_x, kunci_b + langkah_y,
+                     kunci_b + langkah_x + langkah_y], axis=1).ravel()
+    
+    awal = awal_sel[cari]
+    jumlah = isi_sel[cari]
+    total = int(jumlah.sum())
+    posisi = np.repeat(awal - np.cumsum(jumlah) + jumlah, jumlah) + np.arange(total)
+    index_a = urut[posisi]
+    index_b = np.repeat(np.arange(len(titik_b)).repeat(4), jumlah)
+    
+    # Gather 1D per kolom lebih murah daripada gather baris (P, 2)
+    dx = np.ascontiguousarray(xa)[index_a] - np.ascontiguousarray(xb)[index_b]
+    dy = np.ascontiguousarray(ya)[index_a] - np.ascontiguousarray(yb)[index_b]
+    jarak_kuadrat = dx * dx + dy * dy
+    dekat = jarak_kuadrat < jarak_maks * jarak_maks
+    return index_a[dekat], index_b[dekat], jarak_kuadrat[dekat]
+
+def iou_pasangan(bbox_a, bbox_b):
+    """IoU per pasangan bbox x, y, lebar, tinggi (array (P, 4) berpasangan)"""
+    a = bbox_a.astype(np.float64)
+    b = bbox_b.astype(np.float64)
+    lebar = np.minimum(a[:, 0] + a[:, 2], b[:, 0] + b[:, 2]) - np.maximum(a[:, 0], b[:, 0])
+    tinggi = np.minimum(a[:, 1] + a[:, 3], b[:, 1] + b[:, 3]) - np.maximum(a[:, 1], b[:, 1])
+    irisan = np.clip(lebar, 0, None) * np.clip(tinggi, 0, None)
+    gabungan = a[:, 2] * a[:, 3] + b[:, 2] * b[:, 3] - irisan
+    return irisan / np.maximum(gabungan, 1)
+
+def asosiasi_greedy(baris, kolom, biaya, jumlah_baris, jumlah_kolom):
+    """
+    Pencocokan greedy (biaya terkecil lebih dulu) pada pasangan kandidat
+    
+    Setiap putaran memasangkan semua pasangan yang menjadi pilihan terbaik
+    bagi baris dan kolomnya sekaligus, lalu membuang kandidat yang baris
+    atau kolomnya sudah terpakai. Hasilnya sama dengan greedy terurut
+    (untuk biaya yang berbeda-beda) tanpa loop per pasangan.
+    
+    Args:
+        baris, kolom: Index kandidat pasangan
+        biaya: Biaya setiap kandidat
+        jumlah_baris, jumlah_kolom: Ukuran himpunan baris dan kolom
+        
+    Returns:
+        tuple: (index_baris, index_kolom) pasangan yang cocok
+    """
+    urut = np.argsort(biaya, kind='stable')
+    baris, kolom = baris[urut], kolom[urut]
+    hasil_baris, hasil_kolom = [], []
+    
+    pertama_baris = np.empty(jumlah_baris, dtype=np.intp)
+    pertama_kolom = np.empty(jumlah_kolom, dtype=np.intp)
+    while len(baris):
+        # Kandidat pertama (biaya terkecil) per baris/kolom: penulisan
+        # terakhir menang, jadi tulis dalam urutan terbalik
+        posisi = np.arange(len(baris))
+        pertama_baris[baris[::-1]] = posisi[::-1]
+        pertama_kolom[kolom[::-1]] = posisi[::-1]
+        saling = (pertama_baris[baris] == posisi) & (pertama_kolom[kolom] == posisi)
+        
+        hasil_baris.append(baris[saling])
+        hasil_kolom.append(kolom[saling])
+        
+        terpakai_baris = np.zeros(jumlah_baris, dtype=bool)
+        terpakai_kolom = np.zeros(jumlah_kolom, dtype=bool)
+        terpakai_baris[baris[saling]] = True
+        terpakai_kolom[kolom[saling]] = True
+        sisa = ~(terpakai_baris[baris] | terpakai_kolom[kolom])
+        baris, kolom = baris[sisa], kolom[sisa]
+    
+    if not hasil_baris:
+        kosong = np.empty(0, dtype=np.intp)
+        return kosong, kosong
+    return np.concatenate(hasil_baris), np.concatenate(hasil_kolom)
+
+class PelacakMotion:
+    """
+    Pelacak multi-objek untuk region hasil analisis_region_motion
+
+    Posisi setiap track diprediksi dengan kecepatan konstan, lalu
+    dicocokkan ke region frame ini berdasarkan jarak centroid atau IoU
+    bbox. Kandidat pasangan dicari dengan grid spasial sehingga biaya per
+    frame tidak tumbuh N x M. Kecepatan diperhalus dengan filter alpha-beta (Kalman
+    kecepatan-konstan dengan gain tetap). Track yang tidak terlihat lebih
+    dari maks_hilang frame dihapus.
+    """
+
+    def __init__(self, metrik='centroid', jarak_maks=50.0, iou_min=0.1,
+                 maks_hilang=5, beta=0.5, fps=None):
+        """
+        Args:
+            metrik: 'centroid' (jarak Euclidean) atau 'iou'
+            jarak_maks: Jarak centroid maksimum untuk pencocokan (pixel),
+                        juga membatasi kandidat pada metrik 'iou'
+            iou_min: IoU minimum untuk pencocokan (metrik 'iou')
+            maks_hilang: Jumlah frame track boleh tidak terlihat
+            beta: Gain pembaruan kecepatan (0-1)
+            fps: Jika diisi, dwell dan kecepatan dilaporkan per detik
+        """
+        if metrik not in ('centroid', 'iou'):
+            raise ValueError(f"Metrik asosiasi tidak dikenal: {metrik}")
+        self.metrik = metrik
+        self.jarak_maks = jarak_maks
+        self.iou_min = iou_min
+        self.maks_hilang = maks_hilang
+        self.beta = beta
+        self.fps = fps
+        self.tracks = PenyimpananTrack()
+        self.id_berikutnya = 1
+        self.frame = -1
+
+    def perbarui(self, regions, index_frame=None):
+        """
+        Memproses region satu frame
+
+        Args:
+            regions: Dict dari analisis_region_motion ('centroid', 'bbox')
+            index_frame: Index frame (default: frame sebelumnya + 1)
+
+        Returns:
+            tuple: (tracks_dict, stats_dict) dengan tracks_dict berisi array
+                   'id', 'centroid', 'kecepatan', 'bbox', 'dwell' untuk track
+                   yang terlihat pada frame ini, urut sesuai region input
+        """
+        try:
+            self.frame = self.frame + 1 if index_frame is None else index_frame
+            t = self.tracks
+            n = t.jumlah
+            centroid = np.asarray(regions['centroid'], dtype=np.float64).reshape(-1, 2)
+            bbox = np.asarray(regions['bbox'], dtype=np.int32).reshape(-1, 4)
+
+            # Prediksi posisi dengan kecepatan konstan
+            selang = np.maximum(self.frame - t.frame_terakhir[:n], 1)[:, None]
+            prediksi = t.centroid[:n] + t.kecepatan[:n] * selang
+
+            # Kandidat dibatasi jarak centroid < jarak_maks (juga untuk IoU)
+            baris, kolom, biaya = pasangan_kandidat(prediksi, centroid, self.jarak_maks)
+            if self.metrik == 'iou':
+                geser = np.rint(prediksi[baris] - t.centroid[baris]).astype(np.int32)
+                bbox_prediksi = t.bbox[baris].copy()
+                bbox_prediksi[:, :2] += geser
+                biaya = 1 - iou_pasangan(bbox_prediksi, bbox[kolom])
+                cukup = biaya <= 1 - self.iou_min
+                baris, kolom, biaya = baris[cukup], kolom[cukup], biaya[cukup]
+            baris, kolom = asosiasi_greedy(baris, kolom, biaya, n, len(centroid))
+
+            # Perbarui track yang cocok (alpha-beta: posisi = ukuran baru)
+            kecepatan_ukur = (centroid[kolom] - t.centroid[baris]) / selang[baris]
+            t.kecepatan[baris] += self.beta * (kecepatan_ukur - t.kecepatan[baris])
+            t.centroid[baris] = centroid[kolom]
+            t.bbox[baris] = bbox[kolom]
+            t.frame_terakhir[baris] = self.frame
+
+            # Hapus track yang terlalu lama hilang
+            pertahankan = (self.frame - t.frame_terakhir[:n]) <= self.maks_hilang
+            hilang = n - int(np.count_nonzero(pertahankan))
+
+            # Peta region -> baris track setelah kompaksi
+            baris_track = np.full(len(centroid), -1, dtype=np.intp)
+            baris_track[kolom] = (np.cumsum(pertahankan) - 1)[baris]
+            t.simpan_hanya(pertahankan)
+
+            # Region tanpa pasangan menjadi track baru
+            baru = np.flatnonzero(baris_track < 0)
+            baris_track[baru] = np.arange(t.jumlah, t.jumlah + len(baru))
+            ids = np.arange(self.id_berikutnya, self.id_berikutnya + len(baru))
+            t.tambah(ids, centroid[baru], bbox[baru], self.frame)
+            self.id_berikutnya += len(baru)
+
+            dwell = self.frame - t.frame_awal[baris_track] + 1
+            kecepatan = t.kecepatan[baris_track]
+            if self.fps:
+                dwell = dwell / self.fps
+                kecepatan = kecepatan * self.fps
+
+            tracks = {
+                'id': t.id[baris_track],
+                'centroid': t.centroid[baris_track],
+                'kecepatan': kecepatan,
+                'bbox': t.bbox[baris_track],
+                'dwell': dwell
+            }
+            stats = {
+                'Frame': self.frame,
+                'Tracks Aktif': t.jumlah,
+                'Tracks Terlihat': len(baris_track),
+                'Track Baru': len(baru),
+                'Track Hilang': hilang,
+                'Total Track': self.id_berikutnya - 1,
+                'Metrik': 'IoU' if self.metrik == 'iou' else 'Centroid'
+            }
+            return tracks, stats
+
+        except Exception as e:
+            print(f"❌ Error pelacakan motion: {e}")
+            return None, None
+
+def stream_pelacakan(sumber, threshold=30, area_min=50, **opsi_pelacak):
+    """
+    Motion detection + analisis region + pelacakan untuk video/direktori frame
+
+    Args:
+        sumber: Path file video atau direktori frame
+        threshold: Threshold motion detection
+        area_min: Area minimum region dalam pixel
+        **opsi_pelacak: Argumen untuk PelacakMotion
+
+    Yields:
+        tuple: (index_frame, tracks_dict, stats_dict)
+    """
+    pelacak = PelacakMotion(**opsi_pelacak)
+    for index, mask, stats_motion in stream_motion(sumber, threshold):
+        _, regions = analisis_region_motion(mask, area_min)
+        if regions is None:
+            continue
+        tracks, stats = pelacak.perbarui(regions, index)
+        if tracks is None:
+            continue
+        stats.update({k: stats_motion[k] for k in ('Motion Pixels', 'Motion %', 'Status')})
+        yield index, tracks, stats
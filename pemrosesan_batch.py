@@ -0,0 +1,268 @@
+"""
+Module untuk Pemrosesan Batch
+Berisi runner non-interaktif yang menjalankan operasi demo_lengkap untuk
+banyak pasangan gambar secara paralel dengan ProcessPoolExecutor
+"""
+
+import os
+import cv2
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from operasi_pengurangan import pengurangan_absolut, pengurangan_batch, hitung_statistik_dasar
+from operasi_boolean import operasi_boolean_lengkap
+from motion_detection import deteksi_motion_dengan_cleanup, analisis_motion_area
+from operasi_blending import OperasiBlending
+
+SEMUA_OPERASI = ('pengurangan', 'boolean', 'motion', 'blending')
+
+EKSTENSI_GAMBAR = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif')
+
+def baca_manifest(path):
+    """
+    Membaca daftar pasangan gambar dari file manifest atau direktori
+
+    Manifest: satu pasangan per baris "gambar_a,gambar_b" (path relatif
+    terhadap folder manifest, baris kosong dan '#' diabaikan). Baris yang
+    tidak berisi dua path dilaporkan dengan nomor barisnya lalu dilewati.
+    Direktori: file "<nama>_A.<ext>" dipasangkan dengan "<nama>_B.<ext>".
+
+    Args:
+        path: Path file manifest atau direktori
+
+    Returns:
+        list: List tuple (nama, path_a, path_b)
+    """
+    pasangan = []
+
+    if os.path.isdir(path):
+        file_a = {}
+        file_b = {}
+        for nama_file in sorted(os.listdir(path)):
+            dasar, ext = os.path.splitext(nama_file)
+            if ext.lower() not in EKSTENSI_GAMBAR:
+                continue
+            if dasar.endswith('_A'):
+                file_a[dasar[:-2]] = os.path.join(path, nama_file)
+            elif dasar.endswith('_B'):
+                file_b[dasar[:-2]] = os.path.join(path, nama_file)
+
+        for nama in sorted(file_a):
+            if nama in file_b:
+                pasangan.append((nama, file_a[nama], file_b[nama]))
+        return pasangan
+
+    folder = os.path.dirname(os.path.abspath(path))
+    with open(path, encoding='utf-8') as f:
+        for nomor, baris in enumerate(f, 1):
+            baris = baris.strip()
+            if not baris or baris.startswith('#'):
+                continue
+            bagian = [p.strip() for p in baris.split(',')[:2]]
+            if len(bagian) < 2 or not all(bagian):
+                print(f"❌ Manifest {path} baris {nomor} tidak valid (harus 'gambar_a,gambar_b'): {baris}")
+                continue
+            path_a, path_b = bagian
+            path_a = os.path.join(folder, path_a)
+            path_b = os.path.join(folder, path_b)
+            nama = os.path.splitext(os.path.basename(path_a))[0]
+            pasangan.append((nama, path_a, path_b))
+    return pasangan
+
+def muat_pasangan(path_a, path_b):
+    """
+    Membaca pasangan gambar grayscale dan menyamakan ukurannya
+
+    Returns:
+        tuple: (img1, img2)
+    """
+    img1 = cv2.imread(path_a, cv2.IMREAD_GRAYSCALE)
+    img2 = cv2.imread(path_b, cv2.IMREAD_GRAYSCALE)
+    if img1 is None or img2 is None:
+        raise ValueError(f"Gagal membaca {path_a} / {path_b}")
+
+    if img1.shape != img2.shape:
+        img2 = cv2.resize(img2, (img1.shape[1], img1.shape[0]))
+    return img1, img2
+
+def jalankan_operasi_pasangan(img1, img2, operasi=SEMUA_OPERASI, threshold=127,
+                              threshold_motion=30, alphas=(0.3, 0.5, 0.7),
+                              konstanta=(100, 150)):
+    """
+    Menjalankan operasi gaya demo_lengkap pada satu pasangan tanpa I/O
+
+    Returns:
+        dict: {nama_hasil: {'image', 'stats', 'title', 'kategori'}}
+    """
+    results = {}
+
+    if 'pengurangan' in operasi:
+        hasil, stats = pengurangan_absolut(img1, img2)
+        if hasil is not None:
+            results['absolut'] = {
+                'image': hasil, 'stats': stats,
+                'title': 'Pengurangan Absolut |A - B|',
+                'kategori': '1_pengurangan_citra'
+            }
+        hasil, daftar_stats = pengurangan_batch(img1[None], img2[None], list(konstanta))
+        if hasil is not None:
+            for i, k in enumerate(konstanta):
+                results[f'konstanta_{k}'] = {
+                    'image': hasil[i], 'stats': daftar_stats[i],
+                    'title': f'Pengurangan (A - B) + {k}',
+                    'kategori': '1_pengurangan_citra'
+                }
+
+    if 'boolean' in operasi:
+        hasil_boolean = operasi_boolean_lengkap(img1, img2, threshold)
+        for nama, judul in [
+            ('and', 'A AND B (Irisan)'),
+            ('or', 'A OR B (Gabungan)'),
+            ('xor', 'A XOR B (Selisih Simetris)'),
+            ('not', 'NOT A (Komplemen)')
+        ]:
+            if nama in hasil_boolean:
+                hasil, stats = hasil_boolean[nama]
+                results[f'boolean_{nama}'] = {
+                    'image': hasil, 'stats': stats, 'title': judul,
+                    'kategori': '2_operasi_boolean'
+                }
+
+    if 'motion' in operasi:
+        hasil, stats = deteksi_motion_dengan_cleanup(img1, img2, threshold_motion)
+        if hasil is not None:
+            stats.update(analisis_motion_area(hasil))
+            results['motion_cleaned'] = {
+                'image': hasil, 'stats': stats,
+                'title': 'Motion Detection (Cleaned)',
+                'kategori': '3_motion_detection'
+            }
+
+    if 'blending' in operasi:
+        blending = OperasiBlending()
+        for alpha, hasil in blending.sweep_blending(img1, img2, alphas, salin=True):
+            _, stats = blending.hitung_statistik_blending(img1, img2, hasil, alpha)
+            results[f'blend_{int(alpha*100)}'] = {
+                'image': hasil, 'stats': stats,
+                'title': f"Blended Result ({int(alpha*100)}% A + {int((1-alpha)*100)}% B)",
+                'kategori': '4_blending_citra'
+            }
+
+    return results
+
+def simpan_hasil_pasangan(img1, nama, results, folder_output="hasil_pengolahan",
+                          renderer="matplotlib"):
+    """
+    Menyimpan lembar perbandingan untuk semua hasil satu pasangan
+
+    Args:
+        img1: Gambar A (ditampilkan sebagai gambar asli)
+        nama: Prefix nama file
+        results: Output jalankan_operasi_pasangan
+        folder_output: Folder output
+        renderer: Renderer simpan_perbandingan_dengan_stats
+    """
+    from input_output import simpan_perbandingan_dengan_stats
+    stats_asli = hitung_statistik_dasar(img1)
+    for nama_hasil, data in results.items():
+        simpan_perbandingan_dengan_stats(
+            img1, data['image'],
+            f"{nama}_{nama_hasil}",
+            "Gambar A (Original)",
+            data['title'],
+            stats_asli,
+            data['stats'],
+            folder_output,
+            data['kategori'],
+            renderer=renderer
+        )
+
+def _proses_chunk(chunk, operasi, simpan, folder_output, parameter, renderer="matplotlib"):
+    """
+    Dijalankan di worker: memproses satu chunk pasangan gambar
+
+    Hanya statistik yang dikirim balik ke proses utama agar tidak perlu
+    mem-pickle gambar hasil.
+
+    Returns:
+        list: List dict {'nama', 'stats' | 'error'}
+    """
+    keluaran = []
+    for nama, path_a, path_b in chunk:
+        try:
+            img1, img2 = muat_pasangan(path_a, path_b)
+            results = jalankan_operasi_pasangan(img1, img2, operasi, **parameter)
+
+            if simpan:
+                simpan_hasil_pasangan(img1, nama, results, folder_output, renderer)
+
+            keluaran.append({
+                'nama': nama,
+                'stats': {k: v['stats'] for k, v in results.items()}
+            })
+        except Exception as e:
+            keluaran.append({'nama': nama, 'error': str(e)})
+    return keluaran
+
+def jalankan_batch(pasangan, operasi=SEMUA_OPERASI, workers=None, chunksize=1,
+                   simpan=False, folder_output="hasil_pengolahan", renderer="matplotlib",
+                   **parameter):
+    """
+    Menjalankan operasi untuk banyak pasangan gambar secara paralel
+
+    Pasangan dibagi menjadi chunk berisi `chunksize` pasangan; setiap chunk
+    adalah satu task ProcessPoolExecutor. Hasil di-yield segera setelah
+    chunk selesai (urutan penyelesaian, bukan urutan input).
+
+    Args:
+        pasangan: List tuple (nama, path_a, path_b), lihat baca_manifest
+        operasi: Subset dari SEMUA_OPERASI
+        workers: Jumlah proses worker (default: os.cpu_count())
+        chunksize: Jumlah pasangan per task (default: 1)
+        simpan: Simpan gambar perbandingan di worker (default: False)
+        folder_output: Folder output jika simpan=True
+        renderer: "matplotlib" atau "opencv" untuk lembar perbandingan
+        **parameter: threshold, threshold_motion, alphas, konstanta
+
+    Yields:
+        dict: {'nama', 'stats'} atau {'nama', 'error'} per pasangan
+    """
+    operasi = tuple(operasi)
+    tidak_dikenal = set(operasi) - set(SEMUA_OPERASI)
+    if tidak_dikenal:
+        raise ValueError(f"Operasi tidak dikenal: {sorted(tidak_dikenal)}")
+
+    chunksize = max(1, int(chunksize))
+    chunks = [pasangan[i:i + chunksize] for i in range(0, len(pasangan), chunksize)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_proses_chunk, chunk, operasi, simpan, folder_output,
+                            parameter, renderer)
+            for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            for hasil in future.result():
+                yield hasil
+
+def proses_batch_direktori(path, workers=None, chunksize=1, simpan=False,
+                           folder_output="hasil_pengolahan"):
+    """
+    Memproses seluruh pasangan dari manifest/direktori dan mencetak progres
+
+    Returns:
+        dict: {nama_pasangan: stats} untuk semua pasangan yang berhasil
+    """
+    pasangan = baca_manifest(path)
+    print(f"🔄 Batch: {len(pasangan)} pasangan, workers={workers or os.cpu_count()}, chunksize={chunksize}")
+
+    semua_stats = {}
+    for i, hasil in enumerate(jalankan_batch(pasangan, workers=workers, chunksize=chunksize,
+                                            simpan=simpan, folder_output=folder_output), 1):
+        if 'error' in hasil:
+            print(f"  ❌ [{i}/{len(pasangan)}] {hasil['nama']}: {hasil['error']}")
+        else:
+            semua_stats[hasil['nama']] = hasil['stats']
+            print(f"  ✅ [{i}/{len(pasangan)}] {hasil['nama']}")
+
+    print(f"✅ Batch selesai! {len(semua_stats)}/{len(pasangan)} pasangan berhasil")
+    return semua_stats
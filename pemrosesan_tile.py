@@ -0,0 +1,159 @@
+"""
+Module untuk Pemrosesan Bertile (Tiled Processing)
+Berisi executor operasi pengurangan dan boolean per tile untuk gambar
+yang lebih besar dari RAM (np.memmap / file .npy)
+"""
+
+import cv2
+import numpy as np
+from statistik_citra import hitung_histogram, statistik_dari_histogram, hitung_nonzero
+from operasi_boolean import statistik_biner_dari_jumlah
+
+OPERASI_PENGURANGAN = ('absolut', 'konstanta')
+OPERASI_BOOLEAN = ('and', 'or', 'xor', 'not')
+
+NAMA_BOOLEAN = {
+    'and': ("A AND B", 'Irisan (∩)'),
+    'or': ("A OR B", 'Gabungan (∪)'),
+    'xor': ("A XOR B", 'Selisih Simetris (⊕)'),
+    'not': ("NOT A", 'Komplemen (¬)')
+}
+
+def buka_input_memmap(path, shape=None):
+    """
+    Membuka gambar uint8 sebagai memmap read-only tanpa memuat ke RAM
+
+    Args:
+        path: Path file .npy atau file raw uint8
+        shape: Ukuran (tinggi, lebar), wajib untuk file raw
+
+    Returns:
+        np.memmap: Gambar yang dipetakan ke memori
+    """
+    if str(path).endswith('.npy'):
+        return np.load(path, mmap_mode='r')
+    if shape is None:
+        raise ValueError("Shape wajib diisi untuk file raw")
+    return np.memmap(path, dtype=np.uint8, mode='r', shape=tuple(shape))
+
+def buat_output_memmap(path, shape):
+    """
+    Membuat file .npy output yang dipetakan ke memori
+
+    Args:
+        path: Path file .npy output
+        shape: Ukuran (tinggi, lebar)
+
+    Returns:
+        np.memmap: Buffer output yang dapat ditulis
+    """
+    return np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8, shape=tuple(shape))
+
+def proses_bertile(img1, img2, operasi, out, tinggi_tile=512,
+                   konstanta=100, threshold=127):
+    """
+    Menjalankan operasi pengurangan/boolean per tile baris ke buffer output
+
+    Tile berupa pita baris sehingga setiap tile kontigu di memmap. Memori
+    puncak dibatasi oleh ukuran tile (beberapa buffer tinggi_tile x lebar),
+    bukan ukuran gambar. Statistik digabung secara eksak dengan menjumlahkan
+    histogram (pengurangan) atau jumlah pixel putih (boolean) tiap tile.
+
+    Args:
+        img1, img2: Array/memmap uint8 (img2 diabaikan untuk 'not')
+        operasi: 'absolut', 'konstanta', 'and', 'or', 'xor', atau 'not'
+        out: Array/memmap uint8 untuk hasil, ukuran sama dengan img1
+        tinggi_tile: Jumlah baris per tile (default: 512)
+        konstanta: Konstanta untuk operasi 'konstanta', 0-255 (default: 100)
+        threshold: Threshold binarisasi untuk operasi boolean (default: 127)
+
+    Returns:
+        tuple: (out, statistik_dict)
+    """
+    try:
+        if operasi not in OPERASI_PENGURANGAN + OPERASI_BOOLEAN:
+            raise ValueError(f"Operasi tidak dikenal: {operasi}")
+        if operasi != 'not' and (img2 is None or img1.shape != img2.shape):
+            raise ValueError("Ukuran gambar harus sama")
+        if out.shape != img1.shape or out.dtype != np.uint8:
+            raise ValueError("Buffer out harus uint8 dengan ukuran yang sama")
+        if operasi == 'konstanta' and not 0 <= konstanta <= 255:
+            raise ValueError("Konstanta bertile harus 0-255")
+
+        tinggi, lebar = img1.shape
+
+        # Buffer kerja dipakai ulang untuk semua tile
+        kerja1 = np.empty((tinggi_tile, lebar), dtype=np.uint8)
+        kerja2 = np.empty((tinggi_tile, lebar), dtype=np.uint8)
+
+        hist = np.zeros(256, dtype=np.int64)
+        white_pixels = 0
+
+        for awal in range(0, tinggi, tinggi_tile):
+            akhir = min(awal + tinggi_tile, tinggi)
+            n = akhir - awal
+
+            # Tampilan ndarray biasa atas memmap (tanpa salinan)
+            t1 = np.asarray(img1[awal:akhir])
+            t2 = np.asarray(img2[awal:akhir]) if operasi != 'not' else None
+            t_out = np.asarray(out[awal:akhir])
+            b1, b2 = kerja1[:n], kerja2[:n]
+
+            if operasi == 'absolut':
+                cv2.absdiff(t1, t2, dst=t_out)
+
+            elif operasi == 'konstanta':
+                # (A - B) + K dengan aritmatika uint8 jenuh
+                cv2.subtract(t1, t2, dst=t_out)
+                cv2.add(t_out, int(konstanta), dst=t_out)
+                cv2.subtract(t2, t1, dst=b1)
+                cv2.subtract(t_out, b1, dst=t_out)
+
+            elif operasi == 'not':
+                cv2.threshold(t1, threshold, 255, cv2.THRESH_BINARY_INV, dst=t_out)
+
+            else:
+                cv2.threshold(t1, threshold, 255, cv2.THRESH_BINARY, dst=b1)
+                cv2.threshold(t2, threshold, 255, cv2.THRESH_BINARY, dst=b2)
+                if operasi == 'and':
+                    cv2.bitwise_and(b1, b2, dst=t_out)
+                elif operasi == 'or':
+                    cv2.bitwise_or(b1, b2, dst=t_out)
+                else:
+                    cv2.bitwise_xor(b1, b2, dst=t_out)
+
+            if operasi in OPERASI_PENGURANGAN:
+                hist += hitung_histogram(t_out)
+            else:
+                white_pixels += hitung_nonzero(t_out)
+
+        if hasattr(out, 'flush'):
+            out.flush()
+
+        # Gabungkan statistik semua tile
+        if operasi in OPERASI_BOOLEAN:
+            nama, logika = NAMA_BOOLEAN[operasi]
+            stats = statistik_biner_dari_jumlah(white_pixels, img1.shape, nama, threshold)
+            stats['Logika'] = logika
+        else:
+            st = statistik_dari_histogram(hist)
+            stats = {
+                'Mean': st['mean'],
+                'Std Dev': st['std'],
+                'Max': st['max'],
+                'Min': st['min'],
+                'Total Pixels': st['total']
+            }
+            if operasi == 'absolut':
+                stats['Pixels >0'] = st['nonzero']
+                stats['Persen Diff'] = (st['nonzero'] / st['total']) * 100
+            else:
+                stats['Konstanta'] = konstanta
+                stats['Range'] = f"[{st['min']}, {st['max']}]"
+        stats['Tile'] = f'{tinggi_tile} baris x {-(-tinggi // tinggi_tile)}'
+
+        return out, stats
+
+    except Exception as e:
+        print(f"❌ Error pemrosesan bertile ({operasi}): {e}")
+        return None, None
@@ -0,0 +1,193 @@
+"""
+Module untuk Statistik Citra
+Berisi mesin statistik satu lintasan (single-pass) yang dipakai bersama
+oleh semua modul operasi
+"""
+
+import cv2
+import numpy as np
+
+# cv2.calcHist menghitung dalam float32 yang hanya presisi hingga 2^24,
+# jadi gambar besar dihitung per blok baris lalu diakumulasi dalam int64
+MAKS_PIXEL_PER_BLOK = 1 << 24
+
+NILAI_BIN = np.arange(256, dtype=np.int64)
+
+def hitung_histogram(image):
+    """
+    Menghitung histogram 256-bin gambar uint8 dalam satu lintasan
+
+    Args:
+        image: Array numpy gambar uint8
+
+    Returns:
+        np.ndarray: Histogram int64 dengan panjang 256
+    """
+    if image.dtype != np.uint8:
+        raise ValueError("Histogram cepat hanya untuk gambar uint8")
+
+    # calcHist butuh array 2D yang kontigu
+    if image.ndim != 2:
+        image = image.reshape(image.shape[0], -1)
+    image = np.ascontiguousarray(image)
+
+    hist = np.zeros(256, dtype=np.int64)
+    if image.size == 0:
+        return hist
+
+    baris_per_blok = max(1, MAKS_PIXEL_PER_BLOK // max(1, image.shape[1]))
+    for awal in range(0, image.shape[0], baris_per_blok):
+        blok = image[awal:awal + baris_per_blok]
+        hist_blok = cv2.calcHist([blok], [0], None, [256], [0, 256])
+        hist += hist_blok.ravel().astype(np.int64)
+
+    return hist
+
+def statistik_dari_histogram(hist):
+    """
+    Menurunkan mean, std, min, max dan nonzero dari histogram 256-bin
+
+    Semua jumlah dihitung sebagai integer eksak sehingga hasil histogram
+    dari beberapa tile dapat dijumlahkan tanpa kehilangan presisi.
+
+    Args:
+        hist: Histogram int64 dengan panjang 256
+
+    Returns:
+        dict: mean, std, min, max, nonzero, total, histogram
+    """
+    total = int(hist.sum())
+    if total == 0:
+        return {
+            'mean': 0.0, 'std': 0.0, 'min': 0, 'max': 0,
+            'nonzero': 0, 'total': 0, 'histogram': hist
+        }
+
+    jumlah = int(np.dot(hist, NILAI_BIN))
+    jumlah_kuadrat = int(np.dot(hist, NILAI_BIN * NILAI_BIN))
+
+    # Var = (n*Σx² - (Σx)²) / n² dihitung dengan integer Python (eksak)
+    varians = (total * jumlah_kuadrat - jumlah * jumlah) / (total * total)
+
+    terisi = np.flatnonzero(hist)
+    return {
+        'mean': jumlah / total,
+        'std': float(np.sqrt(max(varians, 0.0))),
+        'min': int(terisi[0]),
+        'max': int(terisi[-1]),
+        'nonzero': total - int(hist[0]),
+        'total': total,
+        'histogram': hist
+    }
+
+def hitung_statistik_satu_lintasan(image):
+    """
+    Menghitung mean, std, min, max, nonzero dan histogram sekaligus
+
+    Gambar uint8 hanya dibaca satu kali (via histogram). Tipe data lain
+    memakai reduksi NumPy biasa sebagai fallback; min/max tetap int untuk
+    tipe integer (dan bool) seperti int(np.max(...)) sebelumnya.
+
+    Args:
+        image: Array numpy gambar
+
+    Returns:
+        dict: mean, std, min, max, nonzero, total, histogram (None untuk non-uint8)
+    """
+    if image.dtype == np.uint8:
+        return statistik_dari_histogram(hitung_histogram(image))
+
+    ubah = int if image.dtype.kind in 'biu' else float
+    return {
+        'mean': float(np.mean(image)),
+        'std': float(np.std(image)),
+        'min': ubah(image.min()),
+        'max': ubah(image.max()),
+        'nonzero': int(np.count_nonzero(image)),
+        'total': int(image.size),
+        'histogram': None
+    }
+
+def jumlah_di_atas_threshold(hist, thresholds):
+    """
+    Menghitung jumlah pixel > threshold untuk banyak threshold sekaligus
+    
+    Sama dengan hitung_nonzero(cv2.threshold(img, t, 255, THRESH_BINARY))
+    untuk setiap t, tetapi hanya memakai histogram: O(256) untuk semua
+    threshold, tanpa membaca gambar lagi.
+    
+    Args:
+        hist: Histogram int64 dengan panjang 256
+        thresholds: Iterable nilai threshold
+        
+    Returns:
+        np.ndarray: Jumlah pixel int64 per threshold
+    """
+    # atas[i] = jumlah pixel dengan nilai > i
+    atas = int(hist.sum()) - np.cumsum(hist)
+    
+    # Pixel bernilai integer sehingga x > t ekuivalen dengan x > floor(t)
+    index = np.floor(np.asarray(list(thresholds), dtype=np.float64))
+    jumlah = atas[np.clip(index, 0, 255).astype(np.intp)]
+    return np.where(index < 0, int(hist.sum()), jumlah)
+
+def hitung_nonzero(image):
+    """
+    Menghitung jumlah pixel bukan nol (misalnya pixel putih gambar biner)
+
+    Args:
+        image: Array numpy gambar
+
+    Returns:
+        int: Jumlah pixel bukan nol
+    """
+    if image.dtype == np.uint8 and image.ndim == 2:
+        return int(cv2.countNonZero(image))
+    return int(np.count_nonzero(image))
+
+def hitung_histogram_batch(stack):
+    """
+    Menghitung histogram 256-bin untuk setiap gambar dalam stack (N, H, W)
+
+    Args:
+        stack: Array numpy uint8 berbentuk (N, H, W)
+
+    Returns:
+        np.ndarray: Histogram int64 berbentuk (N, 256)
+    """
+    hists = np.empty((stack.shape[0], 256), dtype=np.int64)
+    for i in range(stack.shape[0]):
+        hists[i] = hitung_histogram(stack[i])
+    return hists
+
+def statistik_dari_histogram_batch(hists):
+    """
+    Versi tervektorisasi statistik_dari_histogram untuk banyak histogram
+
+    Args:
+        hists: Histogram int64 berbentuk (N, 256)
+
+    Returns:
+        dict: Array mean, std, min, max, nonzero, total dengan panjang N
+    """
+    total = hists.sum(axis=1)
+    pembagi = np.maximum(total, 1)
+    mean = hists @ NILAI_BIN / pembagi
+
+    # Varians terpusat lebih stabil daripada E[x²]-E[x]² dalam float64
+    deviasi = NILAI_BIN[None, :] - mean[:, None]
+    std = np.sqrt((hists * deviasi * deviasi).sum(axis=1) / pembagi)
+
+    terisi = hists > 0
+    ada = terisi.any(axis=1)
+    minimum = np.where(ada, terisi.argmax(axis=1), 0)
+    maksimum = np.where(ada, 255 - terisi[:, ::-1].argmax(axis=1), 0)
+
+    return {
+        'mean': mean,
+        'std': std,
+        'min': minimum,
+        'max': maksimum,
+        'nonzero': total - hists[:, 0],
+        'total': total
+    }